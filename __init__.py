@@ -1,10 +1,35 @@
-from .data.loader import load_startup_data
-from .preprocessing.preprocessor import preprocess_series
-from .models.llmtime import get_llmtime_predictions
-from .models.arima import find_best_arima_params, evaluate_arima_model
-from .models.sarima import find_best_sarima_params, evaluate_sarima_model
-from .models.exponential_smoothing import evaluate_exponential_smoothing
-from .visualization.plotter import plot_predictions, plot_acf_pacf
-from .utils.metrics import calculate_metrics
-
-__version__ = "0.1.0" 
\ No newline at end of file
+import importlib
+
+__version__ = "0.1.0"
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access, so ``import startup_ecosystem_forecasting`` (and every
+# worker process that unpickles one of its functions) does not pay for
+# statsmodels, scikit-learn, openai or matplotlib until they are used.
+_LAZY_ATTRIBUTES = {
+    'load_startup_data': '.data.loader',
+    'preprocess_series': '.preprocessing.preprocessor',
+    'get_llmtime_predictions': '.models.llmtime',
+    'find_best_arima_params': '.models.arima',
+    'evaluate_arima_model': '.models.arima',
+    'find_best_sarima_params': '.models.sarima',
+    'evaluate_sarima_model': '.models.sarima',
+    'evaluate_exponential_smoothing': '.models.exponential_smoothing',
+    'plot_predictions': '.visualization.plotter',
+    'plot_acf_pacf': '.visualization.plotter',
+    'calculate_metrics': '.utils.metrics',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,74 @@
+"""Compare batched Holt-Winters fitting against per-series statsmodels fits.
+
+Usage: python -m startup_ecosystem_forecasting.benchmarks.bench_holt_winters --series 200
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from ..models.holt_winters import BatchHoltWinters, initial_states
+
+
+def synthetic_panel(n_series, length, seasonal_period, seed=0):
+    """Trending, seasonal random-walk series shaped (series, time)."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(length)
+    slopes = rng.uniform(-0.5, 0.5, (n_series, 1))
+    pattern = rng.normal(0, 2, (n_series, seasonal_period))
+    seasonal = pattern[:, t % seasonal_period]
+    noise = np.cumsum(rng.normal(0, 0.5, (n_series, length)), axis=1)
+    return 100 + slopes * t + seasonal + noise
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--series', type=int, default=100)
+    parser.add_argument('--length', type=int, default=200)
+    parser.add_argument('--seasonal-period', type=int, default=4)
+    parser.add_argument('--horizon', type=int, default=12)
+    args = parser.parse_args()
+
+    m = args.seasonal_period
+    Y = synthetic_panel(args.series, args.length, m)
+    level, trend, seasons = initial_states(Y, m)
+
+    start = time.perf_counter()
+    batch = BatchHoltWinters(m).fit(Y)
+    batch_forecasts = batch.forecast(args.horizon)
+    batch_seconds = time.perf_counter() - start
+
+    models = [
+        ExponentialSmoothing(
+            y, seasonal_periods=m, trend='add', seasonal='add',
+            initialization_method='known', initial_level=level[i],
+            initial_trend=trend[i], initial_seasonal=seasons[i]
+        )
+        for i, y in enumerate(Y)
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        start = time.perf_counter()
+        sse = np.array([model.fit().sse for model in models])
+        statsmodels_seconds = time.perf_counter() - start
+
+        # Same parameters through statsmodels: forecasts should agree to rounding
+        max_gap = max(
+            np.abs(model.fit(smoothing_level=batch.alpha[i], smoothing_trend=batch.beta[i],
+                             smoothing_seasonal=batch.gamma[i], optimized=False)
+                   .forecast(args.horizon) - batch_forecasts[i]).max()
+            for i, model in enumerate(models)
+        )
+
+    print(f"series={args.series} length={args.length} seasonal_period={m}")
+    print(f"statsmodels: {1000 * statsmodels_seconds / len(Y):.2f} ms/series")
+    print(f"batched:     {1000 * batch_seconds / len(Y):.2f} ms/series")
+    print(f"SSE ratio batched/statsmodels: median {np.median(batch.sse / sse):.4f}, "
+          f"max {np.max(batch.sse / sse):.4f}")
+    print(f"max forecast gap at equal parameters: {max_gap:.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Measure package import and CLI start-up time, and fail when they exceed a budget.
+
+Usage: python -m startup_ecosystem_forecasting.benchmarks.bench_import_time --budget 1.0
+
+Each target is imported in a fresh interpreter (the best of ``--repeat``
+runs counts). Besides the time budget, the lightweight targets must not pull
+in any of the heavy optional dependencies; the exit status is non-zero if
+any check fails, so the script can gate CI.
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+PACKAGE = __package__.rsplit('.', 1)[0]
+HEAVY_MODULES = ('statsmodels', 'sklearn', 'scipy', 'openai', 'matplotlib', 'seaborn',
+                 'yfinance')
+
+# target name -> statement to time; all of them should stay light
+TARGETS = {
+    'package': f"import {PACKAGE}",
+    'calculate_metrics': f"from {PACKAGE} import calculate_metrics",
+    'cli': f"from {PACKAGE}.cli import build_parser; build_parser()",
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds,
+                  'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement, repeat=3):
+    """Best wall time of ``statement`` in fresh interpreters, and the heavy modules it loaded."""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(statement=statement,
+                                                                     heavy=HEAVY_MODULES)],
+                                capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return min(run['seconds'] for run in runs), runs[0]['heavy']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget', type=float, default=1.0, help="seconds allowed per target")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    failed = False
+    for name, statement in TARGETS.items():
+        seconds, heavy = measure(statement, args.repeat)
+        problems = []
+        if seconds > args.budget:
+            problems.append(f"over budget ({args.budget:.2f}s)")
+        if heavy:
+            problems.append(f"imports {', '.join(heavy)}")
+        failed = failed or bool(problems)
+        print(f"{name:<20} {seconds:7.3f}s  {'; '.join(problems) or 'ok'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
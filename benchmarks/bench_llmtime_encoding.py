@@ -0,0 +1,47 @@
+"""Compare LLMTime serialisation schemes by prompt size and round-trip error.
+
+Usage: python -m startup_ecosystem_forecasting.benchmarks.bench_llmtime_encoding --window 60
+
+Token counts come from ``tiktoken`` when installed, otherwise from the
+offline estimate in ``count_tokens``. Latency is estimated from the token
+counts with per-token prefill and decode times.
+"""
+import argparse
+
+import numpy as np
+
+from ..preprocessing.encoding import SCHEMES, ValueEncoder, count_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--window', type=int, default=60)
+    parser.add_argument('--horizon', type=int, default=40)
+    parser.add_argument('--precision', type=int, default=3)
+    parser.add_argument('--prefill-ms-per-token', type=float, default=0.2)
+    parser.add_argument('--decode-ms-per-token', type=float, default=20.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    walk = np.cumsum(rng.normal(0, 1, args.window + args.horizon))
+    values = (walk - walk.min()) / (walk.max() - walk.min())
+    history, future = values[:args.window], values[args.window:]
+
+    print(f"window={args.window} horizon={args.horizon} precision={args.precision}")
+    print(f"{'scheme':<10}{'tokens/value':>14}{'prompt':>9}{'answer':>9}{'est. ms':>10}"
+          f"{'max error':>12}")
+    for scheme in SCHEMES:
+        encoder = ValueEncoder(scheme, args.precision)
+        prompt_tokens = count_tokens(encoder.encode(history))
+        answer = encoder.encode(future)
+        answer_tokens = count_tokens(answer)
+        latency = (prompt_tokens * args.prefill_ms_per_token
+                   + answer_tokens * args.decode_ms_per_token)
+        error = np.abs(np.array(encoder.decode(answer)) - future).max()
+        print(f"{scheme:<10}{prompt_tokens / args.window:>14.2f}{prompt_tokens:>9}"
+              f"{answer_tokens:>9}{latency:>10.0f}{error:>12.1e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""Time and memory benchmarks for the model search, evaluation and LLMTime stages.
+
+Usage:
+    python -m startup_ecosystem_forecasting.benchmarks.suite --output before.json
+    python -m startup_ecosystem_forecasting.benchmarks.suite --output after.json --compare before.json
+
+Each benchmark runs on synthetic weekly series; wall time is the median and
+minimum over ``--repeat`` runs per series and peak memory comes from a
+separate run under ``tracemalloc``. LLMTime uses the deterministic
+in-process mock backend, so no network access is needed.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from ..evaluation.splits import split_series
+from ..models.arima import evaluate_arima_model, find_best_arima_params
+from ..models.exponential_smoothing import evaluate_exponential_smoothing
+from ..models.llm_backends import InProcessBackend
+from ..models.llmtime import optimize_llmtime_parameters
+from ..models.sarima import evaluate_sarima_model, find_best_sarima_params
+from ..preprocessing.preprocessor import preprocess_series
+from .bench_holt_winters import synthetic_panel
+
+
+def synthetic_weekly_series(n_series, length, seasonal_period=4, seed=0):
+    """Trending, seasonal random walks as weekly Series."""
+    index = pd.date_range('2015-01-04', periods=length, freq='W')
+    return [pd.Series(row, index=index)
+            for row in synthetic_panel(n_series, length, seasonal_period, seed=seed)]
+
+
+def _llmtime(series):
+    train, test = split_series(series, 0.8)
+    with contextlib.redirect_stdout(io.StringIO()):
+        optimize_llmtime_parameters(train, test, backend=InProcessBackend())
+
+
+BENCHMARKS = {
+    'preprocess_series': lambda series: preprocess_series(series, verbose=False),
+    'find_best_arima_params': lambda series: find_best_arima_params(series),
+    'find_best_arima_params_stepwise': lambda series: find_best_arima_params(series,
+                                                                             method='stepwise'),
+    'find_best_sarima_params': lambda series: find_best_sarima_params(series),
+    'evaluate_arima_model': lambda series: evaluate_arima_model(series, (1, 1, 1)),
+    'evaluate_arima_model_update': lambda series: evaluate_arima_model(series, (1, 1, 1),
+                                                                       method='update'),
+    'evaluate_sarima_model': lambda series: evaluate_sarima_model(series, (1, 0, 1),
+                                                                  (1, 0, 1, 4)),
+    'evaluate_exponential_smoothing': lambda series: evaluate_exponential_smoothing(series),
+    'optimize_llmtime_parameters': _llmtime,
+}
+
+
+def _revision():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_benchmark(func, series_list, repeat=3):
+    """Wall time (median and min per series over ``repeat`` runs) and peak traced memory."""
+    seconds = []
+    for _ in range(repeat):
+        for series in series_list:
+            start = time.perf_counter()
+            func(series)
+            seconds.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func(series_list[0])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'seconds_median': float(np.median(seconds)),
+        'seconds_min': float(np.min(seconds)),
+        'peak_mb': peak / 2 ** 20,
+    }
+
+
+def run_suite(n_series=3, length=156, repeat=3, names=None, seed=0):
+    """Run the selected benchmarks and return a JSON-serialisable results dict."""
+    series_list = synthetic_weekly_series(n_series, length, seed=seed)
+    results = {}
+    for name in names or BENCHMARKS:
+        print(f"Running {name}...", file=sys.stderr)
+        try:
+            results[name] = run_benchmark(BENCHMARKS[name], series_list, repeat=repeat)
+        except Exception as e:
+            results[name] = {'error': f"{type(e).__name__}: {e}"}
+    return {
+        'meta': {
+            'revision': _revision(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'n_series': n_series,
+            'length': length,
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def compare_results(baseline, current, threshold=0.1):
+    """Table of median time and peak memory ratios (current / baseline) per benchmark.
+
+    ``flag`` marks benchmarks that got slower (``'slower'``) or faster
+    (``'faster'``) by more than ``threshold``.
+    """
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None or 'error' in base or 'error' in result:
+            continue
+        time_ratio = result['seconds_median'] / base['seconds_median']
+        flag = ''
+        if time_ratio > 1 + threshold:
+            flag = 'slower'
+        elif time_ratio < 1 - threshold:
+            flag = 'faster'
+        rows.append({
+            'benchmark': name,
+            'baseline_s': base['seconds_median'],
+            'current_s': result['seconds_median'],
+            'time_ratio': time_ratio,
+            'memory_ratio': result['peak_mb'] / base['peak_mb'] if base['peak_mb'] else np.nan,
+            'flag': flag,
+        })
+    return pd.DataFrame(rows, columns=['benchmark', 'baseline_s', 'current_s', 'time_ratio',
+                                       'memory_ratio', 'flag'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--series', type=int, default=3)
+    parser.add_argument('--length', type=int, default=156)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), default=None)
+    parser.add_argument('--output', help="write results as JSON to this path")
+    parser.add_argument('--compare', help="baseline JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = run_suite(args.series, args.length, args.repeat, names=args.only, seed=args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2)
+
+    table = pd.DataFrame.from_dict(results['results'], orient='index')
+    print(f"revision={results['meta']['revision']} series={args.series} length={args.length}")
+    print(table.to_string(float_format=lambda x: f"{x:.4f}"))
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as fh:
+            baseline = json.load(fh)
+        print(f"\nCompared with revision {baseline['meta'].get('revision')}:")
+        print(compare_results(baseline, results, args.threshold)
+              .to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,299 @@
+"""Command-line interface: ``startup-forecast {load,fit,evaluate,llmtime}``.
+
+Heavy dependencies (statsmodels, scikit-learn, openai, matplotlib) are
+imported inside the subcommand that needs them, so ``--help`` and argument
+errors return immediately.
+"""
+import argparse
+import sys
+from contextlib import contextmanager
+
+MODELS = {
+    'arima': 'ARIMA',
+    'sarima': 'SARIMA',
+    'ets': 'Exponential Smoothing',
+    'llmtime': 'LLMTime',
+}
+COLORS = {'ARIMA': 'blue', 'SARIMA': 'green', 'Exponential Smoothing': 'orange',
+          'LLMTime': 'purple'}
+
+
+def _load_series(args):
+    """Weekly series selected by the data options."""
+    from .data.cache import DataCache
+    from .data.loader import load_startup_data
+    from .data.sources import FileSource
+
+    source = FileSource(args.file) if args.file else None
+    cache = DataCache(args.cache) if args.cache else None
+    series = load_startup_data(args.ticker, start=args.start, end=args.end, source=source,
+                               cache=cache, offline=args.offline)
+    return series.dropna()
+
+
+def _prepare(args, series=None):
+    """Preprocessed series (loaded unless given) and its train/test split."""
+    from .evaluation.splits import split_series
+    from .preprocessing.preprocessor import preprocess_series
+
+    if series is None:
+        series = _load_series(args)
+    series, _ = preprocess_series(series, verbose=args.verbose)
+    train, test = split_series(series, args.train_size)
+    return series, train, test
+
+
+def _registry(args):
+    if args.no_registry:
+        return None
+    from .models.registry import ModelRegistry
+    return ModelRegistry()
+
+
+def _find_orders(model, train, args, registry):
+    """Best orders for ``'ARIMA'`` or ``'SARIMA'``, through the registry unless disabled."""
+    from .models.arima import find_best_arima_params
+    from .models.sarima import find_best_sarima_params
+    from .pipeline.batch import PREPROCESSING
+
+    kwargs = {'method': args.method, 'n_jobs': args.n_jobs}
+    if model == 'SARIMA':
+        kwargs['seasonal_period'] = args.seasonal_period
+    if registry is not None:
+        # Same key as run_batch: both search on preprocess_series output
+        return registry.find_orders(model, train, preprocessing=PREPROCESSING, **kwargs)
+    if model == 'ARIMA':
+        return find_best_arima_params(train, **kwargs)
+    return find_best_sarima_params(train, **kwargs)
+
+
+def _llmtime(train, test, args):
+    """``optimize_llmtime_parameters`` with the backend chosen on the command line."""
+    from .models.llm_backends import get_backend
+    from .models.llm_cache import LLMResponseCache
+    from .models.llmtime import optimize_llmtime_parameters
+
+    backend_kwargs = {}
+    if args.llm_model:
+        backend_kwargs['model'] = args.llm_model
+    if args.backend == 'local' and args.base_url:
+        backend_kwargs['base_url'] = args.base_url
+    if args.backend == 'mock':
+        backend_kwargs['encoding'] = args.encoding
+    cache = LLMResponseCache() if args.llm_cache else None
+    return optimize_llmtime_parameters(train, test, cache=cache, encoding=args.encoding,
+                                       stream=args.stream,
+                                       backend=get_backend(args.backend, **backend_kwargs),
+                                       return_interval=True)
+
+
+@contextmanager
+def _plots(args):
+    """Yield ``plot(kind, *args, **kwargs)`` for a kind of ``PLOTS``.
+
+    Plots go to the ``--report`` file or directory (rendered in the
+    background), are shown on screen without one, and are skipped with
+    ``--no-plots``.
+    """
+    if args.no_plots:
+        yield lambda kind, *plot_args, **kwargs: None
+        return
+    from .visualization.plotter import PLOTS, render, setup_plotting_style
+
+    setup_plotting_style()
+    if not args.report:
+        yield lambda kind, *plot_args, **kwargs: render(*PLOTS[kind], *plot_args, **kwargs)
+        return
+    from .visualization.report import PlotReport
+
+    with PlotReport(args.report) as report:
+        yield report.submit
+    print(f"\nPlots written to {args.report}")
+
+
+def cmd_load(args):
+    """Download (or read from cache) the series and print its trend analysis."""
+    from .data.loader import analyze_startup_trends
+
+    series = _load_series(args)
+    analyze_startup_trends(series)
+    if args.output:
+        series.to_csv(args.output)
+        print(f"\nSaved {len(series)} weekly values to {args.output}")
+
+
+def cmd_fit(args):
+    """Search the best orders of a model family on the training split."""
+    _, train, _ = _prepare(args)
+    result = _find_orders(MODELS[args.model], train, args, _registry(args))
+    if args.model == 'sarima':
+        order, seasonal_order = result
+        print(f"Best SARIMA order: {order}, seasonal order: {seasonal_order}")
+    else:
+        print(f"Best ARIMA order: {result}")
+
+
+def cmd_evaluate(args):
+    """Walk-forward evaluation of several models, with a metrics table and plots."""
+    import numpy as np
+    import pandas as pd
+
+    from .data.loader import analyze_startup_trends
+    from .models.arima import evaluate_arima_model
+    from .models.exponential_smoothing import evaluate_exponential_smoothing
+    from .models.sarima import evaluate_sarima_model
+    from .utils.metrics import calculate_metrics, compare_models
+
+    with _plots(args) as plot:
+        raw = _load_series(args)
+        trends = analyze_startup_trends(raw)
+        plot('quarterly_growth', trends['quarterly_growth'])
+
+        series, train, test = _prepare(args, raw)
+        print(f"\nTraining size: {len(train)}, Test size: {len(test)}")
+        plot('predictions', train, test, None, 'Preprocessed Data', 'gray')
+        plot('acf_pacf', train)
+
+        registry = _registry(args)
+        predictions = {}
+        for key in args.models:
+            model = MODELS[key]
+            print(f"\nEvaluating {model}...")
+            try:
+                if model == 'ARIMA':
+                    order = _find_orders(model, train, args, registry)
+                    preds, _ = evaluate_arima_model(series, order, train_size=args.train_size,
+                                                    method=args.walk_forward)
+                elif model == 'SARIMA':
+                    order, seasonal_order = _find_orders(model, train, args, registry)
+                    preds, _ = evaluate_sarima_model(series, order, seasonal_order,
+                                                     train_size=args.train_size,
+                                                     method=args.walk_forward)
+                elif model == 'Exponential Smoothing':
+                    preds, _ = evaluate_exponential_smoothing(
+                        series, seasonal_period=args.seasonal_period, train_size=args.train_size
+                    )
+                else:
+                    preds, _, _, interval = _llmtime(train, test, args)
+                    if preds is None:
+                        raise ValueError("no valid LLMTime predictions")
+                    plot('predictions', train, test, preds, model, COLORS[model],
+                         uncertainty=interval)
+            except Exception as e:
+                print(f"Error evaluating {model}: {e}")
+                continue
+            predictions[model] = np.asarray(preds, dtype=float)
+
+        if not predictions:
+            print("No model could be evaluated")
+            return 1
+
+        metrics = [{'Model': model, **calculate_metrics(test.values, preds)}
+                   for model, preds in predictions.items()]
+        metrics_df = pd.DataFrame(metrics)
+        print("\nPerformance Metrics:")
+        print(metrics_df.to_string(index=False))
+        print("\nBest Models:")
+        for metric, (model, value) in compare_models(metrics).items():
+            print(f"{metric}: {model} ({value:.4f})")
+
+        plot('metrics_comparison', metrics_df)
+        plot('predictions_comparison', train, test, predictions, colors=COLORS)
+    return 0
+
+
+def cmd_llmtime(args):
+    """Tune LLMTime on the training split, score it on the test split and plot its interval."""
+    _, train, test = _prepare(args)
+    preds, params, error, interval = _llmtime(train, test, args)
+    if preds is None:
+        print("No valid LLMTime predictions")
+        return 1
+    print(f"Best LLMTime RMSE: {error:.4f}")
+    print(f"Best parameters: {params}")
+    if interval is not None:
+        lower, upper = interval
+        print(f"Mean {len(lower)}-step interval width: {float((upper - lower).mean()):.4f}")
+    with _plots(args) as plot:
+        plot('predictions', train, test, preds, 'LLMTime', COLORS['LLMTime'], uncertainty=interval)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='startup-forecast',
+                                     description="Forecast startup ecosystem indicators.")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="record spans and counters and save a Chrome trace to PATH")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    data = argparse.ArgumentParser(add_help=False)
+    data.add_argument('--ticker', default='^IXIC')
+    data.add_argument('--start', default='2020-01-01')
+    data.add_argument('--end', default='2024-01-01')
+    data.add_argument('--file', help="read daily closes from a CSV/Parquet file instead of Yahoo")
+    data.add_argument('--cache', metavar='DIR', help="local data cache directory")
+    data.add_argument('--offline', action='store_true', help="serve data from the cache only")
+
+    modelling = argparse.ArgumentParser(add_help=False)
+    modelling.add_argument('--train-size', type=float, default=0.8)
+    modelling.add_argument('--seasonal-period', type=int, default=4)
+    modelling.add_argument('--method', choices=['grid', 'stepwise'], default='grid',
+                           help="order search strategy")
+    modelling.add_argument('--n-jobs', type=int, default=1)
+    modelling.add_argument('--no-registry', action='store_true',
+                           help="always search orders instead of reusing stored ones")
+    modelling.add_argument('--verbose', action='store_true')
+
+    llm = argparse.ArgumentParser(add_help=False)
+    llm.add_argument('--backend', choices=['openai', 'local', 'mock'], default='openai')
+    llm.add_argument('--llm-model', help="model name passed to the backend")
+    llm.add_argument('--base-url', help="endpoint of the local backend")
+    llm.add_argument('--encoding', choices=['decimal', 'integer', 'spaced'], default='decimal')
+    llm.add_argument('--stream', action='store_true', help="stream completions")
+    llm.add_argument('--llm-cache', action='store_true', help="cache LLM responses on disk")
+
+    plotting = argparse.ArgumentParser(add_help=False)
+    plotting.add_argument('--report', help="write plots to a .pdf file or a directory")
+    plotting.add_argument('--no-plots', action='store_true',
+                          help="draw no plots (by default they are shown on screen)")
+
+    load = subparsers.add_parser('load', parents=[data], help=cmd_load.__doc__)
+    load.add_argument('--output', help="save the weekly series as CSV")
+    load.set_defaults(func=cmd_load)
+
+    fit = subparsers.add_parser('fit', parents=[data, modelling], help=cmd_fit.__doc__)
+    fit.add_argument('--model', choices=['arima', 'sarima'], default='arima')
+    fit.set_defaults(func=cmd_fit)
+
+    evaluate = subparsers.add_parser('evaluate', parents=[data, modelling, llm, plotting],
+                                     help=cmd_evaluate.__doc__)
+    evaluate.add_argument('--models', nargs='+', choices=list(MODELS),
+                          default=['arima', 'sarima', 'ets'])
+    evaluate.add_argument('--walk-forward', choices=['refit', 'update'], default='refit')
+    evaluate.set_defaults(func=cmd_evaluate)
+
+    llmtime = subparsers.add_parser('llmtime', parents=[data, modelling, llm, plotting],
+                                    help=cmd_llmtime.__doc__)
+    llmtime.set_defaults(func=cmd_llmtime)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    if args.trace:
+        from .utils.instrumentation import enable
+
+        tracer = enable()
+    try:
+        return args.func(args) or 0
+    finally:
+        if args.trace:
+            tracer.save_chrome_trace(args.trace)
+            print(tracer.summary().to_string(index=False), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+from ..utils.instrumentation import timed
+
+SUMMARY_COLUMNS = ['start', 'end', 'observations', 'total_growth', 'avg_weekly_change',
+                   'weekly_std', 'volatility', 'max_drawdown', 'current_drawdown']
+
+
+class PanelTrends:
+    """Trend statistics of every series in a panel.
+
+    ``summary`` has one row per series with the columns of
+    ``SUMMARY_COLUMNS`` (growth, changes, volatility and drawdowns in
+    percent; ``volatility`` is the latest rolling value). The time-indexed
+    frames have one column per series: ``quarterly_growth`` (quarter-on-quarter
+    growth of quarterly means, None without a DatetimeIndex),
+    ``rolling_volatility`` (rolling std of weekly changes) and ``drawdown``
+    (distance below the running maximum).
+    """
+
+    def __init__(self, summary, quarterly_growth, rolling_volatility, drawdown):
+        self.summary = summary
+        self.quarterly_growth = quarterly_growth
+        self.rolling_volatility = rolling_volatility
+        self.drawdown = drawdown
+
+    def for_series(self, name):
+        """Statistics of one series as a dict, with its time-indexed results as Series."""
+        result = self.summary.loc[name].to_dict()
+        result['quarterly_growth'] = (self.quarterly_growth[name].dropna()
+                                      if self.quarterly_growth is not None else None)
+        result['rolling_volatility'] = self.rolling_volatility[name]
+        result['drawdown'] = self.drawdown[name]
+        return result
+
+
+def _as_panel(data, index=None, columns=None):
+    """Float (time x series) buffer plus its index and column labels."""
+    if isinstance(data, pd.Series):
+        data = data.to_frame(name=data.name if data.name is not None else 0)
+    if isinstance(data, pd.DataFrame):
+        index = data.index if index is None else index
+        columns = data.columns if columns is None else columns
+    X = np.array(data, dtype=np.float64)
+    X = X.reshape(len(X), -1)
+    index = pd.RangeIndex(len(X)) if index is None else pd.Index(index)
+    columns = pd.RangeIndex(X.shape[1]) if columns is None else pd.Index(columns)
+    return X, index, columns
+
+
+def _nan_mean_std(R):
+    """Column mean and sample std ignoring NaNs, without empty-slice warnings."""
+    valid = ~np.isnan(R)
+    n = valid.sum(axis=0)
+    filled = np.where(valid, R, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = filled.sum(axis=0) / n
+        squares = np.where(valid, R - mean, 0.0) ** 2
+        std = np.sqrt(squares.sum(axis=0) / (n - 1))
+    return np.where(n > 0, mean, np.nan), np.where(n > 1, std, np.nan)
+
+
+def _rolling_std(R, window):
+    """Rolling sample std over ``window`` rows; NaN unless the whole window is present.
+
+    Uses windowed differences of cumulative sums (of values centred on their
+    column mean, to limit cancellation), so the cost does not grow with the
+    window.
+    """
+    out = np.full_like(R, np.nan)
+    if window < 2 or len(R) < window:
+        return out
+    missing = np.isnan(R)
+    centred = np.where(missing, 0.0, R - _nan_mean_std(R)[0])
+    zeros = np.zeros((1, R.shape[1]))
+    s1 = np.concatenate([zeros, np.cumsum(centred, axis=0)])
+    s2 = np.concatenate([zeros, np.cumsum(centred ** 2, axis=0)])
+    gaps = np.concatenate([zeros, np.cumsum(missing, axis=0)])
+    w1 = s1[window:] - s1[:-window]
+    w2 = s2[window:] - s2[:-window]
+    var = np.maximum(w2 - w1 ** 2 / window, 0.0) / (window - 1)
+    complete = (gaps[window:] - gaps[:-window]) == 0
+    out[window - 1:] = np.where(complete, np.sqrt(var), np.nan)
+    return out
+
+
+@timed()
+def analyze_panel(data, index=None, columns=None, volatility_window=13):
+    """Growth, weekly change, volatility and drawdown statistics for every series at once.
+
+    ``data`` is a wide DataFrame (one column per series), a Series, or a
+    (time x series) array with optional ``index``/``columns`` labels. Leading
+    and trailing NaNs (e.g. before a listing) are allowed: growth runs from
+    each series' first to last valid value. All statistics are computed
+    column-wise in a single pass over the panel. Returns a ``PanelTrends``.
+    """
+    X, index, columns = _as_panel(data, index, columns)
+    n_rows, n_series = X.shape
+    if n_rows == 0:
+        raise ValueError("Cannot analyze an empty panel")
+    cols = np.arange(n_series)
+
+    valid = ~np.isnan(X)
+    observations = valid.sum(axis=0)
+    first = valid.argmax(axis=0)
+    last = n_rows - 1 - valid[::-1].argmax(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        total_growth = (X[last, cols] - X[first, cols]) / X[first, cols] * 100
+        changes = X[1:] / X[:-1] - 1
+    avg_change, change_std = _nan_mean_std(changes)
+
+    volatility = np.full_like(X, np.nan)
+    volatility[1:] = _rolling_std(changes, volatility_window) * 100
+    latest_volatility = volatility[last, cols]
+
+    running_max = np.fmax.accumulate(X, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdown = (X / running_max - 1) * 100
+    has_values = observations > 0
+    max_drawdown = np.full(n_series, np.nan)
+    if has_values.any():
+        max_drawdown[has_values] = np.nanmin(drawdown[:, has_values], axis=0)
+
+    summary = pd.DataFrame({
+        'start': index[first].where(has_values),
+        'end': index[last].where(has_values),
+        'observations': observations,
+        'total_growth': np.where(has_values, total_growth, np.nan),
+        'avg_weekly_change': avg_change * 100,
+        'weekly_std': change_std * 100,
+        'volatility': np.where(has_values, latest_volatility, np.nan),
+        'max_drawdown': max_drawdown,
+        'current_drawdown': np.where(has_values, drawdown[last, cols], np.nan),
+    }, index=columns, columns=SUMMARY_COLUMNS)
+
+    quarterly_growth = None
+    if isinstance(index, pd.DatetimeIndex):
+        quarterly = pd.DataFrame(X, index=index, columns=columns).resample('QE').mean()
+        q = quarterly.to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = (q[1:] / q[:-1] - 1) * 100
+        quarterly_growth = pd.DataFrame(growth, index=quarterly.index[1:], columns=columns)
+
+    return PanelTrends(
+        summary,
+        quarterly_growth,
+        pd.DataFrame(volatility, index=index, columns=columns),
+        pd.DataFrame(drawdown, index=index, columns=columns),
+    )
@@ -0,0 +1,130 @@
+import json
+import os
+import re
+
+import pandas as pd
+
+from ..utils.instrumentation import count, span
+
+DEFAULT_DATA_CACHE_DIR = os.path.join(
+    os.path.expanduser('~'), '.cache', 'startup_ecosystem_forecasting', 'data'
+)
+
+
+def _today():
+    return pd.Timestamp.now().normalize()
+
+
+def resample_weekly(daily):
+    """Weekly means of daily closes, with gaps forward-filled."""
+    # Convert to weekly data to reduce noise
+    weekly = daily.resample('W').mean()
+
+    # Ensure no missing values
+    return weekly.ffill()
+
+
+class DataCache:
+    """Local Parquet store of raw daily closes and their weekly resamples.
+
+    Each ticker gets a directory holding ``daily.parquet``, a ``coverage.json``
+    recording the ``[start, end)`` range already downloaded (never past
+    today's date or the last close received, whichever is later, so bars
+    that are not yet published are fetched on a later run), and one
+    ``weekly_<start>_<end>.parquet`` per requested range. Requests outside the
+    covered range only fetch the missing dates from the source. With
+    ``offline=True`` nothing is fetched and only cached data is served.
+    """
+
+    def __init__(self, root=DEFAULT_DATA_CACHE_DIR):
+        self.root = root
+
+    def _ticker_dir(self, ticker):
+        path = os.path.join(self.root, re.sub(r'[^A-Za-z0-9._-]', '_', ticker))
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _read_coverage(self, ticker):
+        path = os.path.join(self._ticker_dir(ticker), 'coverage.json')
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as fh:
+            coverage = json.load(fh)
+        return pd.Timestamp(coverage['start']), pd.Timestamp(coverage['end'])
+
+    def _write_coverage(self, ticker, start, end):
+        path = os.path.join(self._ticker_dir(ticker), 'coverage.json')
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump({'start': start.isoformat(), 'end': end.isoformat()}, fh)
+
+    def read_daily(self, ticker):
+        """All cached daily closes for ``ticker``, or None if nothing is cached."""
+        path = os.path.join(self._ticker_dir(ticker), 'daily.parquet')
+        if not os.path.exists(path):
+            return None
+        return pd.read_parquet(path)['close'].rename(ticker)
+
+    def get_daily(self, ticker, start, end, source=None, offline=False):
+        """Daily closes for ``ticker`` in ``[start, end)``, fetching only missing dates."""
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        coverage = self._read_coverage(ticker)
+        daily = self.read_daily(ticker)
+
+        if coverage is None:
+            missing = [(start, end)]
+        else:
+            covered_start, covered_end = coverage
+            missing = []
+            if start < covered_start:
+                missing.append((start, covered_start))
+            if end > covered_end:
+                missing.append((covered_end, end))
+
+        if missing and offline:
+            if daily is None:
+                raise FileNotFoundError(f"No cached data for {ticker} and offline mode is enabled")
+            print(f"Warning: cache for {ticker} does not cover {start.date()} to {end.date()}; "
+                  "serving cached dates only (offline mode)")
+        elif missing:
+            if source is None:
+                raise ValueError("A data source is required to fill the cache")
+            parts = [daily] if daily is not None else []
+            with span('data_cache.fetch', ticker=ticker, ranges=len(missing)):
+                parts += [source.fetch(ticker, lo, hi) for lo, hi in missing]
+            count('data_fetches', len(missing))
+            daily = pd.concat(parts).astype(float).rename(ticker)
+            daily = daily[~daily.index.duplicated(keep='last')].sort_index()
+            daily.to_frame(name='close').to_parquet(
+                os.path.join(self._ticker_dir(ticker), 'daily.parquet')
+            )
+            # Dates after today (or after the last close received) may not be
+            # published yet, so they are left uncovered and fetched again later
+            last_date = daily.index.max() if len(daily) else start
+            covered_end = min(end, max(_today(), last_date + pd.Timedelta(days=1)))
+            if coverage is None:
+                self._write_coverage(ticker, start, covered_end)
+            else:
+                self._write_coverage(ticker, min(start, coverage[0]),
+                                     max(covered_end, coverage[1]))
+
+        return daily[(daily.index >= start) & (daily.index < end)]
+
+    def _covers(self, ticker, start, end):
+        coverage = self._read_coverage(ticker)
+        return coverage is not None and coverage[0] <= start and end <= coverage[1]
+
+    def get_weekly(self, ticker, start, end, source=None, offline=False):
+        """Weekly resample of ``get_daily``, stored per fully covered range."""
+        directory = self._ticker_dir(ticker)
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        path = os.path.join(directory, f"weekly_{start.date()}_{end.date()}.parquet")
+        daily_path = os.path.join(directory, 'daily.parquet')
+
+        if (self._covers(ticker, start, end) and os.path.exists(path)
+                and os.path.getmtime(path) >= os.path.getmtime(daily_path)):
+            return pd.read_parquet(path)['close'].rename(ticker).asfreq('W')
+
+        weekly = resample_weekly(self.get_daily(ticker, start, end, source=source, offline=offline))
+        if self._covers(ticker, start, end):
+            weekly.to_frame(name='close').to_parquet(path)
+        return weekly
@@ -1,47 +1,67 @@
-import yfinance as yf
 import pandas as pd
 
-def load_startup_data():
-    """Load and prepare startup funding data."""
+from .analytics import analyze_panel
+from .cache import resample_weekly
+from .sources import YahooSource
+from ..utils.instrumentation import timed
+
+@timed()
+def load_startup_data(ticker='^IXIC', start='2020-01-01', end='2024-01-01', source=None,
+                      cache=None, offline=False):
+    """Load and prepare startup funding data.
+
+    ``source`` supplies daily closes (Yahoo Finance by default; a ``FileSource``
+    for local fixtures). With a ``DataCache``, daily bars and weekly resamples
+    are served from disk and only missing dates are fetched; ``offline=True``
+    serves from the cache alone.
+    """
     # Using NASDAQ Composite as a proxy for tech startup ecosystem health
-    nasdaq = yf.download('^IXIC', start='2020-01-01', end='2024-01-01')
-    series = nasdaq['Close']
-    
-    # Convert to weekly data to reduce noise
-    series = series.resample('W').mean()
+    source = source or YahooSource()
+    if cache is not None:
+        return cache.get_weekly(ticker, start, end, source=source, offline=offline)
+    if offline:
+        raise ValueError("Offline mode requires a DataCache")
     
-    # Ensure no missing values
-    series = series.ffill()
+    series = source.fetch(ticker, start, end)
     
-    return series
+    # Convert to weekly data to reduce noise; ensure no missing values
+    return resample_weekly(series)
 
-def analyze_startup_trends(series):
-    """Analyze startup ecosystem trends with enhanced visualizations."""
-    print("\nStartup Ecosystem Analysis:")
-    print(f"Time Period: {series.index[0].date()} to {series.index[-1].date()}")
+@timed()
+def load_panel_data(tickers, start='2020-01-01', end='2024-01-01', source=None, cache=None,
+                    offline=False):
+    """Load weekly closes for many tickers as a wide DataFrame (one column per ticker)."""
+    series = [load_startup_data(ticker, start=start, end=end, source=source, cache=cache,
+                                offline=offline)
+              for ticker in tickers]
     
-    # Calculate growth
-    total_growth = (series.iloc[-1] - series.iloc[0]) / series.iloc[0] * 100
-    print(f"Total Growth: {float(total_growth):.2f}%")
+    # Align on a common weekly index, leaving pre-listing history empty
+    return pd.concat(series, axis=1)
+
+def analyze_startup_trends(series, verbose=True, volatility_window=13):
+    """Analyze startup ecosystem trends of one series.
+
+    Returns total growth, average weekly change and its std, quarterly growth
+    rates, rolling volatility and drawdowns (all in percent) as computed by
+    ``analyze_panel``; with ``verbose`` a short report is printed as well.
+    Use ``analyze_panel`` directly for many series at once.
+    """
+    if isinstance(series, pd.DataFrame):
+        if series.shape[1] != 1:
+            raise ValueError("analyze_startup_trends takes one series; use analyze_panel for panels")
+        series = series.iloc[:, 0]
     
-    # Calculate weekly changes
-    weekly_changes = series.pct_change().dropna()
-    if isinstance(weekly_changes, pd.DataFrame):
-        weekly_changes = weekly_changes.iloc[:, 0]
-    avg_weekly_change = weekly_changes.mean() * 100
-    weekly_std = weekly_changes.std() * 100
-    print(f"Average Weekly Change: {float(avg_weekly_change):.2f}%")
-    print(f"Volatility (Weekly Std): {float(weekly_std):.2f}%")
+    trends = analyze_panel(series, volatility_window=volatility_window)
+    result = trends.for_series(trends.summary.index[0])
     
-    # Calculate quarterly growth
-    quarterly = series.resample('QE').mean()
-    quarterly_growth = quarterly.pct_change().dropna() * 100
-    print("\nQuarterly Growth Rates:")
-    print(quarterly_growth)
+    if verbose:
+        print("\nStartup Ecosystem Analysis:")
+        print(f"Time Period: {result['start'].date()} to {result['end'].date()}")
+        print(f"Total Growth: {result['total_growth']:.2f}%")
+        print(f"Average Weekly Change: {result['avg_weekly_change']:.2f}%")
+        print(f"Volatility (Weekly Std): {result['weekly_std']:.2f}%")
+        print(f"Maximum Drawdown: {result['max_drawdown']:.2f}%")
+        print("\nQuarterly Growth Rates:")
+        print(result['quarterly_growth'])
     
-    return {
-        'total_growth': total_growth,
-        'avg_weekly_change': avg_weekly_change,
-        'weekly_std': weekly_std,
-        'quarterly_growth': quarterly_growth
-    } 
\ No newline at end of file
+    return result
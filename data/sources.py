@@ -0,0 +1,61 @@
+import pandas as pd
+
+
+def _as_close_series(frame, ticker, column='Close'):
+    """Reduce a bars DataFrame to a float Series of closes named after the ticker."""
+    close = frame[column]
+    if isinstance(close, pd.DataFrame):
+        close = close.iloc[:, 0]
+    close = close.astype(float).rename(ticker)
+    close.index = pd.DatetimeIndex(close.index).tz_localize(None)
+    close.index.name = 'Date'
+    return close.sort_index()
+
+
+class YahooSource:
+    """Daily closes downloaded from Yahoo Finance via ``yfinance``."""
+
+    def fetch(self, ticker, start, end):
+        """Daily closes for ``ticker`` in ``[start, end)``."""
+        import yfinance as yf
+
+        data = yf.download(ticker, start=start, end=end, progress=False)
+        if data.empty:
+            return pd.Series(dtype=float, name=ticker)
+        return _as_close_series(data, ticker)
+
+
+class FileSource:
+    """Daily closes read from a local CSV or Parquet file.
+
+    The file holds either one ticker (a date column or index plus a close
+    column) or several tickers in long format with a ``ticker_col`` column.
+    Intended for tests, CI and offline experiments.
+    """
+
+    def __init__(self, path, date_col='Date', close_col='Close', ticker_col=None):
+        self.path = str(path)
+        self.date_col = date_col
+        self.close_col = close_col
+        self.ticker_col = ticker_col
+        self._frame = None
+
+    def _load(self):
+        if self._frame is None:
+            if self.path.endswith('.parquet'):
+                frame = pd.read_parquet(self.path)
+            else:
+                frame = pd.read_csv(self.path)
+            if self.date_col in frame.columns:
+                frame = frame.set_index(self.date_col)
+            frame.index = pd.to_datetime(frame.index)
+            self._frame = frame
+        return self._frame
+
+    def fetch(self, ticker, start, end):
+        """Daily closes for ``ticker`` in ``[start, end)``."""
+        frame = self._load()
+        if self.ticker_col is not None:
+            frame = frame[frame[self.ticker_col] == ticker]
+        close = _as_close_series(frame, ticker, column=self.close_col)
+        return close[(close.index >= pd.Timestamp(start)) & (close.index < pd.Timestamp(end))]
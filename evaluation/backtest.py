@@ -0,0 +1,117 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from ..models.order_search import resolve_n_jobs
+from ..utils.instrumentation import TRACER, call_counted, merge_counted
+from ..utils.metrics import calculate_metrics_batch
+from ..utils.shared_memory import SharedArray
+from .splits import rolling_origins
+
+
+class BacktestResult:
+    """Array-backed store of rolling-origin forecasts.
+
+    ``predictions`` is shaped (models, origins, horizon) and NaN where a fit
+    failed; ``actuals`` is shaped (origins, horizon); ``splits`` holds the
+    ``(train_start, train_end, test_end)`` row of each origin. ``errors``
+    maps ``(model, origin index)`` to the failure message.
+    """
+
+    def __init__(self, model_names, splits, actuals, predictions, errors, index=None):
+        self.model_names = list(model_names)
+        self.splits = splits
+        self.actuals = actuals
+        self.predictions = predictions
+        self.errors = errors
+        self.index = index
+
+    @property
+    def origins(self):
+        """Forecast origins as positions, or as index labels when available."""
+        positions = self.splits[:, 1]
+        return positions if self.index is None else self.index[positions - 1]
+
+    def metrics(self):
+        """Metrics per model, pooled over every origin and horizon step."""
+        n_models = len(self.model_names)
+        scores = calculate_metrics_batch(self.actuals.reshape(-1),
+                                         self.predictions.reshape(n_models, -1))
+        return pd.DataFrame(scores, index=pd.Index(self.model_names, name='Model'))
+
+    def metrics_by_horizon(self, metric='RMSE'):
+        """One metric per model and horizon step, computed across origins."""
+        scores = calculate_metrics_batch(self.actuals.T[None], self.predictions.transpose(0, 2, 1))
+        return pd.DataFrame(scores[metric], index=pd.Index(self.model_names, name='Model'),
+                            columns=pd.RangeIndex(1, self.actuals.shape[1] + 1, name='horizon'))
+
+    def metrics_by_origin(self, metric='RMSE'):
+        """One metric per model and origin, computed across horizon steps."""
+        scores = calculate_metrics_batch(self.actuals[None], self.predictions)
+        return pd.DataFrame(scores[metric], index=pd.Index(self.model_names, name='Model'),
+                            columns=pd.Index(self.origins, name='origin'))
+
+
+def _forecast_task(forecaster, train, horizon):
+    """Run one (model, origin) forecast; failures come back as messages."""
+    try:
+        forecast = np.asarray(forecaster(train, horizon), dtype=float)
+        if forecast.shape != (horizon,):
+            raise ValueError(f"Expected {horizon} forecast values, got shape {forecast.shape}")
+        return forecast, None
+    except Exception as e:
+        return np.full(horizon, np.nan), f"{type(e).__name__}: {e}"
+
+
+def _forecast_shared_task(shared, horizon, task):
+    """Worker side of ``run_backtest``: forecast from a read-only view of the shared series."""
+    forecaster, start, end = task
+    train = shared.array[start:end]
+    train.flags.writeable = False
+    return _forecast_task(forecaster, train, horizon)
+
+
+def run_backtest(series, models, horizon=1, initial=None, step=1, n_origins=None,
+                 window='expanding', window_size=None, n_jobs=1):
+    """Evaluate several forecasters over the same rolling origins.
+
+    ``models`` maps a name to a picklable ``forecaster(train, horizon)``
+    returning ``horizon`` values, e.g. ``partial(forecast_arima, order=(1, 1, 1))``.
+    Split indices are computed once (see ``rolling_origins``) and shared by
+    every model; all (model, origin) fits are spread over ``n_jobs`` worker
+    processes, which read their training windows from one shared copy of the
+    series.
+    """
+    values = np.asarray(series, dtype=float)
+    splits = rolling_origins(len(values), horizon=horizon, initial=initial, step=step,
+                             n_origins=n_origins, window=window, window_size=window_size)
+    names = list(models)
+
+    tasks = [(models[name], start, end) for name in names for start, end, _ in splits]
+
+    workers = min(resolve_n_jobs(n_jobs), len(tasks))
+    if workers <= 1:
+        outcomes = [_forecast_task(forecaster, values[start:end], horizon)
+                    for forecaster, start, end in tasks]
+    else:
+        # Tasks carry the shared array's handle and split indices, not the data
+        chunksize = max(1, math.ceil(len(tasks) / (workers * 4)))
+        with SharedArray.from_array(values) as shared, \
+                ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = merge_counted(pool.map(call_counted, repeat(TRACER.enabled),
+                                              repeat(_forecast_shared_task), repeat(shared),
+                                              repeat(horizon), tasks, chunksize=chunksize))
+
+    predictions = np.stack([forecast for forecast, _ in outcomes])
+    predictions = predictions.reshape(len(names), len(splits), horizon)
+    errors = {}
+    for k, (_, error) in enumerate(outcomes):
+        if error is not None:
+            errors[(names[k // len(splits)], k % len(splits))] = error
+
+    actuals = np.stack([values[end:test_end] for _, end, test_end in splits])
+    index = series.index if isinstance(series, (pd.Series, pd.DataFrame)) else None
+    return BacktestResult(names, splits, actuals, predictions, errors, index=index)
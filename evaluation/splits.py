@@ -0,0 +1,45 @@
+import numpy as np
+
+
+def split_index(n, train_size=0.8):
+    """Index of the first test observation for a fractional train/test split."""
+    return int(n * train_size)
+
+
+def split_series(series, train_size=0.8):
+    """Split a series into train and test parts at ``split_index``."""
+    cut = split_index(len(series), train_size)
+    return series[:cut], series[cut:]
+
+
+def rolling_origins(n, horizon=1, initial=None, step=1, n_origins=None, window='expanding',
+                    window_size=None):
+    """Train/test boundaries for rolling-origin evaluation.
+
+    Returns an int array with one ``(train_start, train_end, test_end)`` row
+    per forecast origin; ``train_end`` is the origin itself. The first origin
+    is ``initial`` (default: 80% of the series) and later ones advance by
+    ``step``. ``window='expanding'`` always trains from the start of the
+    series; ``window='sliding'`` keeps the last ``window_size`` observations
+    (default: ``initial``). With ``n_origins`` only the last that many
+    origins are kept.
+    """
+    if initial is None:
+        initial = split_index(n)
+    if window_size is None:
+        window_size = initial
+
+    origins = np.arange(initial, n - horizon + 1, step)
+    if n_origins is not None:
+        origins = origins[len(origins) - min(n_origins, len(origins)):]
+    if len(origins) == 0:
+        raise ValueError(f"No forecast origins fit a series of length {n} with horizon {horizon}")
+
+    if window == 'expanding':
+        starts = np.zeros_like(origins)
+    elif window == 'sliding':
+        starts = np.maximum(origins - window_size, 0)
+    else:
+        raise ValueError(f"Unknown window type: {window}")
+
+    return np.column_stack([starts, origins, origins + horizon])
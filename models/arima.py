@@ -1,52 +1,116 @@
+from functools import partial
+
 import numpy as np
 import pandas as pd
 from statsmodels.tsa.arima.model import ARIMA
 
-def find_best_arima_params(series, max_p=3, max_d=2, max_q=3):
-    """Find optimal ARIMA parameters using AIC."""
-    best_aic = float("inf")
-    best_order = None
-    
-    for p in range(max_p + 1):
-        for d in range(max_d + 1):
-            for q in range(max_q + 1):
-                try:
-                    model = ARIMA(series, order=(p,d,q))
-                    results = model.fit()
-                    aic = results.aic
-                    
-                    if aic < best_aic:
-                        best_aic = aic
-                        best_order = (p,d,q)
-                        
-                except:
-                    continue
-                    
+from ..evaluation.splits import split_series
+from .order_search import (
+    fit_candidates,
+    select_best,
+    candidates_table,
+    ndiffs,
+    neighbouring_orders,
+    stepwise_search,
+)
+from .walk_forward import walk_forward_forecast, compare_walk_forward
+from ..utils.instrumentation import timed
+
+def _fit_arima_candidate(series, order):
+    """Fit a single ARIMA candidate and report its AIC or why it failed."""
+    try:
+        results = ARIMA(series, order=order).fit()
+        return {'order': order, 'aic': results.aic, 'error': None}
+    except Exception as e:
+        return {'order': order, 'aic': None, 'error': f"{type(e).__name__}: {e}"}
+
+@timed()
+def find_best_arima_params(series, max_p=3, max_d=2, max_q=3, n_jobs=1, executor=None,
+                           return_table=False, method='grid', max_fits=94, initial_orders=None):
+    """Find optimal ARIMA parameters using AIC.
+
+    ``method='grid'`` fits every order up to the given maxima. ``method='stepwise'``
+    fixes ``d`` with repeated ADF tests and then walks to neighbouring (p, q)
+    orders while AIC improves, fitting at most ``max_fits`` models;
+    ``initial_orders`` (e.g. from a similar series) are tried first.
+
+    Candidate orders are fitted on ``n_jobs`` worker processes (or on the given
+    ``executor``); ties are broken in search order, as in a serial search. With
+    ``return_table=True`` a DataFrame of every fitted candidate's AIC and failure
+    reason is returned alongside the best order; its ``attrs`` record how many
+    models were fitted out of the full grid.
+    """
+    grid_size = (max_p + 1) * (max_d + 1) * (max_q + 1)
+
+    if method == 'grid':
+        candidates = [(p, d, q)
+                      for p in range(max_p + 1)
+                      for d in range(max_d + 1)
+                      for q in range(max_q + 1)]
+        records = fit_candidates(_fit_arima_candidate, series, candidates,
+                                 n_jobs=n_jobs, executor=executor)
+        best = select_best(records)
+    elif method == 'stepwise':
+        d = ndiffs(series, max_d=max_d)
+        initial = [tuple(order) for order in initial_orders or []]
+        initial += [(min(p, max_p), d, min(q, max_q)) for p, q in ((2, 2), (0, 0), (1, 0), (0, 1))]
+
+        def neighbours(order):
+            p, d, q = order
+            return [(p, d, q) for p, q in neighbouring_orders((p, q), (max_p, max_q))]
+
+        best, records = stepwise_search(_fit_arima_candidate, series, initial, neighbours,
+                                        max_fits=max_fits, n_jobs=n_jobs, executor=executor)
+    else:
+        raise ValueError(f"Unknown order search method: {method}")
+
+    best_order = best['order'] if best is not None else None
+
+    if return_table:
+        return best_order, candidates_table(records, grid_size=grid_size)
     return best_order
 
-def evaluate_arima_model(series, order, train_size=0.8):
-    """Evaluate ARIMA model using walk-forward validation."""
-    train_size = int(len(series) * train_size)
-    train, test = series[:train_size], series[train_size:]
-    
-    history = [x for x in train]
-    predictions = []
-    
-    for t in range(len(test)):
-        model = ARIMA(history, order=order)
-        model_fit = model.fit()
-        yhat = model_fit.forecast()[0]
-        predictions.append(yhat)
-        history.append(test[t])
-        
-    return predictions, test.values
-
-def fit_arima_model(train, order):
-    """Fit ARIMA model and return fitted model."""
+@timed()
+def evaluate_arima_model(series, order, train_size=0.8, method='refit', refit_every=None,
+                         drift_threshold=None, compare=False):
+    """Evaluate ARIMA model using walk-forward validation.
+
+    ``method='refit'`` re-estimates the model at every step; ``method='update'``
+    fits once and filters new observations in, re-estimating every
+    ``refit_every`` steps or on drift (see ``walk_forward_forecast``). With
+    ``compare=True`` a third value compares the chosen settings against exact
+    refitting.
+    """
+    train, test = split_series(series, train_size)
+    build_model = partial(ARIMA, order=order)
+
+    predictions, _ = walk_forward_forecast(build_model, train, test, method=method,
+                                           refit_every=refit_every,
+                                           drift_threshold=drift_threshold)
+
+    if compare:
+        comparison = compare_walk_forward(build_model, train, test, refit_every=refit_every,
+                                          drift_threshold=drift_threshold)
+        return list(predictions), test.values, comparison
+    return list(predictions), test.values
+
+def fit_arima_model(train, order, start_params=None):
+    """Fit ARIMA model and return fitted model.
+
+    ``start_params`` (e.g. from a similar series) seed the optimiser when
+    their length matches the model's parameter count.
+    """
     try:
         model = ARIMA(train, order=order)
-        model_fit = model.fit()
+        if start_params is not None and len(start_params) != len(model.param_names):
+            start_params = None
+        model_fit = model.fit(start_params=start_params)
         return model_fit
     except Exception as e:
         print(f"Error fitting ARIMA model: {e}")
-        return None 
\ No newline at end of file
+        return None
+
+def forecast_arima(train, horizon, order):
+    """Fit ARIMA on ``train`` and forecast ``horizon`` steps (backtest forecaster)."""
+    model_fit = ARIMA(np.asarray(train, dtype=float), order=order).fit()
+    return model_fit.forecast(horizon)
@@ -0,0 +1,161 @@
+import json
+from functools import partial
+
+import numpy as np
+from statsmodels.tsa.stattools import acf
+
+from ..evaluation.backtest import run_backtest
+from .arima import find_best_arima_params, fit_arima_model, forecast_arima
+from .exponential_smoothing import forecast_exponential_smoothing
+from .order_search import ndiffs
+from .sarima import find_best_sarima_params, fit_sarima_model, forecast_sarima
+from .seasonality import detect_seasonal_period
+
+FAMILIES = ('ARIMA', 'SARIMA', 'Holt-Winters')
+
+
+def series_features(series, seasonal_period, n_lags=4):
+    """Scale-free features used to match a series with previously fitted ones."""
+    values = np.asarray(series, dtype=float)
+    d = ndiffs(values)
+    differenced = np.diff(values, n=d) if d else values
+    correlations = acf(differenced, nlags=n_lags, fft=True)[1:]
+    return {
+        'seasonal_period': int(seasonal_period),
+        'd': int(d),
+        'acf': [float(c) for c in correlations],
+        'log_length': float(np.log(len(values))),
+    }
+
+
+class WarmStartStore:
+    """Fitted configurations of earlier series, used to warm-start similar ones.
+
+    A new series is matched to the stored series with the same seasonal
+    period and differencing order whose autocorrelations and length are
+    closest. Its model family and orders are tried first in the stepwise
+    order search, and its fitted parameters seed the final optimiser.
+    """
+
+    def __init__(self, records=None):
+        self.records = list(records or [])
+
+    def add(self, features, config):
+        """Remember the configuration fitted for a series with ``features``."""
+        self.records.append({'features': features, 'config': config})
+
+    def suggest(self, features):
+        """Configuration of the most similar stored series, or None."""
+        best, best_distance = None, np.inf
+        target = np.array(features['acf'] + [features['log_length']])
+        for record in self.records:
+            stored = record['features']
+            if (stored['seasonal_period'], stored['d']) != (features['seasonal_period'], features['d']):
+                continue
+            distance = np.linalg.norm(np.array(stored['acf'] + [stored['log_length']]) - target)
+            if distance < best_distance:
+                best, best_distance = record['config'], distance
+        return best
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.records, fh)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as fh:
+            return cls(json.load(fh))
+
+
+def _as_orders(config):
+    """Stored orders as tuples (JSON round trips turn them into lists)."""
+    order = tuple(config['order']) if config.get('order') is not None else None
+    seasonal_order = (tuple(config['seasonal_order'])
+                      if config.get('seasonal_order') is not None else None)
+    return order, seasonal_order
+
+
+def auto_configure(series, store=None, seasonal_period='auto', max_period=52, horizon=4,
+                   n_origins=3, families=FAMILIES, n_jobs=1):
+    """Choose the seasonal period, model family and orders for one series.
+
+    The seasonal period is detected from the periodogram/ACF unless given.
+    ARIMA and (for seasonal series) SARIMA orders come from stepwise searches
+    on the data before the holdout, warm-started from the most similar series
+    in ``store``; the families are then compared by rolling-origin RMSE over
+    the last ``n_origins`` forecasts of ``horizon`` steps, together with
+    Holt-Winters (Holt's linear trend method when no seasonality is found).
+    The chosen model is fitted on the full series and, if a store is given,
+    recorded in it. Raises ``ValueError`` if every candidate fails.
+
+    Returns a config dict with ``family``, ``seasonal_period``, ``order``,
+    ``seasonal_order``, ``params``, the per-family ``rmse`` and whether a
+    ``warm_start`` was used.
+    """
+    values = np.asarray(series, dtype=float)
+    if seasonal_period == 'auto':
+        seasonal_period = detect_seasonal_period(values, max_period=max_period)
+    seasonal = seasonal_period > 1
+
+    features = series_features(values, seasonal_period)
+    warm = store.suggest(features) if store is not None else None
+    warm_order, warm_seasonal_order = _as_orders(warm) if warm else (None, None)
+
+    search_data = values[:len(values) - horizon - n_origins + 1]
+    models = {}
+    orders = {}
+    if 'ARIMA' in families:
+        order = find_best_arima_params(search_data, method='stepwise',
+                                       initial_orders=[warm_order] if warm_order else None)
+        if order is not None:
+            orders['ARIMA'] = (order, None)
+            models['ARIMA'] = partial(forecast_arima, order=order)
+    if seasonal and 'SARIMA' in families:
+        initial = None
+        if warm_order and warm_seasonal_order and warm_seasonal_order[3] == seasonal_period:
+            initial = [(warm_order, warm_seasonal_order)]
+        order, seasonal_order = find_best_sarima_params(search_data, seasonal_period,
+                                                        method='stepwise', initial_orders=initial)
+        if order is not None:
+            orders['SARIMA'] = (order, seasonal_order)
+            models['SARIMA'] = partial(forecast_sarima, order=order, seasonal_order=seasonal_order)
+    if 'Holt-Winters' in families:
+        # A period below 2 fits Holt's linear trend method (no seasonal component)
+        models['Holt-Winters'] = partial(forecast_exponential_smoothing,
+                                         seasonal_period=seasonal_period)
+    if not models:
+        raise ValueError("No candidate model family could be fitted")
+
+    result = run_backtest(values, models, horizon=horizon, n_origins=n_origins, n_jobs=n_jobs)
+    rmse = result.metrics()['RMSE']
+    if rmse.isna().all():
+        failures = '; '.join(f"{name} (origin {origin}): {error}"
+                             for (name, origin), error in result.errors.items())
+        raise ValueError(f"Every candidate model failed in the backtest: {failures}")
+    family = rmse.fillna(np.inf).idxmin()
+
+    order, seasonal_order = orders.get(family, (None, None))
+    warm_params = None
+    if warm and warm.get('family') == family and _as_orders(warm) == (order, seasonal_order):
+        warm_params = warm.get('params')
+
+    params = None
+    if family == 'ARIMA':
+        model_fit = fit_arima_model(values, order, start_params=warm_params)
+        params = model_fit.params.tolist() if model_fit is not None else None
+    elif family == 'SARIMA':
+        model_fit = fit_sarima_model(values, order, seasonal_order, start_params=warm_params)
+        params = model_fit.params.tolist() if model_fit is not None else None
+
+    config = {
+        'family': family,
+        'seasonal_period': int(seasonal_period),
+        'order': order,
+        'seasonal_order': seasonal_order,
+        'params': params,
+        'rmse': {name: float(value) for name, value in rmse.items()},
+        'warm_start': warm is not None,
+    }
+    if store is not None:
+        store.add(features, config)
+    return config
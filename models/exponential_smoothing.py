@@ -2,19 +2,36 @@ import numpy as np
 import pandas as pd
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 
-def evaluate_exponential_smoothing(series, seasonal_period=4, train_size=0.8):
-    """Evaluate Holt-Winters exponential smoothing."""
-    train_size = int(len(series) * train_size)
-    train, test = series[:train_size], series[train_size:]
-    
-    # Fit the model
-    model = ExponentialSmoothing(
+from ..evaluation.splits import split_series
+from .seasonality import resolve_seasonal_period
+from ..utils.instrumentation import count, timed
+
+def _build_model(train, seasonal_period, **kwargs):
+    """Additive Holt-Winters model; ``seasonal_period='auto'`` detects the period
+    and a period below 2 drops the seasonal component. ``kwargs`` (e.g. known
+    initial states) go to ``ExponentialSmoothing``."""
+    seasonal_period = resolve_seasonal_period(train, seasonal_period)
+    seasonal = 'add' if seasonal_period > 1 else None
+    return ExponentialSmoothing(
         train,
-        seasonal_periods=seasonal_period,
+        seasonal_periods=seasonal_period if seasonal else None,
         trend='add',
-        seasonal='add'
+        seasonal=seasonal,
+        **kwargs
     )
+
+@timed()
+def evaluate_exponential_smoothing(series, seasonal_period=4, train_size=0.8):
+    """Evaluate Holt-Winters exponential smoothing.
+
+    ``seasonal_period='auto'`` detects the period from the training data.
+    """
+    train, test = split_series(series, train_size)
+    
+    # Fit the model
+    model = _build_model(train, seasonal_period)
     model_fit = model.fit()
+    count('model_fits')
     
     # Make predictions
     predictions = model_fit.forecast(len(test))
@@ -24,14 +41,14 @@ def evaluate_exponential_smoothing(series, seasonal_period=4, train_size=0.8):
 def fit_exponential_smoothing(train, seasonal_period=4):
     """Fit Exponential Smoothing model and return fitted model."""
     try:
-        model = ExponentialSmoothing(
-            train,
-            seasonal_periods=seasonal_period,
-            trend='add',
-            seasonal='add'
-        )
+        model = _build_model(train, seasonal_period)
         model_fit = model.fit()
         return model_fit
     except Exception as e:
         print(f"Error fitting Exponential Smoothing model: {e}")
-        return None 
\ No newline at end of file
+        return None
+
+def forecast_exponential_smoothing(train, horizon, seasonal_period=4):
+    """Fit Holt-Winters on ``train`` and forecast ``horizon`` steps (backtest forecaster)."""
+    model = _build_model(np.asarray(train, dtype=float), seasonal_period)
+    return model.fit().forecast(horizon)
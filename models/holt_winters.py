@@ -0,0 +1,193 @@
+import numpy as np
+
+from ..evaluation.splits import split_index
+
+
+def initial_states(Y, seasonal_period):
+    """Simple initial level, trend and seasonal states for each row of ``Y``.
+
+    Follows statsmodels' simple initialisation (Hyndman & Athanasopoulos,
+    section 7.6): the level is the mean of the first cycle, the trend the mean
+    per-period change between the first two cycles and the seasonals the
+    first cycle's deviations from the level.
+    """
+    m = seasonal_period
+    if Y.shape[-1] < 2 * m:
+        raise ValueError("Holt-Winters needs at least two full seasonal cycles")
+    level = Y[..., :m].mean(axis=-1)
+    trend = ((Y[..., m:2 * m] - Y[..., :m]) / m).mean(axis=-1)
+    seasons = Y[..., :m] - level[..., None]
+    return level, trend, seasons
+
+
+def smooth(Y, alpha, beta, gamma, level, trend, seasons, start=0):
+    """Run the additive Holt-Winters recursion along the last axis of ``Y``.
+
+    Parameters and states broadcast against the leading axes of ``Y``.
+    ``seasons`` is a ring buffer (last axis of length m) holding the seasonal
+    state of time ``t`` at slot ``t % m``; it is updated in place, and
+    ``start`` is the time index of ``Y[..., 0]``. Returns the sum of squared
+    one-step errors, the final level and trend, and the seasonal value
+    overwritten at the last step.
+    """
+    m = seasons.shape[-1]
+    sse = np.zeros(seasons.shape[:-1])
+    replaced = None
+    for t in range(Y.shape[-1]):
+        y = Y[..., t]
+        slot = (start + t) % m
+        season = seasons[..., slot].copy()
+        previous = level + trend
+        error = y - (previous + season)
+        sse += error * error
+
+        new_level = alpha * (y - season) + (1 - alpha) * previous
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        seasons[..., slot] = gamma * (y - previous) + (1 - gamma) * season
+        level = new_level
+        replaced = season
+    return sse, level, trend, replaced
+
+
+def _unit_to_params(u):
+    """Map the unit cube onto the admissible region beta <= alpha, gamma <= 1 - alpha."""
+    alpha = u[..., 0]
+    return alpha, u[..., 1] * alpha, u[..., 2] * (1 - alpha)
+
+
+class BatchHoltWinters:
+    """Additive-trend, additive-seasonal Holt-Winters fitted on many series at once.
+
+    Series are the rows of a (series x time) array. The smoothing recursion
+    runs over all rows (and, while optimising, over many candidate parameter
+    sets) as NumPy array operations. Given the same parameters and initial
+    states, fitted values and forecasts match statsmodels'
+    ``ExponentialSmoothing(trend='add', seasonal='add')``.
+    """
+
+    def __init__(self, seasonal_period=4):
+        self.seasonal_period = seasonal_period
+
+    def _sse(self, Y, u):
+        """SSE of each row of ``Y`` under candidate unit parameters ``u`` (series, k, 3)."""
+        alpha, beta, gamma = _unit_to_params(u)
+        seasons = np.broadcast_to(self.initial_seasons[:, None, :],
+                                  u.shape[:2] + (self.seasonal_period,)).copy()
+        sse, _, _, _ = smooth(Y[:, None, :], alpha, beta, gamma,
+                              self.initial_level[:, None], self.initial_trend[:, None], seasons)
+        return np.where(np.isnan(sse), np.inf, sse)
+
+    def _optimise(self, Y, grid_points, n_iter):
+        """Batched coarse grid search followed by a batched pattern search."""
+        axis = (np.arange(grid_points) + 0.5) / grid_points
+        grid = np.stack(np.meshgrid(axis, axis, axis, indexing='ij'), axis=-1).reshape(-1, 3)
+        sse = self._sse(Y, np.broadcast_to(grid, (len(Y),) + grid.shape))
+        best = np.argmin(sse, axis=1)
+        u = grid[best]
+        best_sse = sse[np.arange(len(Y)), best]
+
+        directions = np.concatenate([np.eye(3), -np.eye(3)])
+        step = np.full(len(Y), 0.5 / grid_points)
+        for _ in range(n_iter):
+            candidates = np.clip(u[:, None, :] + step[:, None, None] * directions, 0.0, 1.0)
+            sse = self._sse(Y, candidates)
+            best = np.argmin(sse, axis=1)
+            candidate_sse = sse[np.arange(len(Y)), best]
+            improved = candidate_sse < best_sse
+            u[improved] = candidates[improved, best[improved]]
+            best_sse[improved] = candidate_sse[improved]
+            step[~improved] /= 2
+        return u
+
+    def fit(self, Y, alpha=None, beta=None, gamma=None, grid_points=8, n_iter=30):
+        """Fit every row of ``Y`` (a 1-D series is treated as a single row).
+
+        If ``alpha``, ``beta`` and ``gamma`` are all given they are used as
+        fixed parameters (scalars or one per series); otherwise they are
+        chosen to minimise the in-sample SSE of each series.
+        """
+        Y = np.atleast_2d(np.asarray(Y, dtype=float))
+        self.initial_level, self.initial_trend, self.initial_seasons = initial_states(
+            Y, self.seasonal_period
+        )
+
+        if alpha is None or beta is None or gamma is None:
+            alpha, beta, gamma = _unit_to_params(self._optimise(Y, grid_points, n_iter))
+        shape = (len(Y),)
+        self.alpha = np.broadcast_to(np.asarray(alpha, dtype=float), shape).copy()
+        self.beta = np.broadcast_to(np.asarray(beta, dtype=float), shape).copy()
+        self.gamma = np.broadcast_to(np.asarray(gamma, dtype=float), shape).copy()
+
+        self.seasons = self.initial_seasons.copy()
+        self.nobs = 0
+        self.sse = np.zeros(shape)
+        self.level = self.initial_level
+        self.trend = self.initial_trend
+        return self.update(Y)
+
+    def update(self, Y_new):
+        """Filter new observations (columns) in with the current parameters."""
+        Y_new = np.atleast_2d(np.asarray(Y_new, dtype=float))
+        if Y_new.shape[-1] == 0:
+            return self
+        sse, self.level, self.trend, self._replaced = smooth(
+            Y_new, self.alpha, self.beta, self.gamma, self.level, self.trend, self.seasons,
+            start=self.nobs
+        )
+        self.sse = self.sse + sse
+        self.nobs += Y_new.shape[-1]
+        return self
+
+    def forecast(self, horizon):
+        """Forecasts shaped (series, horizon).
+
+        Like statsmodels, the step that completes a seasonal cycle reuses the
+        seasonal state from before the final update.
+        """
+        m = self.seasonal_period
+        steps = np.arange(1, horizon + 1)
+        slots = (self.nobs - 1 + steps % m) % m
+        seasons = self.seasons[:, slots]
+        cycle_end = steps % m == 0
+        seasons[:, cycle_end] = self._replaced[:, None]
+        return self.level[:, None] + steps * self.trend[:, None] + seasons
+
+    def get_state(self):
+        """JSON-serialisable parameters and smoothing state of a fitted model."""
+        return {
+            'seasonal_period': self.seasonal_period,
+            'alpha': self.alpha.tolist(),
+            'beta': self.beta.tolist(),
+            'gamma': self.gamma.tolist(),
+            'level': self.level.tolist(),
+            'trend': self.trend.tolist(),
+            'seasons': self.seasons.tolist(),
+            'replaced': self._replaced.tolist(),
+            'sse': self.sse.tolist(),
+            'nobs': int(self.nobs),
+        }
+
+    def set_state(self, state):
+        """Restore ``get_state`` output; ``update`` and ``forecast`` continue from it."""
+        self.seasonal_period = state['seasonal_period']
+        for name in ('alpha', 'beta', 'gamma', 'level', 'trend', 'sse'):
+            setattr(self, name, np.asarray(state[name], dtype=float))
+        self.seasons = np.asarray(state['seasons'], dtype=float).reshape(len(self.level), -1)
+        self._replaced = np.asarray(state['replaced'], dtype=float)
+        self.nobs = state['nobs']
+        return self
+
+
+def evaluate_holt_winters_batch(panel, seasonal_period=4, train_size=0.8, **fit_kwargs):
+    """Batched counterpart of ``evaluate_exponential_smoothing`` for equal-length series.
+
+    ``panel`` is a (series x time) array or a wide DataFrame (one column per
+    series). Returns forecasts and actual test values, both (series, horizon).
+    """
+    values = np.asarray(panel, dtype=float)
+    if hasattr(panel, 'columns'):
+        values = values.T
+    values = np.atleast_2d(values)
+    cut = split_index(values.shape[-1], train_size)
+    model = BatchHoltWinters(seasonal_period).fit(values[:, :cut], **fit_kwargs)
+    return model.forecast(values.shape[-1] - cut), values[:, cut:]
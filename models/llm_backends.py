@@ -0,0 +1,295 @@
+import asyncio
+import inspect
+import os
+import re
+import time
+import types
+import zlib
+
+import numpy as np
+
+from ..preprocessing.encoding import ValueEncoder
+
+
+class _Completions:
+    def __init__(self, backend):
+        self._backend = backend
+
+    async def create(self, **request):
+        return await self._backend.create(**request)
+
+
+class LLMBackend:
+    """Chat-completion backend usable wherever an ``AsyncOpenAI`` client is expected.
+
+    Subclasses implement ``_create``; ``chat.completions.create`` adds
+    latency bookkeeping (``latencies`` holds the seconds each request took,
+    streams included) and, with ``max_batch``, splits requests for more than
+    ``max_batch`` samples into several smaller ones, sent concurrently
+    (streamed parts are also read concurrently and closed together).
+    """
+
+    model = None
+
+    def __init__(self, max_batch=None):
+        self.max_batch = max_batch
+        self.latencies = []
+        self.chat = types.SimpleNamespace(completions=_Completions(self))
+
+    async def _create(self, **request):
+        raise NotImplementedError
+
+    async def create(self, **request):
+        if self.model is not None:
+            request['model'] = self.model
+        start = time.perf_counter()
+        n = request.get('n', 1)
+        if self.max_batch is None or n <= self.max_batch:
+            response = await self._create(**request)
+        else:
+            sizes = [min(self.max_batch, n - offset) for offset in range(0, n, self.max_batch)]
+            parts = [dict(request, n=size) for size in sizes]
+            if request.get('stream'):
+                response = _MergedStream(await _open_streams(self._create, parts), sizes)
+            else:
+                responses = await asyncio.gather(*(self._create(**part) for part in parts))
+                response = types.SimpleNamespace(
+                    choices=[choice for r in responses for choice in r.choices]
+                )
+
+        if request.get('stream'):
+            return _TimedStream(response, start, self.latencies)
+        self.latencies.append(time.perf_counter() - start)
+        return response
+
+    def latency_stats(self):
+        """Count, mean, median and 95th percentile of request latencies in seconds."""
+        if not self.latencies:
+            return {'requests': 0, 'mean': None, 'p50': None, 'p95': None}
+        latencies = np.array(self.latencies)
+        return {
+            'requests': len(latencies),
+            'mean': float(latencies.mean()),
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+        }
+
+
+class _TimedStream:
+    """Wrap a response stream and record its latency when it ends or is closed."""
+
+    def __init__(self, stream, start, latencies):
+        self._stream = stream
+        self._start = start
+        self._latencies = latencies
+        self._recorded = False
+
+    def _record(self):
+        if not self._recorded:
+            self._latencies.append(time.perf_counter() - self._start)
+            self._recorded = True
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+        self._record()
+
+    async def close(self):
+        self._record()
+        await _close_stream(self._stream)
+
+
+async def _close_stream(stream):
+    """Close a response stream: ``close()`` on SDK streams, ``aclose()`` on async generators."""
+    close = getattr(stream, 'close', None) or getattr(stream, 'aclose', None)
+    if close is not None:
+        closed = close()
+        if inspect.isawaitable(closed):
+            await closed
+
+
+async def _open_streams(create, parts):
+    """Open the streams of several part requests concurrently.
+
+    If any part fails to open, the ones that did open are closed and the
+    first error is raised.
+    """
+    streams = await asyncio.gather(*(create(**part) for part in parts), return_exceptions=True)
+    errors = [stream for stream in streams if isinstance(stream, BaseException)]
+    if errors:
+        for stream in streams:
+            if not isinstance(stream, BaseException):
+                await _close_stream(stream)
+        raise errors[0]
+    return streams
+
+
+class _MergedStream:
+    """Read several part streams concurrently as one stream of renumbered choices.
+
+    Each part is read by its own task and closed as soon as it ends; chunks
+    are yielded in arrival order, with choice indices offset into one range.
+    ``close`` stops the readers and closes every part still open, so a
+    caller that stops early does not consume the remaining samples.
+    """
+
+    def __init__(self, streams, sizes):
+        self._streams = streams
+        self._offsets = np.concatenate([[0], np.cumsum(sizes[:-1])]).astype(int).tolist()
+        self._queue = asyncio.Queue()
+        self._tasks = None
+
+    async def _read(self, stream, offset):
+        try:
+            async for chunk in stream:
+                self._queue.put_nowait(types.SimpleNamespace(choices=[
+                    types.SimpleNamespace(index=choice.index + offset, delta=choice.delta,
+                                          finish_reason=getattr(choice, 'finish_reason', None))
+                    for choice in chunk.choices
+                ]))
+        except Exception as e:
+            self._queue.put_nowait(e)
+        finally:
+            await _close_stream(stream)
+            self._queue.put_nowait(None)
+
+    async def __aiter__(self):
+        if self._tasks is None:
+            self._tasks = [asyncio.ensure_future(self._read(stream, offset))
+                           for stream, offset in zip(self._streams, self._offsets)]
+        running = len(self._tasks)
+        while running:
+            item = await self._queue.get()
+            if item is None:
+                running -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+
+    async def close(self):
+        for task in self._tasks or []:
+            task.cancel()
+        await asyncio.gather(*(self._tasks or []), return_exceptions=True)
+        # Readers cancelled before they started never closed their part
+        for stream in self._streams:
+            await _close_stream(stream)
+
+
+class OpenAIBackend(LLMBackend):
+    """The OpenAI API, via ``AsyncOpenAI``; the key defaults to ``OPENAI_API_KEY``."""
+
+    def __init__(self, model='gpt-4', api_key=None, max_batch=None, **client_kwargs):
+        super().__init__(max_batch=max_batch)
+        self.model = model
+        self.api_key = api_key
+        self.client_kwargs = client_kwargs
+        self._client = None
+
+    def _make_client(self):
+        from openai import AsyncOpenAI
+
+        api_key = self.api_key or os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable not set")
+        return AsyncOpenAI(api_key=api_key, **self.client_kwargs)
+
+    async def _create(self, **request):
+        if self._client is None:
+            self._client = self._make_client()
+        return await self._client.chat.completions.create(**request)
+
+
+class LocalHTTPBackend(OpenAIBackend):
+    """Any OpenAI-compatible HTTP server (vLLM, llama.cpp, Ollama, ...).
+
+    Servers that only return one completion per request can be used with
+    ``max_batch=1``.
+    """
+
+    def __init__(self, model, base_url='http://localhost:8000/v1', api_key='local',
+                 max_batch=None, **client_kwargs):
+        super().__init__(model=model, api_key=api_key, max_batch=max_batch,
+                         base_url=base_url, **client_kwargs)
+        self.base_url = base_url
+
+
+def mock_generate(prompt, n, temperature, encoder, seed=0):
+    """Deterministic stand-in for an LLM: damped-drift random walks from the prompt's series.
+
+    Reads the window of values and the horizon from an LLMTime prompt and
+    returns ``n`` encoded sample paths whose noise grows with ``temperature``.
+    The same prompt, temperature and seed always give the same samples.
+    """
+    window = prompt.split('values:', 1)[-1].split('\n\n', 1)[0]
+    history = np.array(encoder.decode(window) or [0.5])
+    horizon = re.search(r'predict the next (\d+)', prompt)
+    horizon = int(horizon.group(1)) if horizon else 10
+
+    changes = np.diff(history[-20:]) if len(history) > 1 else np.zeros(1)
+    drift = changes.mean() * 0.5
+    scale = (changes.std() if len(changes) > 1 else 0.01) * (0.25 + temperature)
+    rng = np.random.default_rng(zlib.crc32(f"{seed}|{temperature}|{prompt}".encode('utf-8')))
+    paths = history[-1] + np.cumsum(drift + scale * rng.standard_normal((n, horizon)), axis=1)
+    return [encoder.encode(path) for path in np.clip(paths, 0, 1)]
+
+
+class InProcessBackend(LLMBackend):
+    """Generate completions in-process, e.g. with a small local model or a mock.
+
+    ``generate(prompt, n, temperature, max_tokens)`` returns ``n`` completion
+    texts for the user prompt in one batched call; it runs on a worker
+    thread so concurrent requests do not block the event loop. Without it the
+    deterministic ``mock_generate`` is used, which lets LLMTime pipelines run
+    offline. Streaming is emulated by splitting each text into value-sized
+    chunks.
+    """
+
+    def __init__(self, generate=None, model='mock', encoding='decimal', seed=0, max_batch=None):
+        super().__init__(max_batch=max_batch)
+        self.model = model
+        self.encoder = encoding if isinstance(encoding, ValueEncoder) else ValueEncoder(encoding)
+        self.seed = seed
+        self.generate = generate
+
+    def _generate(self, prompt, n, temperature, max_tokens):
+        if self.generate is not None:
+            return self.generate(prompt, n, temperature, max_tokens)
+        return mock_generate(prompt, n, temperature, self.encoder, seed=self.seed)
+
+    async def _create(self, **request):
+        prompt = request['messages'][-1]['content']
+        texts = await asyncio.to_thread(self._generate, prompt, request.get('n', 1),
+                                        request.get('temperature', 1.0),
+                                        request.get('max_tokens'))
+        if not request.get('stream'):
+            return types.SimpleNamespace(choices=[
+                types.SimpleNamespace(index=i, message=types.SimpleNamespace(content=text),
+                                      finish_reason='stop')
+                for i, text in enumerate(texts)
+            ])
+        return self._stream(texts)
+
+    async def _stream(self, texts):
+        pieces = [re.findall(r'[^,]*,?', text)[:-1] or [text] for text in texts]
+        for step in range(max(len(p) for p in pieces)):
+            yield types.SimpleNamespace(choices=[
+                types.SimpleNamespace(index=i, delta=types.SimpleNamespace(content=p[step]),
+                                      finish_reason='stop' if step == len(p) - 1 else None)
+                for i, p in enumerate(pieces) if step < len(p)
+            ])
+            await asyncio.sleep(0)
+
+
+BACKENDS = {
+    'openai': OpenAIBackend,
+    'local': LocalHTTPBackend,
+    'mock': InProcessBackend,
+}
+
+
+def get_backend(name, **kwargs):
+    """Create a backend by name: ``'openai'``, ``'local'`` or ``'mock'``."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend: {name}")
+    return BACKENDS[name](**kwargs)
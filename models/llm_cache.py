@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'startup_ecosystem_forecasting', 'llmtime.sqlite'
+)
+
+
+class LLMResponseCache:
+    """Persistent, content-addressed store of LLM completions.
+
+    Entries are keyed by a hash of the model, prompts and sampling parameters
+    and hold the raw completion texts. The oldest entries (by last access) are
+    evicted beyond ``max_entries``, and entries older than ``max_age`` seconds
+    are treated as misses. ``hits`` and ``misses`` count lookups for this
+    instance.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=10000, max_age=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, contents TEXT NOT NULL, "
+            "created REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model, system_prompt, prompt, temperature, n, max_tokens):
+        """Hash the request fields that determine a completion."""
+        payload = json.dumps(
+            [model, system_prompt, prompt, float(temperature), int(n), int(max_tokens)],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return the cached completion texts for ``key``, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT contents, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.max_age is not None and now - row[1] > self.max_age:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, contents):
+        """Store completion texts under ``key`` and apply the eviction policy."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, contents, created, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(list(contents), ensure_ascii=False), now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        if self.max_age is not None:
+            self._conn.execute("DELETE FROM responses WHERE created < ?", (now - self.max_age,))
+        if self.max_entries is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key NOT IN ("
+                "SELECT key FROM responses ORDER BY last_access DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def stats(self):
+        """Hit/miss counters and current number of stored entries."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+
+    def clear(self):
+        """Remove every stored entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        self._conn.close()
@@ -0,0 +1,222 @@
+import asyncio
+import os
+from email.utils import parsedate_to_datetime
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ..preprocessing.encoding import count_tokens
+from ..utils.instrumentation import count, span
+
+
+class TokenRateLimiter:
+    """Token bucket that spreads requests over a tokens-per-minute budget."""
+
+    def __init__(self, tokens_per_minute):
+        self.capacity = float(tokens_per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens):
+        """Wait until ``tokens`` (capped at the bucket size) can be spent."""
+        tokens = min(float(tokens), self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.capacity / 60)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) * 60 / self.capacity)
+
+
+def estimate_request_tokens(request):
+    """Rough token cost of a chat request: ~4 characters per prompt token plus
+    the completion budget reserved for every sample."""
+    prompt_chars = sum(len(message['content']) for message in request['messages'])
+    return prompt_chars // 4 + request.get('n', 1) * request.get('max_tokens', 0)
+
+
+def is_retryable(error):
+    """Whether an API error is worth retrying (rate limits, 5xx, connection errors)."""
+    import openai
+
+    if isinstance(error, (openai.RateLimitError, openai.APIConnectionError)):
+        return True
+    status = getattr(error, 'status_code', None)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def retry_after(error):
+    """Seconds the server asked to wait before retrying (``Retry-After``), or None.
+
+    Reads ``retry-after-ms`` or ``Retry-After`` (seconds or an HTTP date) from
+    the headers of the error's response.
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if headers is None:
+        headers = getattr(error, 'headers', None)
+    if not headers:
+        return None
+    headers = {str(key).lower(): value for key, value in headers.items()}
+    try:
+        if headers.get('retry-after-ms') is not None:
+            return max(0.0, float(headers['retry-after-ms']) / 1000)
+        value = headers.get('retry-after')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _cache_key(cache, request):
+    system_prompt, prompt = (message['content'] for message in request['messages'])
+    return cache.make_key(request['model'], system_prompt, prompt, request['temperature'],
+                          request['n'], request['max_tokens'])
+
+
+async def _stream(client, request, stop_condition):
+    """Stream one chat request, closing it once every sample satisfies ``stop_condition``.
+
+    ``stop_condition`` is a factory called once per sample; the returned
+    object's ``feed(delta)`` returns True when that sample needs no more
+    text; a sample is also complete when its choice reports a finish reason.
+    Returns the text received for each sample up to that point.
+    """
+    n = request.get('n', 1)
+    texts = [[] for _ in range(n)]
+    monitors = [stop_condition() for _ in range(n)]
+    done = [False] * n
+    stream = await client.chat.completions.create(**request, stream=True)
+    try:
+        async for chunk in stream:
+            for choice in chunk.choices:
+                delta = choice.delta.content
+                if delta and not done[choice.index]:
+                    texts[choice.index].append(delta)
+                    done[choice.index] = monitors[choice.index].feed(delta)
+                if getattr(choice, 'finish_reason', None) is not None:
+                    done[choice.index] = True
+            if all(done):
+                break
+    finally:
+        close = getattr(stream, 'close', None)
+        if close is not None:
+            closed = close()
+            if asyncio.iscoroutine(closed):
+                await closed
+    return [''.join(parts) for parts in texts]
+
+
+def _count_usage(request, contents, usage=None):
+    """Add a request's prompt and completion tokens to the LLM counters.
+
+    Uses the API's reported usage when available and ``count_tokens``
+    otherwise (e.g. for streamed or locally generated completions).
+    """
+    if usage is not None:
+        count('llm_prompt_tokens', usage.prompt_tokens)
+        count('llm_completion_tokens', usage.completion_tokens)
+        return
+    prompt = ''.join(message['content'] for message in request['messages'])
+    count('llm_prompt_tokens', count_tokens(prompt))
+    count('llm_completion_tokens', sum(count_tokens(text or '') for text in contents))
+
+
+async def _complete(client, request, semaphore, limiter, max_retries, base_delay,
+                    stop_condition=None):
+    """Send one chat request, retrying retryable errors.
+
+    The wait before a retry is the server's ``Retry-After`` when given and
+    jittered exponential backoff otherwise. ``llm_calls`` counts completed
+    requests; failed attempts are counted in ``llm_errors`` and ``llm_retries``.
+    """
+    for attempt in range(max_retries + 1):
+        if limiter is not None:
+            await limiter.acquire(estimate_request_tokens(request))
+        try:
+            async with semaphore:
+                with span('llm.request', n=request.get('n', 1), attempt=attempt):
+                    if stop_condition is not None:
+                        contents = await _stream(client, request, stop_condition)
+                        usage = None
+                    else:
+                        response = await client.chat.completions.create(**request)
+                        contents = [choice.message.content for choice in response.choices]
+                        usage = getattr(response, 'usage', None)
+            count('llm_calls')
+            _count_usage(request, contents, usage)
+            return contents
+        except Exception as e:
+            count('llm_errors')
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            delay = retry_after(e)
+        count('llm_retries')
+        if delay is None:
+            delay = base_delay * 2 ** attempt * (1 + random.random())
+        await asyncio.sleep(delay)
+
+
+async def acomplete_many(requests, client=None, max_concurrency=4, tokens_per_minute=None,
+                         max_retries=5, base_delay=1.0, cache=None, stop_condition=None):
+    """Run chat completion requests concurrently.
+
+    ``requests`` are ``chat.completions.create`` keyword dicts whose messages
+    are a system and a user message. At most ``max_concurrency`` requests are
+    in flight, and with ``tokens_per_minute`` their estimated token cost is
+    kept within that budget. With a ``stop_condition`` factory the requests
+    are streamed and each one is closed as soon as all of its samples are
+    complete (see ``_stream``). Returns one entry per request, in order: the
+    list of completion texts, or the exception that made the request fail.
+    """
+    results = [None] * len(requests)
+    pending = []
+    for i, request in enumerate(requests):
+        if cache is not None:
+            results[i] = cache.get(_cache_key(cache, request))
+        if results[i] is None:
+            pending.append(i)
+    if cache is not None:
+        count('llm_cache_hits', len(requests) - len(pending))
+        count('llm_cache_misses', len(pending))
+    if not pending:
+        return results
+
+    if client is None:
+        # Ensure API key is properly set
+        if not os.getenv('OPENAI_API_KEY'):
+            raise ValueError("OPENAI_API_KEY environment variable not set")
+        from openai import AsyncOpenAI
+        client = AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limiter = TokenRateLimiter(tokens_per_minute) if tokens_per_minute else None
+    outcomes = await asyncio.gather(
+        *(_complete(client, requests[i], semaphore, limiter, max_retries, base_delay,
+                    stop_condition)
+          for i in pending),
+        return_exceptions=True,
+    )
+    for i, outcome in zip(pending, outcomes):
+        results[i] = outcome
+        if cache is not None and not isinstance(outcome, BaseException):
+            cache.put(_cache_key(cache, requests[i]), outcome)
+    return results
+
+
+def run_sync(coroutine):
+    """Run a coroutine to completion, even when called from inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
@@ -1,130 +1,328 @@
-import os
+from functools import partial
+
 import numpy as np
-from openai import OpenAI
-from scipy.stats import trim_mean
-from scipy.signal import savgol_filter
 
-def get_llmtime_predictions(prompt, num_samples=20, temperature=0.7, num_predictions=40):
-    """Get predictions from LLMTime with improved prompt engineering."""
+from ..preprocessing.encoding import StreamingDecoder, ValueEncoder
+from ..preprocessing.preprocessor import preprocess_time_series
+from .llm_requests import acomplete_many, run_sync
+from .sample_aggregation import aggregate_samples, sample_quantiles, smooth_forecasts
+from ..utils.instrumentation import timed
+
+# System prompt of the default (decimal) encoding; see ``ValueEncoder.system_prompt``
+SYSTEM_PROMPT = ValueEncoder().system_prompt()
+
+LLM_MODEL = "gpt-4"  # Using GPT-4 for better performance
+MAX_TOKENS = 1000
+SHORT_SAMPLE_POLICIES = ('drop', 'pad', 'impute')
+MIN_SAMPLE_FRACTION = 0.5  # default share of values below which a sample is always dropped
+
+def _as_encoder(encoding):
+    return encoding if isinstance(encoding, ValueEncoder) else ValueEncoder(encoding)
+
+def _fill_short_samples(samples, num_predictions, short_samples,
+                        min_sample_fraction=MIN_SAMPLE_FRACTION):
+    """Complete samples with fewer than ``num_predictions`` values.
+
+    ``'drop'`` discards them, ``'pad'`` repeats their last value and
+    ``'impute'`` takes the missing steps from the median of the complete
+    samples (padding when there are none). Samples with fewer than
+    ``min_sample_fraction`` of the values are always discarded.
+    """
+    if short_samples not in SHORT_SAMPLE_POLICIES:
+        raise ValueError(f"Unknown short sample policy: {short_samples}")
+    complete = [values for values in samples if len(values) == num_predictions]
+    if short_samples == 'drop':
+        return complete
+
+    minimum = max(1, int(np.ceil(min_sample_fraction * num_predictions)))
+    reference = np.median(complete, axis=0) if complete else None
+    filled = []
+    for values in samples:
+        if len(values) == num_predictions:
+            filled.append(values)
+        elif len(values) >= minimum:
+            if short_samples == 'impute' and reference is not None:
+                tail = list(reference[len(values):])
+            else:
+                tail = [values[-1]] * (num_predictions - len(values))
+            filled.append(list(values) + tail)
+    return filled
+
+def _parse_predictions(contents, num_predictions, encoding='decimal', short_samples='drop',
+                       min_sample_fraction=MIN_SAMPLE_FRACTION, truncate=False):
+    """Parse completion texts into samples of ``num_predictions`` values.
+
+    Samples that end early are handled by ``short_samples`` (see
+    ``_fill_short_samples``). Samples with too many values are dropped, or
+    cut to ``num_predictions`` values with ``truncate=True`` (for streamed
+    completions, which are closed once enough values have arrived).
+    """
+    encoder = _as_encoder(encoding)
+    samples = []
+    for content in contents:
+        try:
+            values = encoder.decode(content)
+            if len(values) > num_predictions:
+                if not truncate:
+                    continue
+                values = values[:num_predictions]
+            # Ensure values are in [0,1] range
+            samples.append([max(0, min(1, x)) for x in values])
+        except (ValueError, AttributeError) as e:
+            print(f"Warning: Error parsing prediction: {e}")
+            continue
+    return _fill_short_samples(samples, num_predictions, short_samples, min_sample_fraction)
+
+def _make_request(prompt, num_samples, temperature, model=LLM_MODEL, system_prompt=SYSTEM_PROMPT):
+    """Keyword arguments for one LLMTime ``chat.completions.create`` call."""
+    return {
+        'model': model,
+        'messages': [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ],
+        'temperature': temperature,
+        'n': num_samples,
+        'max_tokens': MAX_TOKENS,
+    }
+
+async def aget_llmtime_predictions_many(prompts, num_samples=20, temperature=0.7,
+                                        num_predictions=40, cache=None, client=None,
+                                        max_concurrency=4, tokens_per_minute=None,
+                                        max_retries=5, encoding='decimal', stream=False,
+                                        short_samples='drop', backend=None,
+                                        min_sample_fraction=MIN_SAMPLE_FRACTION):
+    """Async version of ``get_llmtime_predictions_many``."""
+    if np.isscalar(temperature):
+        temperature = [temperature] * len(prompts)
+    model = LLM_MODEL
+    if backend is not None:
+        client, model = backend, backend.model or LLM_MODEL
+    system_prompt = _as_encoder(encoding).system_prompt()
+    requests = [_make_request(prompt, num_samples, temp, model, system_prompt)
+                for prompt, temp in zip(prompts, temperature)]
+
+    stop_condition = None
+    if stream:
+        stop_condition = partial(StreamingDecoder, _as_encoder(encoding), num_predictions)
+
     try:
-        # Ensure API key is properly set
-        if not os.getenv('OPENAI_API_KEY'):
-            raise ValueError("OPENAI_API_KEY environment variable not set")
-            
-        # Format the prompt according to the paper with improved context
-        system_prompt = """You are a time series forecasting model. Given a sequence of numbers, predict the next values in the sequence. 
-        The numbers are normalized between 0 and 1. Consider the following:
-        1. Look for patterns and trends in the data
-        2. Consider seasonal variations if present
-        3. Account for any recent changes in the trend
-        4. Return your predictions as a comma-separated list of numbers between 0 and 1.
-        Do not include any explanations or additional text, just the numbers."""
-        
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        
-        response = client.chat.completions.create(
-            model="gpt-4",  # Using GPT-4 for better performance
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=temperature,
-            n=num_samples,
-            max_tokens=1000
-        )
-        
-        predictions = []
-        for choice in response.choices:
-            try:
-                content = choice.message.content.strip()
-                # Clean the response
-                content = content.replace('[', '').replace(']', '')
-                content = content.replace('\n', '')
-                # Parse numbers
-                values = [float(x.strip()) for x in content.split(',') if x.strip()]
-                # Ensure values are in [0,1] range
-                values = [max(0, min(1, x)) for x in values]
-                if len(values) == num_predictions:
-                    predictions.append(values)
-            except (ValueError, AttributeError) as e:
-                print(f"Warning: Error parsing prediction: {e}")
-                continue
-                
-        if not predictions:
-            print("Warning: No valid predictions obtained from LLMTime")
-            return None
-            
-        return np.array(predictions)
-        
+        results = await acomplete_many(requests, client=client, max_concurrency=max_concurrency,
+                                       tokens_per_minute=tokens_per_minute,
+                                       max_retries=max_retries, cache=cache,
+                                       stop_condition=stop_condition)
     except Exception as e:
         print(f"Error getting LLMTime predictions: {e}")
-        return None
+        return [None] * len(prompts)
 
-def optimize_llmtime_parameters(train, test, window_sizes=[40, 60], temperatures=[0.05, 0.1], 
-                              num_samples_list=[16], smoothing_windows=[5, 7]):
-    """Optimize LLMTime parameters using grid search."""
-    best_error = float('inf')
-    best_params = None
-    best_predictions = None
-    
-    for window_size in window_sizes:
-        for temp in temperatures:
-            for num_samples in num_samples_list:
-                for agg_method in ['median', 'trimmed_mean']:
-                    print(f"Trying window={window_size}, temp={temp}, num_samples={num_samples}, agg={agg_method}...")
-                    rolling_train = train[-window_size:]
-                    formatted_rolling, scaler, context = preprocess_time_series(rolling_train)
-                    
-                    prompt = f"""Context: {context}
-
-Given the following sequence of {len(formatted_rolling)} normalized weekly values:
-{', '.join(formatted_rolling)}
+    all_predictions = []
+    for contents in results:
+        if isinstance(contents, BaseException):
+            print(f"Error getting LLMTime predictions: {contents}")
+            all_predictions.append(None)
+            continue
+        predictions = _parse_predictions(contents, num_predictions, encoding, short_samples,
+                                         min_sample_fraction, truncate=stream)
+        if not predictions:
+            print("Warning: No valid predictions obtained from LLMTime")
+            all_predictions.append(None)
+            continue
+        all_predictions.append(np.array(predictions))
+    return all_predictions
+
+@timed()
+def get_llmtime_predictions_many(prompts, num_samples=20, temperature=0.7, num_predictions=40,
+                                 cache=None, client=None, max_concurrency=4,
+                                 tokens_per_minute=None, max_retries=5, encoding='decimal',
+                                 stream=False, short_samples='drop', backend=None,
+                                 min_sample_fraction=MIN_SAMPLE_FRACTION):
+    """Get LLMTime predictions for many prompts concurrently.
+
+    ``temperature`` may be a single value or one per prompt. Up to
+    ``max_concurrency`` requests are in flight, optionally throttled to
+    ``tokens_per_minute``; rate-limit, 5xx and connection errors are retried
+    with exponential backoff. ``client`` can be any ``AsyncOpenAI``-compatible
+    client; a ``backend`` from ``models.llm_backends`` (OpenAI, a local HTTP
+    endpoint or an in-process model) replaces both the client and the model
+    name, so cached completions are kept apart per backend. ``encoding`` (a
+    scheme name or ``ValueEncoder``) must match the one the prompts were
+    written with; it also selects the system prompt.
+
+    With ``stream=True`` completions are parsed as they arrive and each
+    request stops once every sample has ``num_predictions`` values;
+    ``short_samples`` (``'drop'``, ``'pad'`` or ``'impute'``) decides what
+    happens to samples that end early; samples with fewer than
+    ``min_sample_fraction`` of the values are always dropped. Samples with
+    more than ``num_predictions`` values are dropped too, except when
+    streaming, where only the first ``num_predictions`` are read. Returns one
+    sample array (or None on failure) per prompt.
+    """
+    return run_sync(aget_llmtime_predictions_many(
+        prompts, num_samples=num_samples, temperature=temperature,
+        num_predictions=num_predictions, cache=cache, client=client,
+        max_concurrency=max_concurrency, tokens_per_minute=tokens_per_minute,
+        max_retries=max_retries, encoding=encoding, stream=stream,
+        short_samples=short_samples, backend=backend, min_sample_fraction=min_sample_fraction
+    ))
+
+def get_llmtime_predictions(prompt, num_samples=20, temperature=0.7, num_predictions=40, cache=None,
+                            client=None, encoding='decimal', stream=False, short_samples='drop',
+                            backend=None, min_sample_fraction=MIN_SAMPLE_FRACTION):
+    """Get predictions from LLMTime with improved prompt engineering.
+
+    This is a thin wrapper over ``get_llmtime_predictions_many``. If an
+    ``LLMResponseCache`` is given, identical requests are replayed from it
+    instead of calling the API.
+    """
+    return get_llmtime_predictions_many(
+        [prompt], num_samples=num_samples, temperature=temperature,
+        num_predictions=num_predictions, cache=cache, client=client, encoding=encoding,
+        stream=stream, short_samples=short_samples, backend=backend,
+        min_sample_fraction=min_sample_fraction
+    )[0]
+
+AGG_METHODS = ['median', 'trimmed_mean']
+
+def _build_prompt(formatted_values, context, num_predictions, encoding='decimal'):
+    """Build the LLMTime user prompt for a formatted window of values."""
+    encoder = _as_encoder(encoding)
+    answer_format = "the predicted numbers"
+    if encoder.integer:
+        answer_format = f"the predicted values as {encoder.describe()}"
+    return f"""Context: {context}
+
+Given the following sequence of {len(formatted_values)} normalized weekly values:
+{encoder.separator.join(formatted_values)}
 
 This data is from a real-world financial time series with both trend and seasonality.
 Your goal is to minimize the root mean squared error (RMSE) of your predictions.
-Please predict the next {len(test)} normalized values in the sequence, considering:
+Please predict the next {num_predictions} normalized values in the sequence, considering:
 - Recent trends and changes
 - Seasonal patterns (e.g., annual or quarterly cycles)
 - Any abrupt shifts or anomalies
 Minimize prediction error. Match the statistical properties of the sequence. Avoid abrupt jumps unless the data shows a clear anomaly.
 
-Return only the predicted numbers, separated by commas, with no explanation or extra text."""
-
-                    llmtime_samples = get_llmtime_predictions(
-                        prompt,
-                        num_samples=num_samples,
-                        temperature=temp,
-                        num_predictions=len(test)
-                    )
-                    
-                    if llmtime_samples is not None:
-                        if agg_method == 'median':
-                            llmtime_agg = np.median(llmtime_samples, axis=0)
-                        else:
-                            llmtime_agg = trim_mean(llmtime_samples, proportiontocut=0.1, axis=0)
-                            
-                        # Inverse transform and clip
-                        llmtime_agg = scaler.inverse_transform(llmtime_agg.reshape(-1, 1)).flatten()
-                        llmtime_agg = np.clip(llmtime_agg, train.min(), train.max())
-                        
-                        # Try several smoothing window lengths
-                        for smooth_win in smoothing_windows:
-                            if len(llmtime_agg) > smooth_win:
-                                llmtime_smoothed = savgol_filter(llmtime_agg, smooth_win, 2)
-                            else:
-                                llmtime_smoothed = llmtime_agg
-                                
-                            error = np.sqrt(np.mean((test.values - llmtime_smoothed) ** 2))  # RMSE
-                            
-                            if error < best_error:
-                                best_error = error
-                                best_params = {
-                                    'window_size': window_size,
-                                    'temperature': temp,
-                                    'num_samples': num_samples,
-                                    'agg_method': agg_method,
-                                    'smoothing_window': smooth_win
-                                }
-                                best_predictions = llmtime_smoothed
-                                
-    return best_predictions, best_params, best_error 
\ No newline at end of file
+Return only {answer_format}, separated by commas, with no explanation or extra text."""
+
+@timed()
+def _evaluate_sample_matrix(samples, scaler, train, test_values, num_samples_list,
+                            smoothing_windows):
+    """Score every num_samples x aggregation x smoothing choice on one sample matrix.
+
+    Smaller sample counts use the leading rows of ``samples``. Returns the
+    RMSE array shaped (num_samples, agg_method, smoothing_window) and the
+    matching smoothed forecasts with a trailing horizon axis.
+    """
+    aggregates = np.stack([aggregate_samples(samples[:num_samples], AGG_METHODS)
+                           for num_samples in num_samples_list])
+
+    # Inverse transform and clip
+    aggregates = scaler.inverse_transform(aggregates.reshape(-1, 1)).reshape(aggregates.shape)
+    aggregates = np.clip(aggregates, train.min(), train.max())
+
+    # Try several smoothing window lengths
+    forecasts = smooth_forecasts(aggregates, smoothing_windows)
+
+    errors = np.sqrt(np.mean((test_values - forecasts) ** 2, axis=-1))  # RMSE
+    return errors, forecasts
+
+@timed()
+def optimize_llmtime_parameters(train, test, window_sizes=[40, 60], temperatures=[0.05, 0.1], 
+                              num_samples_list=[16], smoothing_windows=[5, 7], cache=None,
+                              client=None, max_concurrency=4, tokens_per_minute=None,
+                              encoding='decimal', precision=3, stream=False,
+                              short_samples='drop', backend=None, return_interval=False,
+                              interval_alpha=0.1, calibrator=None,
+                              min_sample_fraction=MIN_SAMPLE_FRACTION):
+    """Optimize LLMTime parameters using grid search.
+
+    The LLM is queried once per (window size, temperature) for the largest
+    sample count, with all requests issued concurrently through
+    ``get_llmtime_predictions_many``; every num_samples, aggregation and
+    smoothing choice is then scored on that single sample matrix. ``cache``
+    lets repeated runs replay completions from disk. ``encoding`` and
+    ``precision`` choose how values are serialised (see
+    ``preprocessing.encoding``); compact schemes shorten prompts and
+    completions. ``stream``, ``short_samples``, ``min_sample_fraction`` and
+    ``backend`` are passed to ``get_llmtime_predictions_many``.
+
+    With ``return_interval=True`` a fourth value holds a ``(lower, upper)``
+    ``1 - interval_alpha`` prediction interval from the quantiles of the best
+    configuration's samples, at no extra LLM cost. A fitted
+    ``ConformalCalibrator`` (see ``models.sample_aggregation``) recalibrates
+    it: one fitted on point forecasts puts its interval around the best
+    forecast, one fitted on bands adjusts the sample-quantile band.
+    """
+    encoder = ValueEncoder(encoding, precision) if isinstance(encoding, str) else encoding
+    best_error = float('inf')
+    best_params = None
+    best_predictions = None
+    best_samples = None
+    max_samples = max(num_samples_list)
+    test_values = np.asarray(test, dtype=float)
+
+    # Stage 1: one request per distinct (window size, temperature), sent concurrently
+    windows = {}
+    for window_size in window_sizes:
+        rolling_train = train[-window_size:]
+        formatted_rolling, scaler, context = preprocess_time_series(rolling_train,
+                                                                    encoding=encoder)
+        windows[window_size] = (_build_prompt(formatted_rolling, context, len(test), encoder),
+                                scaler)
+
+    grid = [(window_size, temp) for window_size in window_sizes for temp in temperatures]
+    print(f"Sampling {len(grid)} prompt/temperature combinations with num_samples={max_samples}...")
+    samples = get_llmtime_predictions_many(
+        [windows[window_size][0] for window_size, _ in grid],
+        num_samples=max_samples,
+        temperature=[temp for _, temp in grid],
+        num_predictions=len(test),
+        cache=cache,
+        client=client,
+        max_concurrency=max_concurrency,
+        tokens_per_minute=tokens_per_minute,
+        encoding=encoder,
+        stream=stream,
+        short_samples=short_samples,
+        min_sample_fraction=min_sample_fraction,
+        backend=backend
+    )
+
+    # Stage 2: score every post-processing choice on each sample matrix
+    for (window_size, temp), llmtime_samples in zip(grid, samples):
+        if llmtime_samples is None:
+            continue
+
+        errors, forecasts = _evaluate_sample_matrix(
+            llmtime_samples, windows[window_size][1], train, test_values, num_samples_list,
+            smoothing_windows
+        )
+        # argmin keeps the first minimum, matching the nested-loop tie-breaking
+        i, j, k = np.unravel_index(np.argmin(errors), errors.shape)
+        if errors[i, j, k] < best_error:
+            best_error = errors[i, j, k]
+            best_params = {
+                'window_size': window_size,
+                'temperature': temp,
+                'num_samples': num_samples_list[i],
+                'agg_method': AGG_METHODS[j],
+                'smoothing_window': smoothing_windows[k]
+            }
+            best_predictions = forecasts[i, j, k]
+            best_samples = (llmtime_samples[:num_samples_list[i]], windows[window_size][1])
+
+    if not return_interval:
+        return best_predictions, best_params, best_error
+
+    interval = None
+    if best_samples is not None:
+        if calibrator is not None and calibrator.mode_ == 'point':
+            interval = calibrator.interval(point=best_predictions)
+        else:
+            subset, scaler = best_samples
+            band = sample_quantiles(subset, [interval_alpha / 2, 1 - interval_alpha / 2])
+            lower, upper = scaler.inverse_transform(band.reshape(-1, 1)).reshape(band.shape)
+            interval = (lower, upper)
+            if calibrator is not None:
+                interval = calibrator.interval(lower=lower, upper=upper)
+    return best_predictions, best_params, best_error, interval
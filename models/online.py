@@ -0,0 +1,236 @@
+import concurrent.futures
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy.stats import norm
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+from .holt_winters import BatchHoltWinters
+
+FAMILIES = ('ARIMA', 'SARIMA', 'Holt-Winters')
+
+
+class OnlineForecaster:
+    """Long-lived forecaster that absorbs new observations without refitting.
+
+    ``update(new_points)`` filters new observations into the fitted state
+    (Kalman filtering for ARIMA/SARIMA, the smoothing recursion for
+    Holt-Winters) with the current parameters. Parameters are re-estimated
+    every ``refit_every`` points or when a point's standardised one-step
+    error exceeds ``drift_threshold``; with ``background=True`` that refit
+    runs on a worker thread and is swapped in, caught up with any points
+    that arrived meanwhile, once it finishes. Forecasts made before the swap
+    still use the old parameters, so background results depend on timing;
+    the default refits synchronously and is deterministic. A failed
+    background refit is re-raised by the next ``update``, ``forecast`` or
+    ``wait``. ``get_state``/``save`` capture everything needed to resume
+    without a fresh parameter estimation.
+    """
+
+    def __init__(self, family='ARIMA', order=(1, 1, 1), seasonal_order=(0, 0, 0, 0),
+                 seasonal_period=4, refit_every=None, drift_threshold=None, background=False):
+        if family not in FAMILIES:
+            raise ValueError(f"Unknown model family: {family}")
+        self.family = family
+        self.order = tuple(order)
+        self.seasonal_order = tuple(seasonal_order)
+        self.seasonal_period = seasonal_period
+        self.refit_every = refit_every
+        self.drift_threshold = drift_threshold
+        self.background = background
+
+        self.history = np.empty(0)
+        self.params = None
+        self.n_refits = 0
+        self._model_fit = None
+        self._since_fit = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1) if background else None
+        self._pending = None
+
+    # -- model-specific pieces -------------------------------------------------
+
+    def _build(self, values):
+        if self.family == 'ARIMA':
+            return ARIMA(values, order=self.order)
+        return SARIMAX(values, order=self.order, seasonal_order=self.seasonal_order)
+
+    def _estimate(self, values, start_params=None):
+        """Full parameter estimation on ``values``; returns the fitted state."""
+        if self.family == 'Holt-Winters':
+            return BatchHoltWinters(self.seasonal_period).fit(values)
+        fit_kwargs = {} if self.family == 'ARIMA' else {'disp': False}
+        return self._build(values).fit(start_params=start_params, **fit_kwargs)
+
+    def _params_of(self, model_fit):
+        if self.family == 'Holt-Winters':
+            return [float(model_fit.alpha[0]), float(model_fit.beta[0]), float(model_fit.gamma[0])]
+        return [float(p) for p in model_fit.params]
+
+    def _extend(self, model_fit, values):
+        """Filter ``values`` into ``model_fit`` with its current parameters."""
+        if len(values) == 0:
+            return model_fit
+        if self.family == 'Holt-Winters':
+            return model_fit.update(values)
+        return model_fit.extend(values)
+
+    def _one_step(self, model_fit):
+        """Mean and standard error of the next one-step forecast."""
+        mean, lower, _ = self._forecast(model_fit, 1, alpha=2 * norm.sf(1))
+        return mean[0], mean[0] - lower[0]
+
+    def _forecast(self, model_fit, horizon, alpha):
+        if self.family != 'Holt-Winters':
+            forecast = model_fit.get_forecast(horizon)
+            interval = np.asarray(forecast.conf_int(alpha=alpha))
+            return np.asarray(forecast.predicted_mean), interval[:, 0], interval[:, 1]
+
+        # ETS(A,A,A) forecast variance: sigma^2 * (1 + sum_j c_j^2) with
+        # c_j = alpha * (1 + j * beta) + gamma * [j is a multiple of m]
+        mean = model_fit.forecast(horizon)[0]
+        sigma2 = model_fit.sse[0] / max(model_fit.nobs, 1)
+        alpha_, beta_, gamma_ = model_fit.alpha[0], model_fit.beta[0], model_fit.gamma[0]
+        j = np.arange(1, horizon)
+        c = alpha_ * (1 + j * beta_) + gamma_ * (j % self.seasonal_period == 0)
+        variance = sigma2 * (1 + np.concatenate([[0.0], np.cumsum(c ** 2)]))
+        width = norm.ppf(1 - alpha / 2) * np.sqrt(variance)
+        return mean, mean - width, mean + width
+
+    # -- public API ------------------------------------------------------------
+
+    def fit(self, series):
+        """Estimate parameters on an initial history."""
+        self.history = np.asarray(series, dtype=float).copy()
+        self._model_fit = self._estimate(self.history)
+        self.params = self._params_of(self._model_fit)
+        self._since_fit = 0
+        return self
+
+    def update(self, new_points):
+        """Absorb new observations; may trigger a (background) re-estimation."""
+        self._raise_failed_refit()
+        new_points = np.atleast_1d(np.asarray(new_points, dtype=float))
+        with self._lock:
+            drifted = False
+            if self.drift_threshold is not None:
+                model_fit = self._model_fit
+                for y in new_points:
+                    mean, se = self._one_step(model_fit)
+                    drifted = drifted or (se > 0 and abs(y - mean) / se > self.drift_threshold)
+                    model_fit = self._extend(model_fit, [y])
+                self._model_fit = model_fit
+            else:
+                self._model_fit = self._extend(self._model_fit, new_points)
+            self.history = np.concatenate([self.history, new_points])
+            self._since_fit += len(new_points)
+            due = drifted or (self.refit_every and self._since_fit >= self.refit_every)
+
+        if due:
+            self.refit()
+        return self
+
+    def refit(self):
+        """Re-estimate parameters on the full history, warm-started from the current ones."""
+        with self._lock:
+            if self._pending is not None and not self._pending.done():
+                return
+            snapshot = self.history.copy()
+            start_params = None if self.family == 'Holt-Winters' else self.params
+            self._since_fit = 0
+            if self._executor is not None:
+                self._pending = self._executor.submit(self._background_refit, snapshot,
+                                                      start_params)
+                return
+        self._swap(snapshot, self._estimate(snapshot, start_params))
+
+    def _background_refit(self, snapshot, start_params):
+        self._swap(snapshot, self._estimate(snapshot, start_params))
+
+    def _swap(self, snapshot, model_fit):
+        with self._lock:
+            # Catch up with points that arrived while re-estimating
+            self._model_fit = self._extend(model_fit, self.history[len(snapshot):])
+            self.params = self._params_of(model_fit)
+            self.n_refits += 1
+
+    def _raise_failed_refit(self):
+        """Re-raise the error of a finished background refit (once)."""
+        pending = self._pending
+        if pending is not None and pending.done():
+            self._pending = None
+            if pending.exception() is not None:
+                raise RuntimeError("Background re-estimation failed") from pending.exception()
+
+    def wait(self):
+        """Block until any background re-estimation has finished."""
+        if self._pending is not None:
+            concurrent.futures.wait([self._pending])
+        self._raise_failed_refit()
+
+    def forecast(self, horizon=1, alpha=0.1):
+        """Next-``horizon`` forecast and its ``1 - alpha`` prediction interval.
+
+        Returns ``(mean, (lower, upper))``, the interval in the form accepted
+        by ``plot_predictions(uncertainty=...)``.
+        """
+        self._raise_failed_refit()
+        with self._lock:
+            mean, lower, upper = self._forecast(self._model_fit, horizon, alpha)
+        return mean, (lower, upper)
+
+    # -- serialisation -----------------------------------------------------------
+
+    def get_state(self):
+        """JSON-serialisable snapshot of the configuration, parameters and state."""
+        self.wait()
+        with self._lock:
+            state = {
+                'family': self.family,
+                'order': list(self.order),
+                'seasonal_order': list(self.seasonal_order),
+                'seasonal_period': self.seasonal_period,
+                'refit_every': self.refit_every,
+                'drift_threshold': self.drift_threshold,
+                'params': self.params,
+                'history': self.history.tolist(),
+                'since_fit': self._since_fit,
+                'n_refits': self.n_refits,
+            }
+            if self.family == 'Holt-Winters':
+                state['holt_winters'] = self._model_fit.get_state()
+        return state
+
+    @classmethod
+    def from_state(cls, state, background=False):
+        """Restore a forecaster from ``get_state`` output without re-estimating."""
+        forecaster = cls(state['family'], order=state['order'],
+                         seasonal_order=state['seasonal_order'],
+                         seasonal_period=state['seasonal_period'],
+                         refit_every=state['refit_every'],
+                         drift_threshold=state['drift_threshold'], background=background)
+        forecaster.history = np.asarray(state['history'], dtype=float)
+        forecaster.params = state['params']
+        forecaster._since_fit = state['since_fit']
+        forecaster.n_refits = state['n_refits']
+
+        if forecaster.family == 'Holt-Winters':
+            forecaster._model_fit = BatchHoltWinters(forecaster.seasonal_period).set_state(
+                state['holt_winters'])
+        else:
+            # Kalman filtering with known parameters; no optimisation
+            model = forecaster._build(forecaster.history)
+            forecaster._model_fit = model.filter(np.asarray(state['params']))
+        return forecaster
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.get_state(), fh)
+
+    @classmethod
+    def load(cls, path, background=False):
+        with open(path, 'r', encoding='utf-8') as fh:
+            return cls.from_state(json.load(fh), background=background)
@@ -0,0 +1,218 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager, nullcontext
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from ..utils.instrumentation import TRACER, call_counted, count, merge_counted, span
+from ..utils.shared_memory import SharedArray, SharedPanel
+
+
+def resolve_n_jobs(n_jobs):
+    """Translate an ``n_jobs`` argument into a worker count (-1 means all cores)."""
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def fit_candidates(fit_candidate, series, candidates, n_jobs=1, executor=None, workers=None):
+    """Fit every candidate with ``fit_candidate(series, candidate)``.
+
+    Records come back in the same order as ``candidates`` regardless of how
+    many workers were used, so downstream selection is deterministic.
+    ``workers`` is an open ``candidate_workers`` pool for ``series`` to reuse
+    instead of starting one for this call.
+    """
+    candidates = list(candidates)
+    with span('fit_candidates', candidates=len(candidates)):
+        records = _map_candidates(fit_candidate, series, candidates, n_jobs, executor, workers)
+    count('model_fits', len(records))
+    count('failed_fits', sum(record.get('error') is not None for record in records))
+    return records
+
+
+@contextmanager
+def candidate_workers(series, n_jobs):
+    """Process pool, and shared copy of ``series``, for several ``fit_candidates`` calls.
+
+    Yields ``(pool, panel, n_workers)``, where ``panel`` is a ``SharedPanel``
+    of the series (None if it cannot be shared), or None when ``n_jobs``
+    resolves to a single worker. Both are released on exit.
+    """
+    n_workers = resolve_n_jobs(n_jobs)
+    if n_workers <= 1:
+        yield None
+        return
+    with ExitStack() as stack:
+        panel = stack.enter_context(SharedPanel(series)) if SharedPanel.supports(series) else None
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=n_workers))
+        yield pool, panel, n_workers
+
+
+def _map_candidates(fit_candidate, series, candidates, n_jobs, executor, workers=None):
+    if executor is not None:
+        return list(executor.map(fit_candidate, repeat(series), candidates))
+    if workers is None:
+        n_workers = min(resolve_n_jobs(n_jobs), len(candidates))
+        if n_workers <= 1:
+            return [fit_candidate(series, candidate) for candidate in candidates]
+        with candidate_workers(series, n_workers) as workers:
+            return _map_on_workers(fit_candidate, series, candidates, workers)
+    return _map_on_workers(fit_candidate, series, candidates, workers)
+
+
+def _map_on_workers(fit_candidate, series, candidates, workers):
+    """Fit ``candidates`` on an open ``candidate_workers`` pool."""
+    pool, panel, n_workers = workers
+    chunksize = max(1, math.ceil(len(candidates) / (n_workers * 4)))
+    if panel is None:
+        return merge_counted(pool.map(call_counted, repeat(TRACER.enabled),
+                                      repeat(fit_candidate), repeat(series), candidates,
+                                      chunksize=chunksize))
+
+    # The series is in shared memory and AICs are written into a shared
+    # result array, so tasks only carry small handles and candidates
+    with SharedArray(len(candidates), fill=np.nan, backend=panel.values.backend) as aics:
+        records = merge_counted(pool.map(call_counted, repeat(TRACER.enabled),
+                                         repeat(_fit_shared_candidate), repeat(fit_candidate),
+                                         repeat(panel), repeat(aics), range(len(candidates)),
+                                         candidates, chunksize=chunksize))
+        for record, aic in zip(records, aics.array):
+            record['aic'] = None if record['error'] is not None else float(aic)
+    return records
+
+
+def _fit_shared_candidate(fit_candidate, panel, aics, i, candidate):
+    """Worker side of ``_map_candidates``: fit on the shared series, store the AIC in ``aics``."""
+    record = fit_candidate(panel.series(), candidate)
+    if record['aic'] is not None:
+        aics.array[i] = record['aic']
+    record['aic'] = None
+    return record
+
+
+def _improves(record, best):
+    """Whether ``record`` has a finite AIC strictly below that of ``best``."""
+    aic = record['aic']
+    if aic is None or not np.isfinite(aic):
+        return False
+    return best is None or aic < best['aic']
+
+
+def select_best(records):
+    """Return the record with the lowest finite AIC; earlier records win ties."""
+    best = None
+    for record in records:
+        if _improves(record, best):
+            best = record
+    return best
+
+
+def candidates_table(records, grid_size=None):
+    """Build a per-candidate table of AIC values and failure reasons.
+
+    ``attrs['n_fits']`` holds the number of models fitted and
+    ``attrs['grid_size']`` the size of the full grid they were drawn from.
+    """
+    table = pd.DataFrame.from_records(records)
+    table.attrs['n_fits'] = len(records)
+    table.attrs['grid_size'] = len(records) if grid_size is None else grid_size
+    return table
+
+
+def ndiffs(series, max_d=2, alpha=0.05):
+    """Number of differences needed before the ADF test rejects a unit root."""
+    from statsmodels.tsa.stattools import adfuller
+
+    values = np.asarray(series, dtype=float)
+    d = 0
+    while d < max_d and len(values) > 10 and adfuller(values)[1] >= alpha:
+        values = np.diff(values)
+        d += 1
+    return d
+
+
+def nsdiffs(series, seasonal_period, max_D=1, threshold=0.64):
+    """Number of seasonal differences, based on the STL seasonal strength.
+
+    A strength ``1 - Var(remainder) / Var(seasonal + remainder)`` above
+    ``threshold`` calls for one seasonal difference, as in Hyndman & Khandakar.
+    """
+    from statsmodels.tsa.seasonal import STL
+
+    values = np.asarray(series, dtype=float)
+    if max_D < 1 or seasonal_period < 2 or len(values) < 2 * seasonal_period + 1:
+        return 0
+    stl = STL(values, period=seasonal_period).fit()
+    denominator = np.var(stl.seasonal + stl.resid)
+    if denominator == 0:
+        return 0
+    strength = max(0.0, 1 - np.var(stl.resid) / denominator)
+    return int(strength > threshold)
+
+
+def neighbouring_orders(values, bounds, pairs=((0, 1),)):
+    """Orders one step away from ``values`` within ``0..bounds``.
+
+    Each coordinate is moved by +-1 on its own, and each index pair in
+    ``pairs`` is also moved by +-1 together.
+    """
+    moves = []
+    for i in range(len(values)):
+        for step in (-1, 1):
+            moves.append({i: step})
+    for i, j in pairs:
+        for step in (-1, 1):
+            moves.append({i: step, j: step})
+
+    orders = []
+    for move in moves:
+        order = tuple(v + move.get(i, 0) for i, v in enumerate(values))
+        if all(0 <= v <= bound for v, bound in zip(order, bounds)):
+            orders.append(order)
+    return orders
+
+
+def stepwise_search(fit_candidate, series, initial, neighbours, max_fits=94, n_jobs=1,
+                    executor=None):
+    """Hyndman-Khandakar style stepwise search over candidate orders.
+
+    The ``initial`` candidates are fitted first; afterwards all unseen
+    ``neighbours(candidate)`` of the current best are fitted as one batch and
+    the search moves only while AIC improves, stopping after ``max_fits``
+    models. With ``n_jobs > 1`` one worker pool (and one shared copy of the
+    series) serves every batch. Returns the best record and every record in
+    the order fitted.
+    """
+    records = []
+    seen = set()
+    best_candidate = None
+    best = None
+
+    def fit_batch(batch):
+        batch = [c for c in dict.fromkeys(batch) if c not in seen]
+        batch = batch[:max(0, max_fits - len(records))]
+        seen.update(batch)
+        new_records = fit_candidates(fit_candidate, series, batch, n_jobs=n_jobs,
+                                     executor=executor, workers=workers)
+        records.extend(new_records)
+        return list(zip(batch, new_records))
+
+    with candidate_workers(series, n_jobs) if executor is None else nullcontext() as workers:
+        frontier = fit_batch(initial)
+        while frontier:
+            improved = False
+            for candidate, record in frontier:
+                if _improves(record, best):
+                    best_candidate, best = candidate, record
+                    improved = True
+            if not improved or len(records) >= max_fits:
+                break
+            frontier = fit_batch(neighbours(best_candidate))
+
+    return best, records
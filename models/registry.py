@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+from .arima import find_best_arima_params
+from .exponential_smoothing import _build_model
+from .sarima import find_best_sarima_params
+from .seasonality import resolve_seasonal_period
+
+DEFAULT_REGISTRY_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'startup_ecosystem_forecasting', 'models.sqlite'
+)
+
+
+def series_fingerprint(series):
+    """Hash of a series' values and, when it has one, its index."""
+    digest = hashlib.sha256(np.ascontiguousarray(series, dtype=np.float64).tobytes())
+    index = getattr(series, 'index', None)
+    if index is not None:
+        digest.update(pd.util.hash_pandas_object(pd.Index(index), index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def _es_params(model_fit):
+    """Smoothing parameters and initial states of a Holt-Winters fit as one vector."""
+    params = model_fit.params
+    seasons = np.atleast_1d(np.nan_to_num(params['initial_seasons'], nan=0.0))
+    return np.concatenate([
+        [params['smoothing_level'], params['smoothing_trend'],
+         np.nan_to_num(params['smoothing_seasonal'], nan=0.0),
+         params['initial_level'], params['initial_trend']],
+        seasons if model_fit.model.seasonal else [],
+    ])
+
+
+class ModelRegistry:
+    """Persistent store of chosen model orders and fitted parameters.
+
+    Entries are keyed by a hash of the input series, a preprocessing config
+    and the model spec (family, search settings or orders). Specs are stored
+    as JSON and parameters as packed float64 blobs. The database is only
+    opened on first use and entries are read one key at a time, so a registry
+    is cheap to create and can be passed to worker processes. The oldest
+    entries (by last access) are evicted beyond ``max_entries``, and entries
+    older than ``max_age`` seconds are treated as misses.
+    """
+
+    def __init__(self, path=DEFAULT_REGISTRY_PATH, max_entries=1000, max_age=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        state['_conn'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self):
+        if self._conn is None:
+            if self.path != ':memory:':
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS models ("
+                "key TEXT PRIMARY KEY, spec TEXT NOT NULL, params BLOB, "
+                "created REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(series, model_spec, preprocessing=None):
+        """Hash the series, preprocessing config and model spec."""
+        payload = json.dumps([series_fingerprint(series), preprocessing, model_spec],
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return ``(spec, params)`` stored under ``key``, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            conn = self.connection
+            row = conn.execute(
+                "SELECT spec, params, created FROM models WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.max_age is not None and now - row[2] > self.max_age:
+                conn.execute("DELETE FROM models WHERE key = ?", (key,))
+                conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE models SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+        params = np.frombuffer(row[1], dtype=np.float64).copy() if row[1] is not None else None
+        return json.loads(row[0]), params
+
+    def put(self, key, spec, params=None):
+        """Store a spec (and optional parameter vector) and apply the eviction policy."""
+        now = time.time()
+        blob = np.asarray(params, dtype=np.float64).tobytes() if params is not None else None
+        with self._lock:
+            conn = self.connection
+            conn.execute(
+                "INSERT OR REPLACE INTO models (key, spec, params, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(spec), blob, now, now),
+            )
+            if self.max_age is not None:
+                conn.execute("DELETE FROM models WHERE created < ?", (now - self.max_age,))
+            if self.max_entries is not None:
+                conn.execute(
+                    "DELETE FROM models WHERE key NOT IN ("
+                    "SELECT key FROM models ORDER BY last_access DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+            conn.commit()
+
+    def find_orders(self, family, series, preprocessing=None, **search_kwargs):
+        """Order search that is skipped when the same search was run on the same data.
+
+        ``family`` is ``'ARIMA'`` (returns an order) or ``'SARIMA'`` (returns
+        ``(order, seasonal_order)``); ``search_kwargs`` go to
+        ``find_best_arima_params`` / ``find_best_sarima_params`` and, apart
+        from ``n_jobs``/``executor``, are part of the key. Failed searches are
+        not stored.
+        """
+        if family not in ('ARIMA', 'SARIMA'):
+            raise ValueError(f"Order search is not defined for {family}")
+        search_kwargs.pop('return_table', None)
+        # Parallelism settings do not change the result, so they stay out of the key
+        spec = {name: value for name, value in search_kwargs.items()
+                if name not in ('n_jobs', 'executor')}
+        key = self.make_key(series, {'search': family, **spec}, preprocessing)
+        cached = self.get(key)
+        if cached is not None:
+            spec, _ = cached
+            if family == 'ARIMA':
+                return tuple(spec['order'])
+            return tuple(spec['order']), tuple(spec['seasonal_order'])
+
+        if family == 'ARIMA':
+            order = find_best_arima_params(series, **search_kwargs)
+            if order is not None:
+                self.put(key, {'order': list(order)})
+            return order
+        order, seasonal_order = find_best_sarima_params(series, **search_kwargs)
+        if order is not None:
+            self.put(key, {'order': list(order), 'seasonal_order': list(seasonal_order)})
+        return order, seasonal_order
+
+    def fit_model(self, family, train, order=None, seasonal_order=None, seasonal_period=4,
+                  preprocessing=None):
+        """Fitted model for ``train``, restored from stored parameters when possible.
+
+        ``family`` is ``'ARIMA'``, ``'SARIMA'`` or ``'Exponential Smoothing'``.
+        On a hit the model is rebuilt with its stored parameters held fixed
+        (Kalman filtering for ARIMA/SARIMA, a non-optimised smoothing pass for
+        Holt-Winters) instead of being re-estimated.
+        """
+        if family == 'ARIMA':
+            model = ARIMA(train, order=order)
+            spec = {'family': family, 'order': list(order)}
+        elif family == 'SARIMA':
+            model = SARIMAX(train, order=order, seasonal_order=seasonal_order)
+            spec = {'family': family, 'order': list(order), 'seasonal_order': list(seasonal_order)}
+        elif family == 'Exponential Smoothing':
+            seasonal_period = resolve_seasonal_period(train, seasonal_period)
+            spec = {'family': family, 'seasonal_period': int(seasonal_period)}
+        else:
+            raise ValueError(f"Unknown model: {family}")
+
+        key = self.make_key(train, spec, preprocessing)
+        cached = self.get(key)
+        if family != 'Exponential Smoothing':
+            if cached is not None:
+                return model.filter(cached[1])
+            model_fit = model.fit(disp=False) if family == 'SARIMA' else model.fit()
+            self.put(key, spec, model_fit.params)
+            return model_fit
+
+        if cached is not None:
+            params = cached[1]
+            seasonal = seasonal_period > 1
+            model = _build_model(train, seasonal_period, initialization_method='known',
+                                 initial_level=params[3], initial_trend=params[4],
+                                 initial_seasonal=params[5:] if seasonal else None)
+            return model.fit(smoothing_level=params[0], smoothing_trend=params[1],
+                             smoothing_seasonal=params[2] if seasonal else None,
+                             optimized=False)
+        model_fit = _build_model(train, seasonal_period).fit()
+        self.put(key, spec, _es_params(model_fit))
+        return model_fit
+
+    def stats(self):
+        """Hit/miss counters and current number of stored entries."""
+        with self._lock:
+            entries = self.connection.execute("SELECT COUNT(*) FROM models").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+
+    def clear(self):
+        """Remove every stored entry."""
+        with self._lock:
+            self.connection.execute("DELETE FROM models")
+            self.connection.commit()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
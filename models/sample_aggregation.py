@@ -0,0 +1,112 @@
+import numpy as np
+
+POINT_METHODS = ('median', 'trimmed_mean', 'mean')
+
+
+def aggregate_samples(samples, methods=POINT_METHODS, trim=0.1):
+    """Point aggregates of sample paths shaped (..., num_samples, horizon).
+
+    The samples are sorted once along the sample axis; the median and the
+    trimmed mean (cutting ``int(trim * num_samples)`` samples from each end,
+    as ``scipy.stats.trim_mean`` does) are read off the sorted array. Returns
+    an array shaped (..., len(methods), horizon).
+    """
+    ordered = np.sort(np.asarray(samples, dtype=float), axis=-2)
+    n = ordered.shape[-2]
+    cut = int(trim * n)
+    aggregates = {
+        'median': (ordered[..., (n - 1) // 2, :] + ordered[..., n // 2, :]) / 2,
+        'trimmed_mean': ordered[..., cut:n - cut, :].mean(axis=-2),
+        'mean': ordered.mean(axis=-2),
+    }
+    return np.stack([aggregates[method] for method in methods], axis=-2)
+
+
+def sample_quantiles(samples, levels):
+    """Empirical quantiles of sample paths, shaped (..., len(levels), horizon)."""
+    return np.moveaxis(np.quantile(np.asarray(samples, dtype=float), levels, axis=-2), 0, -2)
+
+
+def smooth_forecasts(forecasts, windows, polyorder=2):
+    """Savitzky-Golay smoothed variants of forecasts shaped (..., horizon).
+
+    Returns (..., len(windows), horizon); a window that is not shorter than
+    the horizon leaves the forecast unsmoothed.
+    """
+    from scipy.signal import savgol_filter
+
+    forecasts = np.asarray(forecasts, dtype=float)
+    horizon = forecasts.shape[-1]
+    return np.stack([
+        savgol_filter(forecasts, window, polyorder, axis=-1) if horizon > window else forecasts
+        for window in windows
+    ], axis=-2)
+
+
+def conformal_quantile(scores, alpha):
+    """The split-conformal quantile of ``scores`` along axis 0.
+
+    That is the ``ceil((n + 1)(1 - alpha))``-th smallest of the ``n`` scores,
+    or infinite when there are too few scores for the requested coverage.
+    """
+    scores = np.asarray(scores, dtype=float)
+    n = len(scores)
+    k = int(np.ceil((n + 1) * (1 - alpha)))
+    if k > n:
+        return np.full(scores.shape[1:], np.inf)
+    return np.sort(scores, axis=0)[k - 1]
+
+
+class ConformalCalibrator:
+    """Split-conformal prediction intervals calibrated on backtest forecasts.
+
+    ``fit(actuals, point)`` calibrates symmetric intervals around point
+    forecasts from absolute residuals; ``fit(actuals, lower=..., upper=...)``
+    instead widens (or narrows) existing bands such as sample quantiles, as
+    in conformalized quantile regression. Arrays are (origins, horizon), so
+    each horizon step gets its own correction; forecasts longer than the
+    calibration horizon reuse its last step's correction for the extra
+    steps. Applying the calibration needs no new model fits or LLM calls.
+    """
+
+    def __init__(self, alpha=0.1):
+        self.alpha = alpha
+        self.correction_ = None
+        self.mode_ = None
+
+    def fit(self, actuals, point=None, lower=None, upper=None):
+        actuals = np.atleast_2d(np.asarray(actuals, dtype=float))
+        if point is not None:
+            scores = np.abs(actuals - np.atleast_2d(point))
+            self.mode_ = 'point'
+        elif lower is not None and upper is not None:
+            scores = np.maximum(np.atleast_2d(lower) - actuals, actuals - np.atleast_2d(upper))
+            self.mode_ = 'band'
+        else:
+            raise ValueError("Calibration needs point forecasts or lower and upper bands")
+        valid = ~np.isnan(scores).any(axis=1)
+        self.correction_ = conformal_quantile(scores[valid], self.alpha)
+        return self
+
+    @classmethod
+    def from_backtest(cls, result, model_name, alpha=0.1):
+        """Calibrate on the point forecasts of one model in a ``BacktestResult``."""
+        k = result.model_names.index(model_name)
+        return cls(alpha).fit(result.actuals, point=result.predictions[k])
+
+    def interval(self, point=None, lower=None, upper=None):
+        """Calibrated ``(lower, upper)`` for new forecasts of the kind used in ``fit``."""
+        if self.correction_ is None:
+            raise ValueError("ConformalCalibrator has not been fitted")
+        if self.mode_ == 'point':
+            point = np.asarray(point, dtype=float)
+            correction = self._correction(point.shape[-1])
+            return point - correction, point + correction
+        lower, upper = np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+        correction = self._correction(lower.shape[-1])
+        return lower - correction, upper + correction
+
+    def _correction(self, horizon):
+        """Per-step corrections for ``horizon`` steps, extending the last calibrated one."""
+        correction = self.correction_[:horizon]
+        return np.pad(correction, (0, horizon - len(correction)), mode='edge')
@@ -1,63 +1,151 @@
+from functools import partial
+
 import numpy as np
 import pandas as pd
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 
-def find_best_sarima_params(series, seasonal_period=4):
-    """Find optimal SARIMA parameters using AIC."""
-    best_aic = float("inf")
-    best_order = None
-    best_seasonal_order = None
-    
-    # Grid search for non-seasonal parameters
-    for p in range(2):
-        for d in range(2):
-            for q in range(2):
-                # Grid search for seasonal parameters
-                for P in range(2):
-                    for D in range(2):
-                        for Q in range(2):
-                            try:
-                                model = SARIMAX(
-                                    series,
-                                    order=(p,d,q),
-                                    seasonal_order=(P,D,Q,seasonal_period)
-                                )
-                                results = model.fit(disp=False)
-                                aic = results.aic
-                                
-                                if aic < best_aic:
-                                    best_aic = aic
-                                    best_order = (p,d,q)
-                                    best_seasonal_order = (P,D,Q,seasonal_period)
-                                    
-                            except:
-                                continue
-                                
+from ..evaluation.splits import split_series
+from .order_search import (
+    fit_candidates,
+    select_best,
+    candidates_table,
+    ndiffs,
+    nsdiffs,
+    neighbouring_orders,
+    stepwise_search,
+)
+from .seasonality import resolve_seasonal_period
+from .walk_forward import walk_forward_forecast, compare_walk_forward
+from ..utils.instrumentation import timed
+
+def _fit_sarima_candidate(series, candidate):
+    """Fit a single SARIMA candidate and report its AIC or why it failed."""
+    order, seasonal_order = candidate
+    record = {'order': order, 'seasonal_order': seasonal_order}
+    try:
+        results = SARIMAX(series, order=order, seasonal_order=seasonal_order).fit(disp=False)
+        record.update(aic=results.aic, error=None)
+    except Exception as e:
+        record.update(aic=None, error=f"{type(e).__name__}: {e}")
+    return record
+
+@timed()
+def find_best_sarima_params(series, seasonal_period=4, max_p=1, max_d=1, max_q=1,
+                            max_P=1, max_D=1, max_Q=1, n_jobs=1, executor=None,
+                            return_table=False, method='grid', max_fits=94,
+                            initial_orders=None):
+    """Find optimal SARIMA parameters using AIC.
+
+    ``seasonal_period='auto'`` detects the period from the data; a period
+    below 2 restricts the search to non-seasonal orders.
+
+    ``method='grid'`` fits every (p,d,q)(P,D,Q) combination up to the given
+    maxima. ``method='stepwise'`` picks ``D`` from the STL seasonal strength
+    and ``d`` from ADF tests on the seasonally differenced series, then walks
+    to neighbouring (p, q, P, Q) orders while AIC improves, fitting at most
+    ``max_fits`` models. ``initial_orders`` (``(order, seasonal_order)`` pairs,
+    e.g. from a similar series) are tried first in stepwise mode.
+
+    Candidates are fitted on ``n_jobs`` worker processes (or on the given
+    ``executor``); ties are broken in search order, as in a serial search. With
+    ``return_table=True`` a DataFrame of every fitted candidate's AIC and failure
+    reason is returned as a third value; its ``attrs`` record how many models
+    were fitted out of the full grid.
+    """
+    seasonal_period = resolve_seasonal_period(series, seasonal_period)
+    if seasonal_period < 2:
+        seasonal_period = max_P = max_D = max_Q = 0
+
+    grid_size = ((max_p + 1) * (max_d + 1) * (max_q + 1)
+                 * (max_P + 1) * (max_D + 1) * (max_Q + 1))
+
+    if method == 'grid':
+        candidates = [((p, d, q), (P, D, Q, seasonal_period))
+                      for p in range(max_p + 1)
+                      for d in range(max_d + 1)
+                      for q in range(max_q + 1)
+                      for P in range(max_P + 1)
+                      for D in range(max_D + 1)
+                      for Q in range(max_Q + 1)]
+        records = fit_candidates(_fit_sarima_candidate, series, candidates,
+                                 n_jobs=n_jobs, executor=executor)
+        best = select_best(records)
+    elif method == 'stepwise':
+        D = nsdiffs(series, seasonal_period, max_D=max_D)
+        values = np.asarray(series, dtype=float)
+        if D:
+            values = values[seasonal_period:] - values[:-seasonal_period]
+        d = ndiffs(values, max_d=max_d)
+
+        def candidate(p, q, P, Q):
+            return ((min(p, max_p), d, min(q, max_q)),
+                    (min(P, max_P), D, min(Q, max_Q), seasonal_period))
+
+        initial = [tuple(order) for order in initial_orders or []]
+        initial += [candidate(2, 2, 1, 1), candidate(0, 0, 0, 0),
+                    candidate(1, 0, 1, 0), candidate(0, 1, 0, 1)]
+
+        def neighbours(current):
+            (p, _, q), (P, _, Q, _) = current
+            return [candidate(*order)
+                    for order in neighbouring_orders((p, q, P, Q), (max_p, max_q, max_P, max_Q),
+                                                     pairs=((0, 1), (2, 3)))]
+
+        best, records = stepwise_search(_fit_sarima_candidate, series, initial, neighbours,
+                                        max_fits=max_fits, n_jobs=n_jobs, executor=executor)
+    else:
+        raise ValueError(f"Unknown order search method: {method}")
+
+    best_order = best['order'] if best is not None else None
+    best_seasonal_order = best['seasonal_order'] if best is not None else None
+
+    if return_table:
+        return best_order, best_seasonal_order, candidates_table(records, grid_size=grid_size)
     return best_order, best_seasonal_order
 
-def evaluate_sarima_model(series, order, seasonal_order, train_size=0.8):
-    """Evaluate SARIMA model using walk-forward validation."""
-    train_size = int(len(series) * train_size)
-    train, test = series[:train_size], series[train_size:]
-    
-    history = [x for x in train]
-    predictions = []
-    
-    for t in range(len(test)):
-        model = SARIMAX(history, order=order, seasonal_order=seasonal_order)
-        model_fit = model.fit(disp=False)
-        yhat = model_fit.forecast()[0]
-        predictions.append(yhat)
-        history.append(test[t])
-        
-    return predictions, test.values
-
-def fit_sarima_model(train, order, seasonal_order):
-    """Fit SARIMA model and return fitted model."""
+@timed()
+def evaluate_sarima_model(series, order, seasonal_order, train_size=0.8, method='refit',
+                          refit_every=None, drift_threshold=None, compare=False):
+    """Evaluate SARIMA model using walk-forward validation.
+
+    ``method='refit'`` re-estimates the model at every step; ``method='update'``
+    fits once and filters new observations in, re-estimating every
+    ``refit_every`` steps or on drift (see ``walk_forward_forecast``). With
+    ``compare=True`` a third value compares the chosen settings against exact
+    refitting.
+    """
+    train, test = split_series(series, train_size)
+    build_model = partial(SARIMAX, order=order, seasonal_order=seasonal_order)
+    fit_kwargs = {'disp': False}
+
+    predictions, _ = walk_forward_forecast(build_model, train, test, fit_kwargs=fit_kwargs,
+                                           method=method, refit_every=refit_every,
+                                           drift_threshold=drift_threshold)
+
+    if compare:
+        comparison = compare_walk_forward(build_model, train, test, fit_kwargs=fit_kwargs,
+                                          refit_every=refit_every,
+                                          drift_threshold=drift_threshold)
+        return list(predictions), test.values, comparison
+    return list(predictions), test.values
+
+def fit_sarima_model(train, order, seasonal_order, start_params=None):
+    """Fit SARIMA model and return fitted model.
+
+    ``start_params`` (e.g. from a similar series) seed the optimiser when
+    their length matches the model's parameter count.
+    """
     try:
         model = SARIMAX(train, order=order, seasonal_order=seasonal_order)
-        model_fit = model.fit(disp=False)
+        if start_params is not None and len(start_params) != len(model.param_names):
+            start_params = None
+        model_fit = model.fit(start_params=start_params, disp=False)
         return model_fit
     except Exception as e:
         print(f"Error fitting SARIMA model: {e}")
-        return None 
\ No newline at end of file
+        return None
+
+def forecast_sarima(train, horizon, order, seasonal_order):
+    """Fit SARIMA on ``train`` and forecast ``horizon`` steps (backtest forecaster)."""
+    model = SARIMAX(np.asarray(train, dtype=float), order=order, seasonal_order=seasonal_order)
+    return model.fit(disp=False).forecast(horizon)
@@ -0,0 +1,48 @@
+import numpy as np
+
+
+def detect_seasonal_period(series, max_period=52, min_period=2):
+    """Detect the dominant seasonal period, or 1 if the series looks non-seasonal.
+
+    Candidate periods are the strongest periodogram peaks and the local ACF
+    maxima of the first-differenced series; the candidate with the highest
+    autocorrelation wins if that autocorrelation is significant at 5%
+    (Bonferroni-corrected for the number of candidates).
+    """
+    from scipy.signal import periodogram
+    from scipy.stats import norm
+    from statsmodels.tsa.stattools import acf
+
+    values = np.asarray(series, dtype=float)
+    x = np.diff(values[~np.isnan(values)])
+    n = len(x)
+    max_period = min(max_period, n // 2)
+    if max_period < min_period:
+        return 1
+
+    correlations = acf(x, nlags=max_period, fft=True)
+
+    candidates = set()
+    freqs, power = periodogram(x, detrend='linear')
+    for i in np.argsort(power[1:])[::-1][:5] + 1:
+        period = int(round(1 / freqs[i]))
+        if min_period <= period <= max_period:
+            candidates.add(period)
+    for lag in range(min_period, max_period):
+        if correlations[lag] > correlations[lag - 1] and correlations[lag] >= correlations[lag + 1]:
+            candidates.add(lag)
+
+    if not candidates:
+        return 1
+    best = max(sorted(candidates), key=lambda period: correlations[period])
+    critical = norm.ppf(1 - 0.025 / len(candidates))
+    if correlations[best] <= critical / np.sqrt(n):
+        return 1
+    return best
+
+
+def resolve_seasonal_period(series, seasonal_period):
+    """Return ``seasonal_period``, detecting it from the data when it is ``'auto'``."""
+    if seasonal_period == 'auto':
+        return detect_seasonal_period(series)
+    return seasonal_period
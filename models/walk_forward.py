@@ -0,0 +1,88 @@
+import time
+
+import numpy as np
+
+from ..utils.instrumentation import count, timed
+
+
+@timed()
+def walk_forward_forecast(build_model, train, test, fit_kwargs=None, method='refit',
+                          refit_every=None, drift_threshold=None):
+    """One-step-ahead walk-forward forecasts over ``test``.
+
+    ``build_model(history)`` must return an unfitted statsmodels state-space
+    model. With ``method='refit'`` the model is re-estimated from scratch at
+    every step. With ``method='update'`` it is fitted once and each new
+    observation is pushed through ``results.extend`` (Kalman filtering only,
+    parameters unchanged). Parameters are re-estimated, warm-started from the
+    current ones, every ``refit_every`` steps or whenever the standardised
+    one-step error exceeds ``drift_threshold``.
+
+    Returns the predictions and the number of full fits performed.
+    """
+    fit_kwargs = fit_kwargs or {}
+    history = [float(x) for x in np.asarray(train, dtype=float)]
+    test = np.asarray(test, dtype=float)
+    predictions = []
+
+    if method == 'refit':
+        for y in test:
+            results = build_model(history).fit(**fit_kwargs)
+            predictions.append(results.forecast()[0])
+            history.append(y)
+        count('model_fits', len(test))
+        return np.array(predictions), len(test)
+    if method != 'update':
+        raise ValueError(f"Unknown walk-forward method: {method}")
+
+    results = build_model(history).fit(**fit_kwargs)
+    n_fits = 1
+    steps_since_fit = 0
+
+    for y in test:
+        forecast = results.get_forecast(1)
+        yhat = forecast.predicted_mean[0]
+        predictions.append(yhat)
+        history.append(y)
+        steps_since_fit += 1
+
+        drifted = False
+        if drift_threshold is not None:
+            se = np.sqrt(forecast.var_pred_mean[0])
+            drifted = se > 0 and abs(y - yhat) / se > drift_threshold
+
+        if (refit_every and steps_since_fit >= refit_every) or drifted:
+            results = build_model(history).fit(start_params=results.params, **fit_kwargs)
+            n_fits += 1
+            steps_since_fit = 0
+        else:
+            results = results.extend([y])
+
+    count('model_fits', n_fits)
+    count('model_updates', len(test) - n_fits + 1)
+    return np.array(predictions), n_fits
+
+
+def compare_walk_forward(build_model, train, test, fit_kwargs=None, refit_every=None,
+                         drift_threshold=None):
+    """Compare incremental updating against exact refitting on the same split.
+
+    Returns the RMSE, number of fits and wall-clock time of both methods, plus
+    the largest absolute gap between their predictions.
+    """
+    test = np.asarray(test, dtype=float)
+    comparison = {}
+    predictions = {}
+    for method in ('refit', 'update'):
+        start = time.perf_counter()
+        preds, n_fits = walk_forward_forecast(build_model, train, test, fit_kwargs=fit_kwargs,
+                                              method=method, refit_every=refit_every,
+                                              drift_threshold=drift_threshold)
+        predictions[method] = preds
+        comparison[method] = {
+            'rmse': float(np.sqrt(np.mean((test - preds) ** 2))),
+            'n_fits': n_fits,
+            'seconds': time.perf_counter() - start,
+        }
+    comparison['max_abs_diff'] = float(np.max(np.abs(predictions['refit'] - predictions['update'])))
+    return comparison
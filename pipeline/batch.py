@@ -0,0 +1,188 @@
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from ..evaluation.splits import split_series
+from ..preprocessing.preprocessor import preprocess_series
+from ..models.arima import find_best_arima_params, evaluate_arima_model
+from ..models.sarima import find_best_sarima_params, evaluate_sarima_model
+from ..models.exponential_smoothing import evaluate_exponential_smoothing
+from ..models.order_search import resolve_n_jobs
+from ..utils.instrumentation import TRACER, call_counted, merge_counted, span
+from ..utils.metrics import calculate_metrics
+from ..utils.shared_memory import SharedArray, SharedPanel
+
+DEFAULT_MODELS = ('ARIMA', 'SARIMA', 'Exponential Smoothing')
+
+# Registry key component describing how series are prepared before searching
+PREPROCESSING = {'preprocess_series': True}
+
+# Numeric result columns returned by workers through a shared result array
+NUMERIC_COLUMNS = ('MAE', 'RMSE', 'R2', 'seconds')
+
+
+def to_wide_panel(panel, id_col='series_id', time_col='date', value_col='value'):
+    """Return a wide (time x series) DataFrame from a wide or long-format panel."""
+    if isinstance(panel, pd.Series):
+        return panel.to_frame(name=panel.name if panel.name is not None else 'series')
+    if {id_col, time_col, value_col}.issubset(panel.columns):
+        panel = panel.pivot_table(index=time_col, columns=id_col, values=value_col)
+        panel.index = pd.DatetimeIndex(panel.index)
+        panel.columns.name = None
+    return panel.sort_index()
+
+
+def _evaluate_model(model, series, train_size, search_method, walk_forward, refit_every,
+                    seasonal_period, registry=None):
+    """Search orders (where needed) and run walk-forward evaluation for one model.
+
+    With a ``registry`` the order searches are looked up before being run.
+    """
+    train, _ = split_series(series, train_size)
+
+    if model == 'ARIMA':
+        if registry is not None:
+            order = registry.find_orders('ARIMA', train, preprocessing=PREPROCESSING,
+                                         method=search_method)
+        else:
+            order = find_best_arima_params(train, method=search_method)
+        preds, actual = evaluate_arima_model(series, order, train_size=train_size,
+                                             method=walk_forward, refit_every=refit_every)
+        return preds, actual, str(order)
+    if model == 'SARIMA':
+        if registry is not None:
+            order, seasonal_order = registry.find_orders('SARIMA', train,
+                                                         preprocessing=PREPROCESSING,
+                                                         seasonal_period=seasonal_period,
+                                                         method=search_method)
+        else:
+            order, seasonal_order = find_best_sarima_params(train, seasonal_period=seasonal_period,
+                                                            method=search_method)
+        preds, actual = evaluate_sarima_model(series, order, seasonal_order,
+                                              train_size=train_size, method=walk_forward,
+                                              refit_every=refit_every)
+        return preds, actual, f"{order}x{seasonal_order}"
+    if model == 'Exponential Smoothing':
+        preds, actual = evaluate_exponential_smoothing(series, seasonal_period=seasonal_period,
+                                                       train_size=train_size)
+        return preds, actual, None
+    raise ValueError(f"Unknown model: {model}")
+
+
+def forecast_series(name, series, models=DEFAULT_MODELS, train_size=0.8, search_method='stepwise',
+                    walk_forward='update', refit_every=None, seasonal_period=4, registry=None):
+    """Preprocess one series and evaluate each model on it.
+
+    Returns one metrics row per model. A failure in preprocessing or in any
+    single model is recorded in that row's ``error`` column instead of being
+    raised.
+    """
+    rows = []
+    try:
+        series, _ = preprocess_series(series.dropna(), verbose=False)
+    except Exception as e:
+        return [{'series': name, 'model': model, 'error': f"preprocessing: {type(e).__name__}: {e}"}
+                for model in models]
+
+    for model in models:
+        row = {'series': name, 'model': model}
+        start = time.perf_counter()
+        try:
+            with span('batch.evaluate', series=name, model=model):
+                preds, actual, spec = _evaluate_model(model, series, train_size, search_method,
+                                                      walk_forward, refit_every, seasonal_period,
+                                                      registry=registry)
+            row.update(calculate_metrics(actual, np.asarray(preds, dtype=float)))
+            row['spec'] = spec
+            row['error'] = None
+        except Exception as e:
+            row['error'] = f"{type(e).__name__}: {e}"
+        row['seconds'] = time.perf_counter() - start
+        rows.append(row)
+    return rows
+
+
+def _forecast_task(task):
+    name, series, kwargs = task
+    return forecast_series(name, series, **kwargs)
+
+
+def _forecast_shared_task(panel, results, j, kwargs):
+    """Evaluate column ``j`` of a shared panel, writing its numeric results into ``results[j]``."""
+    rows = forecast_series(panel.columns[j], panel.series(j), **kwargs)
+    for k, row in enumerate(rows):
+        for m, column in enumerate(NUMERIC_COLUMNS):
+            value = row.pop(column, None)
+            if value is not None:
+                results.array[j, k, m] = value
+    return rows
+
+
+def _run_shared(panel, kwargs, workers):
+    """Spread the columns of ``panel`` over worker processes through shared memory.
+
+    Workers see the panel as zero-copy views and return only model specs and
+    error messages; metrics and timings come back in a preallocated
+    (series, models, NUMERIC_COLUMNS) array.
+    """
+    n_series = panel.shape[1]
+    chunksize = max(1, math.ceil(n_series / (workers * 4)))
+    with SharedPanel(panel) as shared, \
+            SharedArray((n_series, len(kwargs['models']), len(NUMERIC_COLUMNS)), fill=np.nan,
+                        backend=shared.values.backend) as results, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        rows = merge_counted(pool.map(call_counted, repeat(TRACER.enabled),
+                                      repeat(_forecast_shared_task), repeat(shared),
+                                      repeat(results), range(n_series), repeat(kwargs),
+                                      chunksize=chunksize))
+        for j, series_rows in enumerate(rows):
+            for k, row in enumerate(series_rows):
+                row.update(zip(NUMERIC_COLUMNS, results.array[j, k].tolist()))
+    return rows
+
+
+def run_batch(panel, models=DEFAULT_MODELS, n_jobs=1, train_size=0.8, search_method='stepwise',
+              walk_forward='update', refit_every=None, seasonal_period=4, registry=None,
+              id_col='series_id', time_col='date', value_col='value'):
+    """Evaluate every series of a panel and return one consolidated metrics table.
+
+    ``panel`` is a wide DataFrame (one column per series) or a long DataFrame
+    with ``id_col``/``time_col``/``value_col`` columns. Series are spread over
+    ``n_jobs`` worker processes, which read the panel from shared memory
+    rather than receiving pickled copies; within a worker, order searches and
+    walk-forward evaluation run serially. The result has one row per
+    (series, model) with MAE/RMSE/R2, the chosen model spec, run time and any
+    error message, in panel column order. With a ``ModelRegistry`` the order
+    searches of series whose data has not changed since a previous run are
+    skipped.
+    """
+    panel = to_wide_panel(panel, id_col=id_col, time_col=time_col, value_col=value_col)
+    kwargs = {
+        'models': tuple(models),
+        'train_size': train_size,
+        'search_method': search_method,
+        'walk_forward': walk_forward,
+        'refit_every': refit_every,
+        'seasonal_period': seasonal_period,
+        'registry': registry,
+    }
+    tasks = [(name, panel[name], kwargs) for name in panel.columns]
+
+    workers = min(resolve_n_jobs(n_jobs), len(tasks))
+    if workers <= 1:
+        results = [_forecast_task(task) for task in tasks]
+    elif SharedPanel.supports(panel):
+        results = _run_shared(panel, kwargs, workers)
+    else:
+        chunksize = max(1, math.ceil(len(tasks) / (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = merge_counted(pool.map(call_counted, repeat(TRACER.enabled),
+                                             repeat(_forecast_task), tasks, chunksize=chunksize))
+
+    columns = ['series', 'model', 'MAE', 'RMSE', 'R2', 'spec', 'seconds', 'error']
+    rows = [row for series_rows in results for row in series_rows]
+    return pd.DataFrame(rows).reindex(columns=columns)
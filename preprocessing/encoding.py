@@ -0,0 +1,173 @@
+import re
+
+import numpy as np
+
+# Value separator, separator between digits, whether values are written as
+# scaled integers, and how the prompts describe the values, for each
+# serialisation scheme
+SCHEMES = {
+    # "0.123, 0.457": the original LLMTime prompts of this package
+    'decimal': {'separator': ', ', 'digit_separator': '', 'integer': False,
+                'description': "numbers between 0 and 1 with {precision} decimals"},
+    # "123,457": drops the "0." prefix and the space after each comma
+    'integer': {'separator': ',', 'digit_separator': '', 'integer': True,
+                'description': ("integers between 0 and {scale} "
+                                "(the normalized value times {scale})")},
+    # "1 2 3 , 4 5 7": one token per digit, as in the LLMTime paper (Gruver et al., 2023)
+    'spaced': {'separator': ' , ', 'digit_separator': ' ', 'integer': True,
+               'description': ("integers between 0 and {scale} "
+                               "(the normalized value times {scale}) "
+                               "with their digits separated by spaces")},
+}
+
+SYSTEM_PROMPT_TEMPLATE = """You are a time series forecasting model. Given a sequence of numbers, predict the next values in the sequence. 
+        The numbers are normalized between 0 and 1 and written as {description}. Consider the following:
+        1. Look for patterns and trends in the data
+        2. Consider seasonal variations if present
+        3. Account for any recent changes in the trend
+        4. Return your predictions as a comma-separated list of {description}.
+        Do not include any explanations or additional text, just the numbers."""
+
+# Also reads exponents ("1e-3") and a missing leading zero (".5")
+_NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+_SPACED_DIGITS = re.compile(r'(?<=\d) (?=\d)')
+
+
+class ValueEncoder:
+    """Serialise normalised values for LLMTime prompts and parse completions back.
+
+    ``scheme`` is a key of ``SCHEMES``; ``precision`` is the number of
+    decimals kept. Integer schemes write ``round(value * 10**precision)``.
+    """
+
+    def __init__(self, scheme='decimal', precision=3):
+        if scheme not in SCHEMES:
+            raise ValueError(f"Unknown encoding scheme: {scheme}")
+        self.scheme = scheme
+        self.precision = precision
+        self.separator = SCHEMES[scheme]['separator']
+        self.digit_separator = SCHEMES[scheme]['digit_separator']
+        self.integer = SCHEMES[scheme]['integer']
+
+    def format_values(self, values):
+        """Encode each value as a string."""
+        values = np.asarray(values, dtype=float)
+        if not self.integer:
+            return [f"{x:.{self.precision}f}" for x in values]
+        scaled = np.rint(values * 10 ** self.precision).astype(np.int64)
+        if self.digit_separator:
+            return [self.digit_separator.join(str(x)) for x in scaled]
+        return [str(x) for x in scaled]
+
+    def encode(self, values):
+        """Encode values into a single prompt string."""
+        return self.separator.join(self.format_values(values))
+
+    def describe(self):
+        """How values are written, for the prompt instructions."""
+        return SCHEMES[self.scheme]['description'].format(precision=self.precision,
+                                                          scale=10 ** self.precision)
+
+    def system_prompt(self):
+        """LLMTime system prompt asking for values in this encoding."""
+        return SYSTEM_PROMPT_TEMPLATE.format(description=self.describe())
+
+    def decode(self, text, num_predictions=None):
+        """Parse a completion into normalised values.
+
+        Brackets, newlines, stray spaces and any preamble ending in a colon
+        are ignored. Numbers with a decimal point or an exponent are read as
+        normalised values even under an integer scheme, so a model that falls back to
+        decimals is still understood. At most ``num_predictions`` values are
+        returned.
+        """
+        text = text.rsplit(':', 1)[-1]
+        if self.digit_separator:
+            text = _SPACED_DIGITS.sub('', text)
+        values = []
+        for token in _NUMBER.findall(text):
+            if self.integer and not any(c in token for c in '.eE'):
+                values.append(int(token) / 10 ** self.precision)
+            else:
+                values.append(float(token))
+            if num_predictions is not None and len(values) == num_predictions:
+                break
+        return values
+
+
+class StreamingDecoder:
+    """Incrementally parse one streamed completion with a ``ValueEncoder``.
+
+    ``feed`` takes text deltas as they arrive and returns True once
+    ``num_predictions`` values have been read. A number is only parsed after
+    the character that ends it has arrived, so values split across deltas
+    are read correctly.
+    """
+
+    def __init__(self, encoder, num_predictions):
+        self.encoder = encoder
+        self.num_predictions = num_predictions
+        self.values = []
+        self._buffer = ''
+        self._number_chars = set('0123456789.-+eE' + encoder.digit_separator)
+
+    @property
+    def done(self):
+        return len(self.values) >= self.num_predictions
+
+    def _parse(self, text):
+        remaining = self.num_predictions - len(self.values)
+        self.values.extend(self.encoder.decode(text, remaining))
+
+    def feed(self, text):
+        if self.done:
+            return True
+        self._buffer += text
+        end = len(self._buffer)
+        while end and self._buffer[end - 1] in self._number_chars:
+            end -= 1
+        if end:
+            self._parse(self._buffer[:end])
+            self._buffer = self._buffer[end:]
+        return self.done
+
+    def finish(self):
+        """Parse whatever is left once the stream has ended; returns the values."""
+        if self._buffer and not self.done:
+            self._parse(self._buffer)
+        self._buffer = ''
+        return self.values
+
+
+def count_tokens(text, model='gpt-4'):
+    """Number of tokens in ``text``.
+
+    Uses ``tiktoken`` when it is installed. Otherwise it estimates the count
+    the way cl100k-style tokenizers split text: runs of up to three digits,
+    each punctuation mark, and words of about four characters each take one
+    token, with a single leading space merged into the token after it.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        tiktoken = None
+    if tiktoken is not None:
+        try:
+            return len(tiktoken.encoding_for_model(model).encode(text))
+        except KeyError:
+            return len(tiktoken.get_encoding('cl100k_base').encode(text))
+
+    tokens = 0
+    for digits, word, other in re.findall(r' ?(\d+)| ?([A-Za-z]+)|(\S)', text):
+        if digits:
+            tokens += -(-len(digits) // 3)
+        elif word:
+            tokens += -(-len(word) // 4)
+        else:
+            tokens += 1
+    return tokens
+
+
+def tokens_per_value(values, encoder, model='gpt-4'):
+    """Average number of tokens per value when ``values`` are encoded with ``encoder``."""
+    return count_tokens(encoder.encode(values), model=model) / max(len(values), 1)
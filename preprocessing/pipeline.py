@@ -0,0 +1,213 @@
+import numpy as np
+import pandas as pd
+
+from ..utils.instrumentation import span
+from .preprocessor import check_stationarity
+
+
+def _interpolate_columns(X, positions):
+    """Linearly fill NaNs of each column of ``X`` in place (edges take the nearest value)."""
+    for j in range(X.shape[1]):
+        column = X[:, j]
+        missing = np.isnan(column)
+        if missing.any() and not missing.all():
+            column[missing] = np.interp(positions[missing], positions[~missing], column[~missing])
+    return X
+
+
+def _positions(index, n):
+    """Interpolation coordinates: timestamps for a DatetimeIndex, else 0..n-1."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype(float)
+    return np.arange(n, dtype=float)
+
+
+class Interpolate:
+    """Fill missing values by (time-weighted) linear interpolation."""
+
+    def fit(self, X, index=None):
+        return self
+
+    def transform(self, X, index=None):
+        return _interpolate_columns(X, _positions(index, len(X)))
+
+    def inverse_transform(self, X):
+        return X
+
+
+class MaskOutliers:
+    """Replace points outside the Tukey fences with interpolated values.
+
+    Unlike dropping outlier rows this keeps the time index regular. Fences
+    are learnt per column at fit time.
+    """
+
+    def __init__(self, k=1.5):
+        self.k = k
+
+    def fit(self, X, index=None):
+        q1, q3 = np.nanpercentile(X, [25, 75], axis=0)
+        iqr = q3 - q1
+        self.lower_ = q1 - self.k * iqr
+        self.upper_ = q3 + self.k * iqr
+        return self
+
+    def transform(self, X, index=None):
+        X[(X < self.lower_) | (X > self.upper_)] = np.nan
+        return _interpolate_columns(X, _positions(index, len(X)))
+
+    def inverse_transform(self, X):
+        return X
+
+
+class Difference:
+    """Difference each column ``order`` times (``'auto'`` picks 0-2 per column by ADF test).
+
+    The output keeps its length; the leading values lost to differencing are
+    NaN. ``inverse_transform`` integrates forecasts that continue directly
+    after the data the step was fitted on.
+    """
+
+    def __init__(self, order='auto', max_order=2):
+        self.order = order
+        self.max_order = max_order
+
+    def fit(self, X, index=None):
+        if self.order == 'auto':
+            orders = [self._select_order(X[:, j]) for j in range(X.shape[1])]
+        else:
+            orders = [self.order] * X.shape[1]
+        self.orders_ = np.array(orders, dtype=int)
+
+        # Last value of each column at every differencing level, for inversion
+        self.last_ = np.full((max(self.orders_.max(initial=0), 1), X.shape[1]), np.nan)
+        level = X.copy()
+        for k in range(self.orders_.max(initial=0)):
+            self.last_[k] = level[-1]
+            level[1:] -= level[:-1].copy()
+            level[0] = np.nan
+        return self
+
+    def _select_order(self, column):
+        """Mirror ``preprocess_series``: difference while the ADF test rejects stationarity."""
+        values = column[~np.isnan(column)]
+        for d in range(self.max_order):
+            if check_stationarity(values):
+                return d
+            values = np.diff(values)
+        return self.max_order
+
+    def transform(self, X, index=None):
+        for k in range(self.orders_.max(initial=0)):
+            columns = self.orders_ > k
+            if columns.all():
+                X[k + 1:] -= X[k:-1].copy()
+            else:
+                X[k + 1:, columns] -= X[k:-1, columns]
+            X[k, columns] = np.nan
+        return X
+
+    def inverse_transform(self, X):
+        for k in reversed(range(self.orders_.max(initial=0))):
+            columns = self.orders_ > k
+            X[:, columns] = self.last_[k, columns] + np.cumsum(X[:, columns], axis=0)
+        return X
+
+
+class MinMaxScale:
+    """Per-column min-max scaling to ``feature_range``.
+
+    Exposes ``data_min_``/``data_max_`` and accepts ``(n, n_columns)`` arrays
+    in ``transform``/``inverse_transform``, like scikit-learn's MinMaxScaler.
+    """
+
+    def __init__(self, feature_range=(0, 1)):
+        self.feature_range = feature_range
+
+    def fit(self, X, index=None):
+        self.data_min_ = np.nanmin(X, axis=0)
+        self.data_max_ = np.nanmax(X, axis=0)
+        data_range = self.data_max_ - self.data_min_
+        low, high = self.feature_range
+        self.scale_ = (high - low) / np.where(data_range == 0, 1.0, data_range)
+        self.min_ = low - self.data_min_ * self.scale_
+        return self
+
+    def transform(self, X, index=None):
+        X *= self.scale_
+        X += self.min_
+        return X
+
+    def inverse_transform(self, X):
+        X = np.array(X, dtype=float)
+        X -= self.min_
+        X /= self.scale_
+        return X
+
+
+class Pipeline:
+    """Chain of fit/transform preprocessing steps over one series or a panel.
+
+    Data (a Series, a wide DataFrame with one column per series, or an array)
+    is copied once into a float64 (time x series) buffer that every step then
+    modifies in place, column-wise. ``inverse_forecast`` maps forecasts made
+    on the transformed scale back to the original one by undoing the steps in
+    reverse order.
+    """
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+
+    @staticmethod
+    def _to_buffer(data):
+        X = np.array(data, dtype=np.float64)
+        return X.reshape(len(X), -1)
+
+    @staticmethod
+    def _wrap(X, data):
+        if isinstance(data, pd.DataFrame):
+            return pd.DataFrame(X, index=data.index, columns=data.columns)
+        if isinstance(data, pd.Series):
+            return pd.Series(X[:, 0], index=data.index, name=data.name)
+        return X[:, 0] if np.ndim(data) == 1 else X
+
+    def fit(self, data):
+        self.fit_transform(data)
+        return self
+
+    def fit_transform(self, data):
+        index = getattr(data, 'index', None)
+        X = self._to_buffer(data)
+        for step in self.steps:
+            with span(f'preprocess.{type(step).__name__}'):
+                X = step.fit(X, index).transform(X, index)
+        return self._wrap(X, data)
+
+    def transform(self, data):
+        index = getattr(data, 'index', None)
+        X = self._to_buffer(data)
+        for step in self.steps:
+            X = step.transform(X, index)
+        return self._wrap(X, data)
+
+    def inverse_forecast(self, forecast):
+        """Map forecasts that follow the fitted data back to the original scale.
+
+        ``forecast`` is (horizon,) for a single series or (horizon, series).
+        """
+        X = self._to_buffer(forecast)
+        for step in reversed(self.steps):
+            X = step.inverse_transform(X)
+        return self._wrap(X, forecast)
+
+    def get_step(self, step_type):
+        """First step of the given type, or None."""
+        for step in self.steps:
+            if isinstance(step, step_type):
+                return step
+        return None
+
+
+def default_pipeline(k=1.5, order='auto', max_order=2):
+    """The steps of ``preprocess_series``: interpolate, mask outliers, difference, scale."""
+    return Pipeline([Interpolate(), MaskOutliers(k), Difference(order, max_order), MinMaxScale()])
@@ -1,10 +1,10 @@
-import numpy as np
-import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from statsmodels.tsa.stattools import adfuller
+from .encoding import ValueEncoder
+from ..utils.instrumentation import timed
 
 def check_stationarity(series):
     """Check if a time series is stationary using Augmented Dickey-Fuller test."""
+    from statsmodels.tsa.stattools import adfuller
+
     result = adfuller(series)
     return result[1] < 0.05  # p-value < 0.05 indicates stationarity
 
@@ -14,43 +14,51 @@ def remove_outliers(series, n_std=3):
     std = series.std()
     return series[(series > mean - n_std*std) & (series < mean + n_std*std)]
 
-def preprocess_series(series):
-    """Comprehensive preprocessing of time series data."""
-    # 1. Handle missing values
-    series = series.interpolate(method='time')
-    
-    # 2. Remove outliers using IQR method
-    Q1 = series.quantile(0.25)
-    Q3 = series.quantile(0.75)
-    IQR = Q3 - Q1
-    series = series[(series >= Q1 - 1.5*IQR) & (series <= Q3 + 1.5*IQR)]
-    
-    # 3. Check and handle stationarity
-    if not check_stationarity(series):
-        print("Series is not stationary. Applying differencing...")
-        series = series.diff().dropna()
-        if not check_stationarity(series):
+@timed()
+def preprocess_series(series, verbose=True, pipeline=None):
+    """Comprehensive preprocessing of time series data.
+
+    Runs ``pipeline`` (by default ``default_pipeline()``: interpolation, IQR
+    outlier masking, ADF-driven differencing and min-max scaling). Outliers
+    are replaced by interpolated values rather than dropped, so the time index
+    stays regular; the leading points lost to differencing are removed.
+    Returns the processed series and the pipeline's scaling step.
+    """
+    from .pipeline import Difference, MinMaxScale, default_pipeline
+
+    pipeline = pipeline if pipeline is not None else default_pipeline()
+    processed = pipeline.fit_transform(series)
+
+    difference = pipeline.get_step(Difference)
+    if verbose and difference is not None:
+        if difference.orders_[0] >= 1:
+            print("Series is not stationary. Applying differencing...")
+        if difference.orders_[0] >= 2:
             print("Series is still not stationary after first differencing.")
-            # Apply second differencing if needed
-            series = series.diff().dropna()
-    
-    # 4. Normalize the data
-    scaler = MinMaxScaler()
-    scaled_values = scaler.fit_transform(series.values.reshape(-1, 1))
-    series = pd.Series(scaled_values.flatten(), index=series.index)
-    
-    return series, scaler
 
-def preprocess_time_series(series, precision=3):
-    """Preprocess time series data for LLMTime according to paper specifications."""
+    processed = processed.iloc[processed.notna().argmax():]
+    return processed, pipeline.get_step(MinMaxScale)
+
+def preprocess_time_series(series, precision=3, encoding='decimal'):
+    """Preprocess time series data for LLMTime according to paper specifications.
+
+    ``encoding`` is a scheme name from ``preprocessing.encoding.SCHEMES`` or a
+    ``ValueEncoder``; the default keeps the ``0.xxx`` format.
+    """
+    from sklearn.preprocessing import MinMaxScaler
+
+    encoder = encoding if isinstance(encoding, ValueEncoder) else ValueEncoder(encoding, precision)
+
     # 1. Normalize the data to [0,1] range
     scaler = MinMaxScaler()
     scaled_data = scaler.fit_transform(series.values.reshape(-1, 1))
     
     # 2. Format numbers with specified precision
-    formatted_data = [f"{x[0]:.{precision}f}" for x in scaled_data]
+    formatted_data = encoder.format_values(scaled_data[:, 0])
     
     # 3. Create context about the data
     context = f"This is a time series of {len(series)} weekly observations of the NASDAQ Composite Index, representing the health of the tech startup ecosystem. The values are normalized between 0 and 1, where higher values indicate a stronger ecosystem."
+    if encoder.integer:
+        context += f" They are written as {encoder.describe()}."
     
-    return formatted_data, scaler, context 
\ No newline at end of file
+    return formatted_data, scaler, context
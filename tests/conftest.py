@@ -0,0 +1,36 @@
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = 'startup_ecosystem_forecasting'
+
+
+def _import_package():
+    """Make the checkout importable as ``startup_ecosystem_forecasting`` when not installed."""
+    try:
+        import startup_ecosystem_forecasting  # noqa: F401
+        return
+    except ImportError:
+        pass
+    spec = importlib.util.spec_from_file_location(PACKAGE, os.path.join(ROOT, '__init__.py'),
+                                                  submodule_search_locations=[ROOT])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[PACKAGE] = module
+    spec.loader.exec_module(module)
+
+
+_import_package()
+
+
+@pytest.fixture
+def weekly_series():
+    """A trending, seasonal weekly series of 120 points."""
+    rng = np.random.default_rng(0)
+    t = np.arange(120)
+    values = 100 + 0.3 * t + 3 * np.sin(2 * np.pi * t / 4) + rng.normal(0, 1, 120).cumsum()
+    return pd.Series(values, index=pd.date_range('2020-01-05', periods=120, freq='W'))
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from startup_ecosystem_forecasting.data.analytics import analyze_panel
+
+
+@pytest.fixture
+def panel(weekly_series):
+    rng = np.random.default_rng(1)
+    panel = pd.DataFrame({
+        'a': weekly_series,
+        'b': 50 * np.exp(rng.normal(0, 0.02, len(weekly_series)).cumsum()),
+        'c': np.linspace(20, 5, len(weekly_series)),
+    }, index=weekly_series.index)
+    panel.iloc[:15, 1] = np.nan  # listed later
+    panel.iloc[60, 2] = np.nan   # one missing close
+    return panel
+
+
+def test_analyze_panel_matches_pandas(panel):
+    window = 13
+    trends = analyze_panel(panel, volatility_window=window)
+    changes = panel.pct_change(fill_method=None)
+
+    summary = trends.summary
+    np.testing.assert_allclose(summary['avg_weekly_change'], changes.mean() * 100)
+    np.testing.assert_allclose(summary['weekly_std'], changes.std() * 100)
+    np.testing.assert_array_equal(summary['observations'], panel.count())
+    first = panel.apply(lambda s: s.dropna().iloc[0])
+    last = panel.apply(lambda s: s.dropna().iloc[-1])
+    np.testing.assert_allclose(summary['total_growth'], (last / first - 1) * 100)
+    assert summary.loc['b', 'start'] == panel.index[15]
+
+    pd.testing.assert_frame_equal(trends.rolling_volatility,
+                                  changes.rolling(window).std() * 100, check_freq=False)
+    drawdown = (panel / panel.cummax() - 1) * 100
+    pd.testing.assert_frame_equal(trends.drawdown, drawdown, check_freq=False)
+    np.testing.assert_allclose(summary['max_drawdown'], drawdown.min())
+
+    quarterly = panel.resample('QE').mean().pct_change(fill_method=None) * 100
+    pd.testing.assert_frame_equal(trends.quarterly_growth, quarterly.iloc[1:], check_freq=False)
+
+
+def test_analyze_panel_accepts_arrays_and_series(panel):
+    from_frame = analyze_panel(panel).summary
+    from_array = analyze_panel(panel.to_numpy(), columns=panel.columns).summary
+    pd.testing.assert_frame_equal(from_array.drop(columns=['start', 'end']),
+                                  from_frame.drop(columns=['start', 'end']))
+    single = analyze_panel(panel['a']).for_series('a')
+    assert single['total_growth'] == pytest.approx(from_frame.loc['a', 'total_growth'])
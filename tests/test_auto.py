@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from startup_ecosystem_forecasting.models import auto
+
+
+def test_non_seasonal_series_considers_holt():
+    rng = np.random.default_rng(3)
+    values = 100 + 0.5 * np.arange(80) + rng.normal(0, 1, 80).cumsum()
+    config = auto.auto_configure(values, seasonal_period=1, horizon=2, n_origins=2,
+                                 families=('ARIMA', 'Holt-Winters'))
+    assert set(config['rmse']) == {'ARIMA', 'Holt-Winters'}
+    assert np.isfinite(config['rmse']['Holt-Winters'])
+
+
+def test_every_candidate_failing_raises(monkeypatch, weekly_series):
+    def broken(train, horizon, **kwargs):
+        raise RuntimeError("no fit")
+
+    monkeypatch.setattr(auto, 'forecast_exponential_smoothing', broken)
+    with pytest.raises(ValueError, match="Every candidate model failed.*no fit"):
+        auto.auto_configure(weekly_series, seasonal_period=4, horizon=2, n_origins=2,
+                            families=('Holt-Winters',))
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from startup_ecosystem_forecasting.pipeline.batch import run_batch, to_wide_panel
+
+MODELS = ('ARIMA', 'Exponential Smoothing')
+
+
+@pytest.fixture
+def panel(weekly_series):
+    rng = np.random.default_rng(2)
+    panel = pd.DataFrame({
+        'a': weekly_series,
+        'b': 200 + rng.normal(0, 2, len(weekly_series)).cumsum(),
+        'broken': np.nan,
+    }, index=weekly_series.index)
+    panel.iloc[-3:, 2] = [1.0, 2.0, 3.0]  # too short to preprocess or fit
+    return panel
+
+
+def _long(panel):
+    return (panel.rename_axis('date').reset_index()
+            .melt(id_vars='date', var_name='series_id', value_name='value'))
+
+
+def test_to_wide_panel_accepts_wide_and_long(panel):
+    pd.testing.assert_frame_equal(to_wide_panel(panel), panel)
+    wide = to_wide_panel(_long(panel))
+    # pivot_table drops the rows that are NaN in the long format
+    pd.testing.assert_frame_equal(wide, panel, check_freq=False, check_names=False)
+    series = to_wide_panel(panel['a'])
+    assert list(series.columns) == ['a']
+
+
+def test_failing_series_is_isolated(panel):
+    results = run_batch(panel, models=MODELS, search_method='stepwise')
+    assert list(results['series']) == ['a', 'a', 'b', 'b', 'broken', 'broken']
+    good = results[results['series'] != 'broken']
+    assert good['error'].isna().all()
+    assert np.isfinite(good['RMSE']).all()
+    broken = results[results['series'] == 'broken']
+    assert broken['error'].notna().all()
+    assert broken['RMSE'].isna().all()
+
+
+def test_long_input_and_parallel_runs_match_serial(panel):
+    serial = run_batch(panel, models=MODELS)
+    from_long = run_batch(_long(panel), models=MODELS)
+    parallel = run_batch(panel, models=MODELS, n_jobs=2)
+    columns = ['series', 'model', 'MAE', 'RMSE', 'R2', 'spec', 'error']
+    pd.testing.assert_frame_equal(from_long[columns], serial[columns])
+    pd.testing.assert_frame_equal(parallel[columns], serial[columns])
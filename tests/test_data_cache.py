@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from startup_ecosystem_forecasting.data import cache as cache_module
+from startup_ecosystem_forecasting.data.cache import DataCache
+
+
+class RecordingSource:
+    """Daily closes up to ``published`` (exclusive); records every fetched range."""
+
+    def __init__(self, published):
+        self.published = pd.Timestamp(published)
+        self.fetches = []
+
+    def fetch(self, ticker, start, end):
+        self.fetches.append((pd.Timestamp(start), pd.Timestamp(end)))
+        index = pd.date_range(start, min(pd.Timestamp(end), self.published), freq='D',
+                              inclusive='left')
+        return pd.Series(range(len(index)), index=index, dtype=float, name=ticker) \
+            + index.dayofyear.to_numpy()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DataCache(str(tmp_path))
+
+
+def test_second_call_fetches_only_missing_dates(cache):
+    source = RecordingSource('2024-01-01')
+    cache.get_daily('X', '2023-03-01', '2023-06-01', source=source)
+    daily = cache.get_daily('X', '2023-01-01', '2023-09-01', source=source)
+
+    assert source.fetches[1:] == [(pd.Timestamp('2023-01-01'), pd.Timestamp('2023-03-01')),
+                                  (pd.Timestamp('2023-06-01'), pd.Timestamp('2023-09-01'))]
+    assert daily.index.min() == pd.Timestamp('2023-01-01')
+    assert daily.index.max() == pd.Timestamp('2023-08-31')
+
+    cache.get_daily('X', '2023-02-01', '2023-08-01', source=source)
+    assert len(source.fetches) == 3
+
+
+def test_unpublished_dates_are_fetched_on_a_later_run(cache, monkeypatch):
+    source = RecordingSource('2024-01-11')
+    monkeypatch.setattr(cache_module, '_today', lambda: pd.Timestamp('2024-01-11'))
+    first = cache.get_daily('X', '2024-01-01', '2024-02-01', source=source)
+    assert first.index.max() == pd.Timestamp('2024-01-10')
+
+    # A week later new closes are published and a later ``end`` is requested
+    source.published = pd.Timestamp('2024-01-18')
+    monkeypatch.setattr(cache_module, '_today', lambda: pd.Timestamp('2024-01-18'))
+    second = cache.get_daily('X', '2024-01-01', '2024-03-01', source=source)
+
+    assert source.fetches[-1] == (pd.Timestamp('2024-01-11'), pd.Timestamp('2024-03-01'))
+    assert second.index.max() == pd.Timestamp('2024-01-17')
+    pd.testing.assert_series_equal(second[:len(first)], first, check_freq=False)
+
+
+def test_offline_serves_cached_dates_only(cache):
+    source = RecordingSource('2024-01-01')
+    cache.get_daily('X', '2023-01-01', '2023-02-01', source=source)
+    daily = cache.get_daily('X', '2023-01-01', '2023-03-01', offline=True)
+    assert daily.index.max() == pd.Timestamp('2023-01-31')
+    assert len(source.fetches) == 1
+
+    with pytest.raises(FileNotFoundError):
+        cache.get_daily('Y', '2023-01-01', '2023-02-01', offline=True)
+
+
+def test_weekly_resample_is_reused(cache):
+    source = RecordingSource('2024-01-01')
+    first = cache.get_weekly('X', '2023-01-01', '2023-07-01', source=source)
+    second = cache.get_weekly('X', '2023-01-01', '2023-07-01', source=source)
+    pd.testing.assert_series_equal(first, second, check_freq=False)
+    assert len(source.fetches) == 1
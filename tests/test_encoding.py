@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from startup_ecosystem_forecasting.models import llmtime
+from startup_ecosystem_forecasting.preprocessing.encoding import (
+    SCHEMES, StreamingDecoder, ValueEncoder,
+)
+
+
+def test_decode_reads_exponents_and_leading_dots():
+    values = ValueEncoder('decimal').decode("0.1, 0.2, 1e-3, .5, 0.6")
+    np.testing.assert_allclose(values, [0.1, 0.2, 0.001, 0.5, 0.6])
+
+
+def test_integer_scheme_keeps_decimal_fallback():
+    encoder = ValueEncoder('integer', precision=3)
+    np.testing.assert_allclose(encoder.decode("Answer: 123,457,.25,2.5E-1"),
+                               [0.123, 0.457, 0.25, 0.25])
+
+
+@pytest.mark.parametrize('scheme', list(SCHEMES))
+def test_encode_decode_round_trip(scheme):
+    values = np.array([0.0, 0.123, 0.5, 0.999, 1.0])
+    encoder = ValueEncoder(scheme)
+    np.testing.assert_allclose(encoder.decode(encoder.encode(values)), values)
+
+
+def test_streaming_decoder_handles_exponents_split_across_deltas():
+    decoder = StreamingDecoder(ValueEncoder('decimal'), 3)
+    for delta in ["0.1, 1", "e", "-3, .", "5, 0.9"]:
+        decoder.feed(delta)
+    assert decoder.done
+    np.testing.assert_allclose(decoder.values, [0.1, 0.001, 0.5])
+
+
+@pytest.mark.parametrize('scheme', list(SCHEMES))
+def test_system_prompt_follows_the_encoding(scheme):
+    encoder = ValueEncoder(scheme)
+    prompt = encoder.system_prompt()
+    assert encoder.describe() in prompt
+    request = llmtime._make_request("prompt", 1, 0.5, system_prompt=prompt)
+    assert request['messages'][0]['content'] == prompt
+    if encoder.integer:
+        assert "numbers between 0 and 1" not in prompt
+    else:
+        assert prompt == llmtime.SYSTEM_PROMPT
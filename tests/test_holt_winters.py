@@ -0,0 +1,46 @@
+import warnings
+
+import numpy as np
+import pytest
+from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+from startup_ecosystem_forecasting.benchmarks.bench_holt_winters import synthetic_panel
+from startup_ecosystem_forecasting.models.holt_winters import BatchHoltWinters, initial_states
+
+M = 4
+
+
+@pytest.fixture
+def panel():
+    return synthetic_panel(5, 120, M, seed=3)
+
+
+def _statsmodels(y, level, trend, seasons):
+    return ExponentialSmoothing(y, seasonal_periods=M, trend='add', seasonal='add',
+                                initialization_method='known', initial_level=level,
+                                initial_trend=trend, initial_seasonal=seasons)
+
+
+def test_fixed_parameters_match_statsmodels(panel):
+    alpha, beta, gamma = np.array([0.3, 0.5, 0.2, 0.8, 0.1]), 0.1, 0.15
+    batch = BatchHoltWinters(M).fit(panel, alpha=alpha, beta=beta, gamma=gamma)
+    forecasts = batch.forecast(9)
+    level, trend, seasons = initial_states(panel, M)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for i, y in enumerate(panel):
+            fit = _statsmodels(y, level[i], trend[i], seasons[i]).fit(
+                smoothing_level=alpha[i], smoothing_trend=beta, smoothing_seasonal=gamma,
+                optimized=False)
+            np.testing.assert_allclose(forecasts[i], fit.forecast(9), rtol=0, atol=1e-9)
+            assert batch.sse[i] / fit.sse == pytest.approx(1.0, abs=1e-9)
+
+
+def test_optimised_fit_is_as_good_as_statsmodels(panel):
+    batch = BatchHoltWinters(M).fit(panel)
+    level, trend, seasons = initial_states(panel, M)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        sse = np.array([_statsmodels(y, level[i], trend[i], seasons[i]).fit().sse
+                        for i, y in enumerate(panel)])
+    assert np.all(batch.sse / sse < 1.05)
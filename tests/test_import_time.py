@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from startup_ecosystem_forecasting.benchmarks import bench_import_time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET = 1.0  # seconds, as in ``bench_import_time --budget``
+
+
+@pytest.fixture
+def importable(tmp_path, monkeypatch):
+    """Let fresh interpreters import the checkout under the package name."""
+    os.symlink(ROOT, tmp_path / 'startup_ecosystem_forecasting')
+    monkeypatch.setenv('PYTHONPATH', str(tmp_path))
+
+
+@pytest.mark.parametrize('target', list(bench_import_time.TARGETS))
+def test_import_stays_light(importable, target):
+    seconds, heavy = bench_import_time.measure(bench_import_time.TARGETS[target], repeat=2)
+    assert heavy == []
+    assert seconds < BUDGET
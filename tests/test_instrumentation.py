@@ -0,0 +1,101 @@
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from startup_ecosystem_forecasting.utils import instrumentation
+from startup_ecosystem_forecasting.utils.instrumentation import (
+    TRACER, call_counted, count, merge_counted, span, timed,
+)
+
+
+@pytest.fixture
+def tracer():
+    yield instrumentation.enable()
+    instrumentation.disable()
+    TRACER.reset()
+
+
+def _count_items(items):
+    for _ in items:
+        count('items')
+    return len(items)
+
+
+def test_nested_spans_record_parents_and_durations(tracer):
+    @timed('leaf')
+    def leaf():
+        time.sleep(0.01)
+
+    with span('outer', stage='fit'):
+        with span('inner'):
+            leaf()
+        leaf()
+
+    spans = {s['name']: s for s in tracer.spans if s['name'] != 'leaf'}
+    leaves = [s for s in tracer.spans if s['name'] == 'leaf']
+    outer, inner = spans['outer'], spans['inner']
+    assert outer['parent'] is None and outer['depth'] == 0
+    assert outer['attrs'] == {'stage': 'fit'}
+    assert inner['parent'] == outer['id'] and inner['depth'] == 1
+    in_inner, in_outer = sorted(leaves, key=lambda s: s['parent'] != inner['id'])
+    assert (in_inner['parent'], in_outer['parent']) == (inner['id'], outer['id'])
+    assert all(s['duration_us'] >= 10_000 for s in leaves)
+    assert inner['duration_us'] >= in_inner['duration_us']
+    assert outer['duration_us'] >= inner['duration_us'] + in_outer['duration_us']
+    summary = tracer.summary().set_index('span')
+    assert summary.loc['leaf', 'calls'] == 2
+
+
+def test_counts_from_workers_are_merged(tracer):
+    count('items', 2)
+    batches = [[1, 2], [3], [4, 5, 6]]
+    with ProcessPoolExecutor(2) as pool:
+        outcomes = list(pool.map(call_counted, [TRACER.enabled] * 3, [_count_items] * 3, batches))
+    assert merge_counted(outcomes) == [2, 1, 3]
+    assert tracer.counters['items'] == 8
+
+    # In-process calls keep their counts apart until merged
+    result, counts = call_counted(True, _count_items, [1, 2, 3])
+    assert (result, counts) == (3, {'items': 3})
+    assert tracer.counters['items'] == 8
+
+
+def test_chrome_trace_schema(tracer, tmp_path):
+    with span('outer', n=3):
+        with span('inner'):
+            pass
+    count('requests', 4)
+    tracer.save_chrome_trace(tmp_path / 'trace.json')
+    trace = json.loads((tmp_path / 'trace.json').read_text())
+
+    events = trace['traceEvents']
+    complete = [event for event in events if event['ph'] == 'X']
+    assert [event['name'] for event in complete] == ['outer', 'inner']
+    for event in complete:
+        assert {'name', 'ph', 'ts', 'dur', 'pid', 'tid', 'args'} <= set(event)
+        assert event['ts'] >= 0 and event['dur'] >= 0
+    assert complete[0]['args'] == {'n': '3'}
+    assert complete[0]['ts'] <= complete[1]['ts']
+    assert complete[1]['ts'] + complete[1]['dur'] <= complete[0]['ts'] + complete[0]['dur']
+    counters = [event for event in events if event['ph'] == 'C']
+    assert counters == [{'name': 'requests', 'ph': 'C', 'ts': counters[0]['ts'],
+                         'pid': counters[0]['pid'], 'args': {'requests': 4}}]
+
+
+def test_disabled_tracer_records_nothing():
+    instrumentation.disable()
+    TRACER.reset()
+
+    @timed()
+    def work():
+        count('calls')
+        return 1
+
+    with span('outer') as record:
+        assert work() == 1
+    assert record is None
+    assert TRACER.spans == [] and dict(TRACER.counters) == {}
+    assert call_counted(False, _count_items, [1, 2]) == (2, {})
+    assert TRACER.to_chrome_trace()['traceEvents'] == []
@@ -0,0 +1,111 @@
+import asyncio
+import types
+from functools import partial
+
+import pytest
+
+from startup_ecosystem_forecasting.models import llm_backends
+from startup_ecosystem_forecasting.models.llm_backends import (
+    InProcessBackend, LLMBackend, LocalHTTPBackend, OpenAIBackend, get_backend,
+)
+from startup_ecosystem_forecasting.models.llm_requests import _stream
+from startup_ecosystem_forecasting.preprocessing.encoding import StreamingDecoder, ValueEncoder
+
+HORIZON = 5
+REQUEST = {'model': 'any', 'temperature': 0.5, 'max_tokens': 100,
+           'messages': [{'role': 'system', 'content': 'system'},
+                        {'role': 'user', 'content': f'predict the next {HORIZON} values'}]}
+
+
+def test_get_backend_selects_by_name(monkeypatch):
+    assert type(get_backend('openai', model='gpt-4o')) is OpenAIBackend
+    assert get_backend('openai', model='gpt-4o').model == 'gpt-4o'
+    local = get_backend('local', model='llama', base_url='http://host:1234/v1')
+    assert type(local) is LocalHTTPBackend and local.base_url == 'http://host:1234/v1'
+    assert type(get_backend('mock')) is InProcessBackend
+    with pytest.raises(ValueError, match="Unknown LLM backend"):
+        get_backend('nope')
+
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+        asyncio.run(OpenAIBackend().create(**REQUEST, n=1))
+
+
+def test_openai_backend_forwards_to_its_client():
+    seen = []
+
+    async def create(**request):
+        seen.append(request)
+        return types.SimpleNamespace(choices=[])
+
+    backend = OpenAIBackend(model='gpt-4o')
+    backend._client = types.SimpleNamespace(
+        chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+    asyncio.run(backend.chat.completions.create(**REQUEST, n=2))
+    assert seen[0]['model'] == 'gpt-4o' and seen[0]['n'] == 2
+
+
+def test_requests_are_split_into_batches_and_timed():
+    sizes = []
+
+    def generate(prompt, n, temperature, max_tokens):
+        sizes.append(n)
+        return [f"0.{i}" for i in range(n)]
+
+    backend = InProcessBackend(generate=generate, max_batch=3)
+    response = asyncio.run(backend.chat.completions.create(**REQUEST, n=8))
+    assert sorted(sizes) == [2, 3, 3]
+    assert len(response.choices) == 8
+    asyncio.run(backend.chat.completions.create(**REQUEST, n=2))
+    stats = backend.latency_stats()
+    assert stats['requests'] == 2
+    assert 0 <= stats['p50'] <= stats['p95']
+
+
+def test_mock_backend_is_deterministic():
+    backend = get_backend('mock')
+    first = asyncio.run(backend.chat.completions.create(**REQUEST, n=3))
+    second = asyncio.run(backend.chat.completions.create(**REQUEST, n=3))
+    texts = [choice.message.content for choice in first.choices]
+    assert texts == [choice.message.content for choice in second.choices]
+    assert all(len(ValueEncoder().decode(text)) == HORIZON for text in texts)
+
+
+class GeneratorBackend(LLMBackend):
+    """Streams ``3 * HORIZON`` values per sample from async generators that record closing."""
+
+    def __init__(self, max_batch=None):
+        super().__init__(max_batch=max_batch)
+        self.tokens = 0
+        self.closed = []
+
+    async def _create(self, **request):
+        state = {'closed': False}
+        self.closed.append(state)
+        return self._generate(request['n'], state)
+
+    async def _generate(self, n, state):
+        try:
+            for step in range(3 * HORIZON):
+                await asyncio.sleep(0)
+                self.tokens += n
+                yield types.SimpleNamespace(choices=[
+                    types.SimpleNamespace(index=i, delta=types.SimpleNamespace(content="0.5, "),
+                                          finish_reason=None)
+                    for i in range(n)
+                ])
+        finally:
+            state['closed'] = True
+
+
+@pytest.mark.parametrize('max_batch', [None, 1, 3])
+def test_streams_close_early_with_and_without_batching(max_batch):
+    backend = GeneratorBackend(max_batch=max_batch)
+    stop = partial(StreamingDecoder, ValueEncoder(), HORIZON)
+    texts = asyncio.run(_stream(backend, dict(REQUEST, n=4), stop))
+
+    assert all(len(ValueEncoder().decode(text)) >= HORIZON for text in texts)
+    assert all(state['closed'] for state in backend.closed)
+    # Parts are read concurrently, so every sample stops near the horizon
+    assert backend.tokens <= 4 * (HORIZON + 2)
+    assert len(backend.latencies) == 1
@@ -0,0 +1,70 @@
+import types
+
+import pytest
+
+from startup_ecosystem_forecasting.models import llm_cache
+from startup_ecosystem_forecasting.models.llm_cache import LLMResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for ``time.time`` in the cache module."""
+    now = {'t': 1000.0}
+    monkeypatch.setattr(llm_cache, 'time', types.SimpleNamespace(time=lambda: now['t']))
+    return now
+
+
+def _cache(tmp_path, **kwargs):
+    return LLMResponseCache(str(tmp_path / 'llm.sqlite'), **kwargs)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = _cache(tmp_path, max_entries=2)
+    cache.put('a', ['0.1'])
+    clock['t'] += 1
+    cache.put('b', ['0.2'])
+    clock['t'] += 1
+    assert cache.get('a') == ['0.1']  # 'a' is now more recent than 'b'
+    clock['t'] += 1
+    cache.put('c', ['0.3'])
+    assert cache.get('b') is None
+    assert cache.get('a') == ['0.1']
+    assert cache.get('c') == ['0.3']
+    cache.close()
+
+
+def test_entries_expire_after_max_age(tmp_path, clock):
+    cache = _cache(tmp_path, max_age=60)
+    cache.put('old', ['0.1'])
+    clock['t'] += 30
+    cache.put('new', ['0.2'])
+    assert cache.get('old') == ['0.1']
+    clock['t'] += 31
+    # Reading does not refresh an entry's age
+    assert cache.get('old') is None
+    assert cache.get('new') == ['0.2']
+    assert cache.stats()['entries'] == 1
+    cache.close()
+
+
+def test_stats_and_clear(tmp_path):
+    cache = _cache(tmp_path)
+    key = LLMResponseCache.make_key('gpt-4', 'system', 'prompt', 0.5, 2, 100)
+    assert key != LLMResponseCache.make_key('gpt-4', 'system', 'prompt', 0.7, 2, 100)
+    assert cache.get(key) is None
+    cache.put(key, ['0.1, 0.2', '0.3, 0.4'])
+    assert cache.get(key) == ['0.1, 0.2', '0.3, 0.4']
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1}
+
+    cache.clear()
+    assert cache.stats()['entries'] == 0
+    assert cache.get(key) is None
+    cache.close()
+
+    # Entries persist across instances
+    cache = _cache(tmp_path)
+    cache.put(key, ['0.5'])
+    cache.close()
+    reopened = _cache(tmp_path)
+    assert reopened.get(key) == ['0.5']
+    reopened.close()
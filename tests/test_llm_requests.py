@@ -0,0 +1,114 @@
+import asyncio
+import time
+import types
+
+import pytest
+
+from startup_ecosystem_forecasting.models.llm_cache import LLMResponseCache
+from startup_ecosystem_forecasting.models.llm_requests import acomplete_many, retry_after
+from startup_ecosystem_forecasting.utils import instrumentation
+
+
+class StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = types.SimpleNamespace(headers=headers or {})
+
+
+class StubCompletions:
+    """Async ``chat.completions`` stand-in that fails the first calls with ``errors``."""
+
+    def __init__(self, delay=0.02, errors=()):
+        self.delay = delay
+        self.errors = list(errors)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **request):
+        self.calls.append(time.monotonic())
+        if self.errors:
+            raise self.errors.pop(0)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        text = request['messages'][1]['content']
+        choices = [types.SimpleNamespace(message=types.SimpleNamespace(content=f"echo {text}"))
+                   for _ in range(request['n'])]
+        return types.SimpleNamespace(choices=choices, usage=None)
+
+
+def stub_client(**kwargs):
+    return types.SimpleNamespace(chat=types.SimpleNamespace(completions=StubCompletions(**kwargs)))
+
+
+def make_requests(k):
+    return [{'model': 'stub', 'temperature': 0.1, 'n': 2, 'max_tokens': 10,
+             'messages': [{'role': 'system', 'content': 'sys'},
+                          {'role': 'user', 'content': f"prompt {i}"}]}
+            for i in range(k)]
+
+
+@pytest.fixture
+def tracer():
+    tracer = instrumentation.enable()
+    yield tracer
+    instrumentation.disable()
+
+
+def test_concurrency_is_capped():
+    client = stub_client(delay=0.05)
+    results = asyncio.run(acomplete_many(make_requests(10), client=client, max_concurrency=3))
+    assert client.chat.completions.max_in_flight == 3
+    assert results[4] == ['echo prompt 4', 'echo prompt 4']
+
+
+@pytest.mark.parametrize('status', [429, 500, 503])
+def test_retryable_errors_back_off_and_succeed(status, tracer):
+    client = stub_client(errors=[StatusError(status), StatusError(status)])
+    results = asyncio.run(acomplete_many(make_requests(1), client=client, base_delay=0.05))
+    calls = client.chat.completions.calls
+    assert results[0] == ['echo prompt 0', 'echo prompt 0']
+    assert len(calls) == 3
+    assert calls[1] - calls[0] >= 0.05
+    assert calls[2] - calls[1] >= 0.1
+    assert tracer.counters['llm_calls'] == 1
+    assert tracer.counters['llm_retries'] == 2
+
+
+def test_retry_after_header_is_honoured():
+    client = stub_client(errors=[StatusError(429, {'Retry-After': '0.3'})])
+    asyncio.run(acomplete_many(make_requests(1), client=client, base_delay=0.001))
+    calls = client.chat.completions.calls
+    assert calls[1] - calls[0] >= 0.3
+
+
+def test_retry_after_parsing():
+    assert retry_after(StatusError(429, {'retry-after-ms': '1500'})) == 1.5
+    assert retry_after(StatusError(429, {'Retry-After': '2'})) == 2.0
+    assert retry_after(StatusError(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0.0
+    assert retry_after(StatusError(429)) is None
+
+
+def test_non_retryable_errors_are_returned_without_retry():
+    client = stub_client(errors=[StatusError(400)])
+    results = asyncio.run(acomplete_many(make_requests(1), client=client, base_delay=0.001))
+    assert isinstance(results[0], StatusError)
+    assert len(client.chat.completions.calls) == 1
+
+
+def test_cache_hits_skip_the_client(tmp_path, tracer):
+    cache = LLMResponseCache(str(tmp_path / 'llm.sqlite'))
+    requests = make_requests(3)
+    first = asyncio.run(acomplete_many(requests, client=stub_client(), cache=cache))
+
+    client = stub_client()
+    second = asyncio.run(acomplete_many(requests, client=client, cache=cache))
+    assert second == first
+    assert client.chat.completions.calls == []
+    assert tracer.counters['llm_cache_hits'] == 3
+    assert tracer.counters['llm_calls'] == 3
@@ -0,0 +1,41 @@
+import types
+
+import numpy as np
+
+from startup_ecosystem_forecasting.models.llmtime import optimize_llmtime_parameters
+
+
+class ConstantCompletions:
+    """Every sample predicts the middle of the normalised range, at any temperature."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def create(self, model, messages, temperature, n, max_tokens):
+        self.requests.append({'temperature': temperature, 'n': n})
+        horizon = int(messages[1]['content'].split('predict the next ')[1].split()[0])
+        content = ', '.join(['0.500'] * horizon)
+        return types.SimpleNamespace(choices=[
+            types.SimpleNamespace(message=types.SimpleNamespace(content=content))
+            for _ in range(n)
+        ])
+
+
+def test_one_request_per_window_and_temperature_and_first_tie_wins(weekly_series):
+    train, test = weekly_series[:100], weekly_series[100:]
+    completions = ConstantCompletions()
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=completions))
+
+    predictions, params, error = optimize_llmtime_parameters(
+        train, test, window_sizes=[40], temperatures=[0.1, 0.05], num_samples_list=[4, 2],
+        smoothing_windows=[3, 5], client=client,
+    )
+
+    # Sample counts share one request per (window, temperature) for the largest count
+    assert sorted(r['temperature'] for r in completions.requests) == [0.05, 0.1]
+    assert all(r['n'] == 4 for r in completions.requests)
+    # Every candidate scores the same, so the first one in grid order is kept
+    assert params == {'window_size': 40, 'temperature': 0.1, 'num_samples': 4,
+                      'agg_method': 'median', 'smoothing_window': 3}
+    assert np.isfinite(error)
+    assert len(predictions) == len(test)
@@ -0,0 +1,100 @@
+import asyncio
+import types
+
+import numpy as np
+import pytest
+
+from startup_ecosystem_forecasting.models.llmtime import (
+    _parse_predictions, get_llmtime_predictions_many,
+)
+
+HORIZON = 10
+
+
+class FakeStream:
+    """Async iterator over chunks that records how many deltas were consumed."""
+
+    def __init__(self, chunks, consumed):
+        self.chunks = chunks
+        self.consumed = consumed
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            if self.closed:
+                return
+            await asyncio.sleep(0)
+            self.consumed['tokens'] += len(chunk.choices)
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeCompletions:
+    """Samples of ``extra * HORIZON`` values (one token each); the last stops after ``short``."""
+
+    def __init__(self, extra=2.0, short=6):
+        self.extra = extra
+        self.short = short
+        self.consumed = {'tokens': 0}
+        self.streams = []
+
+    def _samples(self, n):
+        lengths = [int(self.extra * HORIZON)] * (n - 1) + [self.short]
+        return [[f"0.{100 + i:03d}, " for i in range(length)] for length in lengths]
+
+    async def create(self, model, messages, temperature, n, max_tokens, stream=False):
+        samples = self._samples(n)
+        if not stream:
+            self.consumed['tokens'] += sum(len(tokens) for tokens in samples)
+            return types.SimpleNamespace(choices=[
+                types.SimpleNamespace(message=types.SimpleNamespace(content=''.join(tokens)))
+                for tokens in samples
+            ])
+        chunks = []
+        for step in range(max(len(tokens) for tokens in samples)):
+            chunks.append(types.SimpleNamespace(choices=[
+                types.SimpleNamespace(index=i, delta=types.SimpleNamespace(content=tokens[step]),
+                                      finish_reason='stop' if step == len(tokens) - 1 else None)
+                for i, tokens in enumerate(samples) if step < len(tokens)
+            ]))
+        self.streams.append(FakeStream(chunks, self.consumed))
+        return self.streams[-1]
+
+
+def _client(**kwargs):
+    return types.SimpleNamespace(chat=types.SimpleNamespace(completions=FakeCompletions(**kwargs)))
+
+
+def _predict(client, **kwargs):
+    return get_llmtime_predictions_many(["prompt"], num_samples=4, num_predictions=HORIZON,
+                                        client=client, max_retries=0, **kwargs)[0]
+
+
+def test_stream_closes_once_every_sample_is_complete():
+    streamed, full = _client(), _client()
+    samples = _predict(streamed, stream=True)
+    _predict(full)
+
+    stream = streamed.chat.completions.streams[0]
+    assert stream.closed
+    assert streamed.chat.completions.consumed['tokens'] < full.chat.completions.consumed['tokens']
+    # The long samples are read up to the horizon; the short one is dropped
+    assert samples.shape == (3, HORIZON)
+    np.testing.assert_allclose(samples[0], [0.1 + i / 1000 for i in range(HORIZON)])
+
+
+def test_over_long_samples_are_dropped_without_streaming():
+    contents = ["0.1, " * HORIZON, "0.2, " * (HORIZON + 1)]
+    assert _parse_predictions(contents, HORIZON) == [[0.1] * HORIZON]
+    assert len(_parse_predictions(contents, HORIZON, truncate=True)) == 2
+
+
+@pytest.mark.parametrize('fraction, kept', [(0.5, 4), (0.7, 3)])
+def test_min_sample_fraction(fraction, kept):
+    samples = _predict(_client(), stream=True, short_samples='pad', min_sample_fraction=fraction)
+    assert samples.shape == (kept, HORIZON)
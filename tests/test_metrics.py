@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from startup_ecosystem_forecasting.utils.metrics import (
+    calculate_metrics,
+    calculate_metrics_batch,
+    compare_models,
+    rank_models,
+)
+
+
+@pytest.fixture
+def forecasts():
+    rng = np.random.default_rng(1)
+    actuals = rng.normal(10, 2, (5, 12))
+    predictions = actuals[:, None, :] + rng.normal(0, 1, (5, 3, 12))
+    return actuals, predictions
+
+
+def test_batch_matches_scalar_metrics(forecasts):
+    actuals, predictions = forecasts
+    batch = calculate_metrics_batch(actuals, predictions)
+    for s in range(actuals.shape[0]):
+        for m in range(predictions.shape[1]):
+            scalar = calculate_metrics(actuals[s], predictions[s, m])
+            for metric in ('MAE', 'RMSE', 'R2'):
+                assert batch[metric][s, m] == pytest.approx(scalar[metric], rel=1e-12)
+
+
+def test_nans_are_masked_pairwise(forecasts):
+    actuals, predictions = forecasts
+    predictions = predictions.copy()
+    predictions[0, 0, :3] = np.nan
+    batch = calculate_metrics_batch(actuals, predictions)
+    scalar = calculate_metrics(actuals[0, 3:], predictions[0, 0, 3:])
+    assert batch['RMSE'][0, 0] == pytest.approx(scalar['RMSE'])
+
+
+def test_mase_uses_training_scale(forecasts):
+    actuals, predictions = forecasts
+    train = np.cumsum(np.ones((5, 20)), axis=1)
+    batch = calculate_metrics_batch(actuals, predictions, train=train)
+    np.testing.assert_allclose(batch['MASE'], batch['MAE'])
+
+
+def test_rank_and_compare_models():
+    scores = np.array([[2.0, 1.0, 3.0]])
+    np.testing.assert_array_equal(rank_models(scores, 'RMSE'), [[2, 1, 3]])
+    np.testing.assert_array_equal(rank_models(scores, 'R2'), [[2, 3, 1]])
+    metrics = [{'Model': 'A', 'MAE': 1.0, 'RMSE': 2.0, 'R2': 0.5},
+               {'Model': 'B', 'MAE': 2.0, 'RMSE': 1.0, 'R2': 0.7}]
+    comparison = compare_models(metrics)
+    assert comparison['Best MAE'] == ('A', 1.0)
+    assert comparison['Best RMSE'] == ('B', 1.0)
+    assert comparison['Best R2'] == ('B', 0.7)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from startup_ecosystem_forecasting.models.holt_winters import BatchHoltWinters
+from startup_ecosystem_forecasting.models.online import OnlineForecaster
+
+
+def test_batch_holt_winters_state_round_trip(weekly_series):
+    values = weekly_series.values
+    model = BatchHoltWinters(4).fit(np.stack([values[:100], values[10:110]]))
+    restored = BatchHoltWinters().set_state(model.get_state())
+    np.testing.assert_allclose(restored.forecast(6), model.forecast(6))
+
+    model.update(np.stack([values[100:104], values[110:114]]))
+    restored.update(np.stack([values[100:104], values[110:114]]))
+    np.testing.assert_allclose(restored.forecast(6), model.forecast(6))
+
+
+@pytest.mark.parametrize('family', ['ARIMA', 'Holt-Winters'])
+def test_save_load_resumes_without_refitting(tmp_path, weekly_series, family):
+    values = weekly_series.values
+    forecaster = OnlineForecaster(family, order=(1, 1, 0)).fit(values[:100])
+    forecaster.update(values[100:110])
+    path = tmp_path / 'online.json'
+    forecaster.save(path)
+
+    restored = OnlineForecaster.load(path)
+    mean, (lower, upper) = restored.forecast(4)
+    expected_mean, (expected_lower, expected_upper) = forecaster.forecast(4)
+    np.testing.assert_allclose(mean, expected_mean, rtol=1e-6)
+    np.testing.assert_allclose(lower, expected_lower, rtol=1e-6)
+    np.testing.assert_allclose(upper, expected_upper, rtol=1e-6)
+    assert restored.n_refits == 0
+
+
+def test_synchronous_refit_is_applied_immediately(weekly_series):
+    values = weekly_series.values
+    forecaster = OnlineForecaster('ARIMA', order=(1, 1, 0), refit_every=5).fit(values[:100])
+    forecaster.update(values[100:105])
+    assert forecaster.n_refits == 1
+
+
+def test_failed_background_refit_is_raised(weekly_series):
+    values = weekly_series.values
+    forecaster = OnlineForecaster('ARIMA', order=(1, 1, 0), refit_every=5,
+                                  background=True).fit(values[:100])
+
+    def broken(values, start_params=None):
+        raise np.linalg.LinAlgError("singular matrix")
+
+    forecaster._estimate = broken
+    forecaster.update(values[100:105])
+    with pytest.raises(RuntimeError, match="Background re-estimation failed"):
+        forecaster.wait()
+    # Reported once; the forecaster keeps working with the old parameters
+    forecaster.forecast(2)
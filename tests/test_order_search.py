@@ -0,0 +1,43 @@
+from startup_ecosystem_forecasting.models.arima import find_best_arima_params
+from startup_ecosystem_forecasting.models.sarima import find_best_sarima_params
+
+
+def test_parallel_arima_search_matches_serial(weekly_series):
+    serial, serial_table = find_best_arima_params(weekly_series, max_p=1, max_d=1, max_q=1,
+                                                  return_table=True)
+    parallel, parallel_table = find_best_arima_params(weekly_series, max_p=1, max_d=1, max_q=1,
+                                                      n_jobs=2, return_table=True)
+    assert parallel == serial
+    assert parallel_table.equals(serial_table)
+
+
+def test_parallel_stepwise_sarima_search_matches_serial(weekly_series):
+    kwargs = dict(seasonal_period=4, method='stepwise', max_fits=8, return_table=True)
+    serial = find_best_sarima_params(weekly_series, **kwargs)
+    parallel = find_best_sarima_params(weekly_series, n_jobs=2, **kwargs)
+    assert parallel[:2] == serial[:2]
+    assert parallel[2].equals(serial[2])
+
+
+def test_stepwise_search_reuses_one_pool(weekly_series, monkeypatch):
+    from startup_ecosystem_forecasting.models import order_search
+
+    pools = []
+
+    class CountingPool(order_search.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    monkeypatch.setattr(order_search, 'ProcessPoolExecutor', CountingPool)
+    _, records = order_search.stepwise_search(
+        _fit_constant, weekly_series, initial=[0, 1], neighbours=lambda c: [c + 1, c + 2],
+        max_fits=6, n_jobs=2,
+    )
+    assert len(records) == 6
+    assert len(pools) == 1
+
+
+def _fit_constant(series, candidate):
+    # Lower AIC for larger candidates, so the search keeps moving
+    return {'order': candidate, 'aic': float(len(series) - candidate), 'error': None}
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from startup_ecosystem_forecasting.preprocessing.pipeline import (
+    Difference, Interpolate, MinMaxScale, Pipeline, default_pipeline,
+)
+
+
+def _future_on_transformed_scale(pipeline, data, n):
+    """What a perfect forecaster of ``data[n:]`` would return on the transformed scale."""
+    return pipeline.transform(data)[n:]
+
+
+@pytest.mark.parametrize('order', [0, 1, 2])
+def test_inverse_forecast_round_trip_series(weekly_series, order):
+    n = 100
+    pipeline = Pipeline([Interpolate(), Difference(order), MinMaxScale()])
+    pipeline.fit(weekly_series[:n])
+    forecast = _future_on_transformed_scale(pipeline, weekly_series, n)
+    restored = pipeline.inverse_forecast(forecast)
+    np.testing.assert_allclose(restored.values, weekly_series.values[n:])
+    pd.testing.assert_index_equal(restored.index, weekly_series.index[n:])
+
+
+def test_inverse_forecast_round_trip_panel(weekly_series):
+    n = 100
+    panel = pd.DataFrame({'a': weekly_series, 'b': 2 * weekly_series[::-1].values + 5,
+                          'c': np.linspace(1, 50, len(weekly_series))},
+                         index=weekly_series.index)
+    pipeline = default_pipeline(k=3.0)
+    transformed = pipeline.fit_transform(panel[:n])
+    assert transformed.shape == (n, 3)
+    forecast = _future_on_transformed_scale(pipeline, panel, n).values
+    restored = pipeline.inverse_forecast(forecast)
+    np.testing.assert_allclose(restored, panel.values[n:])
+
+
+def test_fit_transform_does_not_modify_input(weekly_series):
+    original = weekly_series.copy()
+    default_pipeline().fit_transform(weekly_series)
+    pd.testing.assert_series_equal(weekly_series, original)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from startup_ecosystem_forecasting.models.registry import ModelRegistry, _es_params
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = ModelRegistry(str(tmp_path / 'models.sqlite'))
+    yield registry
+    registry.close()
+
+
+def test_put_get_round_trip(registry):
+    key = ModelRegistry.make_key(np.arange(5.0), {'family': 'ARIMA'})
+    registry.put(key, {'order': [1, 1, 0]}, [0.25, -1.5, 3.0])
+    spec, params = registry.get(key)
+    assert spec == {'order': [1, 1, 0]}
+    np.testing.assert_array_equal(params, [0.25, -1.5, 3.0])
+    assert registry.get(ModelRegistry.make_key(np.arange(5.0), {'family': 'SARIMA'})) is None
+
+
+def test_preprocessing_is_part_of_the_key():
+    series = np.arange(5.0)
+    assert (ModelRegistry.make_key(series, {'family': 'ARIMA'}, {'scale': True})
+            != ModelRegistry.make_key(series, {'family': 'ARIMA'}, {'scale': False}))
+
+
+@pytest.mark.parametrize('family, kwargs', [
+    ('ARIMA', {'order': (1, 1, 0)}),
+    ('SARIMA', {'order': (1, 1, 0), 'seasonal_order': (1, 0, 0, 4)}),
+    ('Exponential Smoothing', {'seasonal_period': 4}),
+])
+def test_fit_model_restores_fitted_params(registry, weekly_series, family, kwargs):
+    train = weekly_series.values[:100]
+    fitted = registry.fit_model(family, train, **kwargs)
+    # A fresh registry on the same file reloads the parameters lazily
+    reopened = ModelRegistry(registry.path)
+    restored = reopened.fit_model(family, train, **kwargs)
+    assert reopened.stats()['hits'] == 1
+    params = _es_params if family == 'Exponential Smoothing' else (lambda fit: fit.params)
+    np.testing.assert_allclose(params(restored), params(fitted), rtol=1e-8)
+    np.testing.assert_allclose(restored.forecast(4), fitted.forecast(4), rtol=1e-6)
+    reopened.close()
+
+
+def test_find_orders_reuses_the_search(registry, weekly_series, monkeypatch):
+    from startup_ecosystem_forecasting.models import registry as registry_module
+
+    train = weekly_series.values[:100]
+    order = registry.find_orders('ARIMA', train, max_p=1, max_d=1, max_q=1, n_jobs=1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("order search should not run again")
+
+    monkeypatch.setattr(registry_module, 'find_best_arima_params', fail)
+    assert registry.find_orders('ARIMA', train, max_p=1, max_d=1, max_q=1, n_jobs=2) == order
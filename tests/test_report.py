@@ -0,0 +1,56 @@
+import os
+import re
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import pandas as pd
+import pytest
+
+from startup_ecosystem_forecasting.visualization.plotter import plot_quarterly_growth
+from startup_ecosystem_forecasting.visualization.report import PlotReport
+
+
+@pytest.fixture
+def split(weekly_series):
+    return weekly_series[:100], weekly_series[100:]
+
+
+def _submit_predictions(report, train, test, n):
+    for i in range(n):
+        report.submit('predictions', train, test, test.values + i, f"model {i}", 'blue', name=f"model_{i}")
+
+
+def test_pdf_report_has_one_page_per_plot(split, tmp_path):
+    path = str(tmp_path / 'report.pdf')
+    with PlotReport(path) as report:
+        _submit_predictions(report, *split, 3)
+        report.submit('quarterly_growth', pd.Series([0.1, -0.2, 0.3], index=['Q1', 'Q2', 'Q3']))
+    with open(path, 'rb') as fh:
+        assert len(re.findall(rb'/Type\s*/Page\b', fh.read())) == 4
+
+
+def test_directory_report_writes_one_file_per_plot(split, tmp_path):
+    with PlotReport(str(tmp_path / 'plots'), workers=2, max_pending=2) as report:
+        _submit_predictions(report, *split, 5)
+    assert sorted(os.listdir(tmp_path / 'plots')) == [f"model_{i}.png" for i in range(5)]
+
+
+def test_plot_errors_are_raised_after_the_report_is_finished(split, tmp_path, capsys):
+    path = str(tmp_path / 'report.pdf')
+    with pytest.raises(ValueError):
+        with PlotReport(path) as report:
+            _submit_predictions(report, *split, 1)
+            report.submit('predictions', *split, [1.0, 2.0], 'broken', 'red')
+            report.submit('predictions', *split, [1.0], 'broken too', 'red')
+            _submit_predictions(report, *split, 1)
+    assert "Error rendering plot" in capsys.readouterr().out
+    with open(path, 'rb') as fh:
+        assert len(re.findall(rb'/Type\s*/Page\b', fh.read())) == 2
+
+
+def test_render_saves_to_path(tmp_path):
+    path = tmp_path / 'growth.png'
+    plot_quarterly_growth(pd.Series([0.1, 0.2], index=['Q1', 'Q2']), path=str(path))
+    assert path.read_bytes().startswith(b'\x89PNG')
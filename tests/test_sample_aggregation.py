@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from startup_ecosystem_forecasting.models.sample_aggregation import (
+    ConformalCalibrator, aggregate_samples, conformal_quantile,
+)
+
+
+@pytest.mark.parametrize('num_samples', [5, 10, 21])
+def test_aggregates_match_numpy_and_scipy(num_samples):
+    samples = np.random.default_rng(num_samples).normal(size=(3, num_samples, 6))
+    median, trimmed, mean = np.moveaxis(aggregate_samples(samples, trim=0.1), -2, 0)
+    np.testing.assert_allclose(median, np.median(samples, axis=-2))
+    np.testing.assert_allclose(trimmed, stats.trim_mean(samples, 0.1, axis=-2))
+    np.testing.assert_allclose(mean, samples.mean(axis=-2))
+
+
+def test_conformal_quantile_by_hand():
+    scores = np.arange(1.0, 11.0)[:, None]
+    # n = 10, alpha = 0.2: ceil(11 * 0.8) = 9, so the 9th smallest score
+    assert conformal_quantile(scores, 0.2)[0] == 9.0
+    # ceil(11 * 0.95) = 11 > 10 scores: no finite quantile gives the coverage
+    assert np.isinf(conformal_quantile(scores, 0.05)[0])
+
+
+def test_intervals_cover_close_to_one_minus_alpha():
+    rng = np.random.default_rng(0)
+    horizon, alpha = 4, 0.1
+    point = np.zeros((2000, horizon))
+    actuals = rng.normal(scale=np.arange(1, horizon + 1), size=point.shape)
+    calibrator = ConformalCalibrator(alpha).fit(actuals[:1000], point=point[:1000])
+    lower, upper = calibrator.interval(point[1000:])
+    covered = ((actuals[1000:] >= lower) & (actuals[1000:] <= upper)).mean(axis=0)
+    np.testing.assert_allclose(covered, 1 - alpha, atol=0.03)
+
+
+def test_longer_forecasts_reuse_the_last_correction():
+    rng = np.random.default_rng(1)
+    actuals = rng.normal(size=(50, 12))
+    calibrator = ConformalCalibrator(0.2).fit(actuals, point=np.zeros_like(actuals))
+    lower, upper = calibrator.interval(np.zeros(24))
+    np.testing.assert_allclose(upper[:12], calibrator.correction_)
+    np.testing.assert_allclose(upper[12:], calibrator.correction_[-1])
+    np.testing.assert_allclose(lower, -upper)
+
+    band = ConformalCalibrator(0.2).fit(actuals, lower=-np.ones_like(actuals), upper=np.ones_like(actuals))
+    lower, upper = band.interval(lower=-np.ones((2, 24)), upper=np.ones((2, 24)))
+    assert lower.shape == upper.shape == (2, 24)
+    np.testing.assert_allclose(upper[:, 12:], 1 + band.correction_[-1])
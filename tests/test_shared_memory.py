@@ -0,0 +1,99 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from multiprocessing import shared_memory
+
+from startup_ecosystem_forecasting.evaluation.backtest import run_backtest
+from startup_ecosystem_forecasting.utils import instrumentation
+from startup_ecosystem_forecasting.utils.shared_memory import SharedArray, SharedPanel
+
+
+def _exists(shared):
+    if shared.backend == 'memmap':
+        return os.path.exists(shared.name)
+    try:
+        segment = shared_memory.SharedMemory(name=shared.name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+def _fill_row(shared, i):
+    shared.array[i] = i
+    return float(shared.array[i].sum())
+
+
+@pytest.mark.parametrize('backend', ['shm', 'memmap'])
+def test_shared_array_is_written_by_workers_and_released(backend):
+    with SharedArray((3, 4), backend=backend, fill=-1.0) as shared:
+        assert _exists(shared)
+        assert len(pickle.dumps(shared)) < 500
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            sums = list(pool.map(_fill_row, [shared] * 3, range(3)))
+        assert sums == [0.0, 4.0, 8.0]
+        np.testing.assert_array_equal(shared.array, np.repeat(np.arange(3.0), 4).reshape(3, 4))
+    assert not _exists(shared)
+    assert shared.array is None
+
+
+@pytest.mark.parametrize('backend', ['shm', 'memmap'])
+def test_shared_array_is_released_on_error(backend):
+    with pytest.raises(RuntimeError):
+        with SharedArray.from_array(np.arange(5.0), backend=backend) as shared:
+            raise RuntimeError("task failed")
+    assert not _exists(shared)
+
+
+def _sum_all(arrays):
+    # Attaching more arrays than the cache holds evicts the first ones
+    return [float(shared.array.sum()) for shared in arrays]
+
+
+def test_evicted_attachments_stay_readable():
+    arrays = [SharedArray.from_array(np.full(1000, float(i)), backend='shm') for i in range(12)]
+    try:
+        # A crash here (reading unmapped memory) breaks the pool instead of pytest
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            sums = pool.submit(_sum_all, arrays).result()
+        assert sums == [1000.0 * i for i in range(12)]
+    finally:
+        for shared in arrays:
+            shared.unlink()
+
+
+def test_shared_panel_rebuilds_series_and_releases(weekly_series):
+    panel = pd.DataFrame({'a': weekly_series, 'b': -weekly_series}).tz_localize('UTC')
+    with SharedPanel(panel) as shared:
+        restored = pickle.loads(pickle.dumps(shared)).series(1)
+        pd.testing.assert_series_equal(restored, panel['b'])
+        arrays = [shared.values, shared.timestamps]
+    assert not any(_exists(array) for array in arrays)
+
+
+def _counting_forecast(train, horizon):
+    instrumentation.count('test_forecasts')
+    return np.repeat(train[-1], horizon)
+
+
+def _short_forecast(train, horizon):
+    return _counting_forecast(train, horizon - 1)
+
+
+def test_parallel_backtest_matches_serial_and_keeps_worker_counts(weekly_series):
+    models = {'naive': _counting_forecast, 'broken': _short_forecast}
+    tracer = instrumentation.enable()
+    try:
+        serial = run_backtest(weekly_series, models, horizon=3, n_origins=5)
+        serial_count = tracer.counters['test_forecasts']
+        parallel = run_backtest(weekly_series, models, horizon=3, n_origins=5, n_jobs=2)
+        parallel_count = tracer.counters['test_forecasts'] - serial_count
+    finally:
+        instrumentation.disable()
+    np.testing.assert_array_equal(parallel.predictions, serial.predictions)
+    assert parallel.errors == serial.errors and len(serial.errors) == 5
+    assert serial_count == parallel_count == 10
@@ -0,0 +1,35 @@
+import numpy as np
+from statsmodels.tsa.arima.model import ARIMA
+
+from startup_ecosystem_forecasting.models.arima import evaluate_arima_model
+from startup_ecosystem_forecasting.models.walk_forward import (
+    compare_walk_forward,
+    walk_forward_forecast,
+)
+
+
+def _build(history):
+    return ARIMA(history, order=(1, 1, 0))
+
+
+def test_update_stays_close_to_refit(weekly_series):
+    train, test = weekly_series[:100], weekly_series[100:]
+    comparison = compare_walk_forward(_build, train, test)
+    assert comparison['update']['n_fits'] == 1
+    assert comparison['refit']['n_fits'] == len(test)
+    assert comparison['update']['rmse'] <= 1.1 * comparison['refit']['rmse']
+    assert comparison['max_abs_diff'] < 0.05 * np.std(weekly_series)
+
+
+def test_refit_every_counts_fits(weekly_series):
+    train, test = weekly_series[:100], weekly_series[100:]
+    preds, n_fits = walk_forward_forecast(_build, train, test, method='update', refit_every=5)
+    assert len(preds) == len(test)
+    assert n_fits == 1 + len(test) // 5
+
+
+def test_evaluate_arima_update_matches_refit(weekly_series):
+    refit, actual = evaluate_arima_model(weekly_series, (1, 1, 0), method='refit')
+    update, _ = evaluate_arima_model(weekly_series, (1, 1, 0), method='update')
+    assert len(update) == len(actual)
+    np.testing.assert_allclose(update, refit, atol=0.05 * np.std(weekly_series))
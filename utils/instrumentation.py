@@ -0,0 +1,234 @@
+import contextlib
+import contextvars
+import cProfile
+import functools
+import inspect
+import io
+import itertools
+import json
+import os
+import pstats
+import threading
+import time
+from collections import defaultdict
+
+import pandas as pd
+
+_current_span = contextvars.ContextVar('current_span', default=None)
+_profiling = threading.local()
+
+
+class _Span:
+    """One timed region; created by ``Tracer.span`` and recorded on exit."""
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.profiler = None
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.record = {
+            'id': next(self.tracer._ids),
+            'name': self.name,
+            'parent': parent['id'] if parent else None,
+            'depth': parent['depth'] + 1 if parent else 0,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'attrs': self.attrs,
+        }
+        self._token = _current_span.set(self.record)
+        if self.tracer._should_profile(self.name):
+            self.profiler = self.tracer._profilers.setdefault(self.name, cProfile.Profile())
+            _profiling.active = True
+            self.profiler.enable()
+        self._start = time.perf_counter_ns()
+        return self.record
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.disable()
+            _profiling.active = False
+        _current_span.reset(self._token)
+        self.record['start_us'] = (self._start - self.tracer._origin) / 1000
+        self.record['duration_us'] = (end - self._start) / 1000
+        if exc_type is not None:
+            self.record['error'] = f"{exc_type.__name__}: {exc}"
+        with self.tracer._lock:
+            self.tracer.spans.append(self.record)
+        return False
+
+
+class Tracer:
+    """Collects nested timing spans, counters and optional per-stage profiles.
+
+    Disabled tracers make ``span`` a shared no-op context and ``count`` a
+    single attribute check, so instrumented code costs next to nothing
+    unless tracing is switched on. Spans nest per thread and per asyncio
+    task. ``profile`` names the stages (span names) to run under cProfile, or
+    is True for every outermost span; nested profiling is skipped. Spans
+    opened in worker processes are not collected; their counts are, where
+    the work goes through ``call_counted`` and ``merge_counted``.
+    """
+
+    def __init__(self, enabled=False, profile=()):
+        self.enabled = enabled
+        self.profile = profile if profile is True else set(profile)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop every recorded span, counter and profile."""
+        with self._lock:
+            self.spans = []
+            self.counters = defaultdict(int)
+            self._profilers = {}
+            self._ids = itertools.count()
+            self._origin = time.perf_counter_ns()
+
+    def _should_profile(self, name):
+        if getattr(_profiling, 'active', False):
+            return False
+        if self.profile is True:
+            return _current_span.get() is None
+        return name in self.profile
+
+    def span(self, name, **attrs):
+        """Context manager timing the enclosed block as a child of the current span."""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return _Span(self, name, attrs)
+
+    def timed(self, name=None):
+        """Decorator timing every call of a (sync or async) function as a span."""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(span_name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name, value=1):
+        """Add ``value`` to a named counter."""
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += value
+
+    def profile_report(self, name, limit=20, sort='cumulative'):
+        """pstats text for a profiled stage, or None if it was not profiled."""
+        profiler = self._profilers.get(name)
+        if profiler is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def summary(self):
+        """Call count and total/mean/max seconds per span name, slowest total first."""
+        columns = ['span', 'calls', 'total_s', 'mean_s', 'max_s']
+        if not self.spans:
+            return pd.DataFrame(columns=columns)
+        frame = pd.DataFrame([(s['name'], s['duration_us'] / 1e6) for s in self.spans],
+                             columns=['span', 'seconds'])
+        table = frame.groupby('span')['seconds'].agg(['count', 'sum', 'mean', 'max'])
+        table = table.reset_index()
+        table.columns = columns
+        return table.sort_values('total_s', ascending=False, ignore_index=True)
+
+    def to_dict(self):
+        """Spans (with parent ids), counters and profile reports as plain data."""
+        return {
+            'spans': sorted(self.spans, key=lambda s: s['start_us']),
+            'counters': dict(self.counters),
+            'profiles': {name: self.profile_report(name) for name in self._profilers},
+        }
+
+    def to_chrome_trace(self):
+        """Events in the Chrome trace format (chrome://tracing, Perfetto)."""
+        events = [{
+            'name': s['name'], 'ph': 'X', 'ts': s['start_us'], 'dur': s['duration_us'],
+            'pid': s['pid'], 'tid': s['tid'],
+            'args': {key: str(value) for key, value in s['attrs'].items()},
+        } for s in sorted(self.spans, key=lambda s: s['start_us'])]
+        end = max((s['start_us'] + s['duration_us'] for s in self.spans), default=0)
+        events += [{'name': name, 'ph': 'C', 'ts': end, 'pid': os.getpid(),
+                    'args': {name: value}} for name, value in self.counters.items()]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save_json(self, path):
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.to_dict(), fh, indent=2, default=str)
+
+    def save_chrome_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(self.to_chrome_trace(), fh)
+
+
+TRACER = Tracer()
+
+
+def span(name, **attrs):
+    """``TRACER.span``: time a block as a nested span of the package-wide tracer."""
+    return TRACER.span(name, **attrs)
+
+
+def timed(name=None):
+    """``TRACER.timed``: decorator recording each call as a span."""
+    return TRACER.timed(name)
+
+
+def count(name, value=1):
+    """``TRACER.count``: increment a package-wide counter."""
+    TRACER.count(name, value)
+
+
+def call_counted(enabled, func, *args):
+    """Worker-process side of a counted task: ``(func(*args), counts made by the call)``.
+
+    A worker's tracer is not the parent's, so counts made in it would be
+    lost. Counting follows ``enabled`` (pass the parent's ``TRACER.enabled``)
+    and the counts come back with the result for ``merge_counted``.
+    """
+    previous = TRACER.enabled, TRACER.counters, TRACER.spans
+    TRACER.enabled, TRACER.counters, TRACER.spans = enabled, defaultdict(int), []
+    try:
+        return func(*args), dict(TRACER.counters)
+    finally:
+        TRACER.enabled, TRACER.counters, TRACER.spans = previous
+
+
+def merge_counted(outcomes):
+    """Add the counts of ``call_counted`` outcomes to the package-wide counters.
+
+    Returns the results, in order.
+    """
+    results = []
+    for result, counts in outcomes:
+        for name, value in counts.items():
+            TRACER.count(name, value)
+        results.append(result)
+    return results
+
+
+def enable(profile=()):
+    """Start recording on the package-wide tracer, clearing earlier results."""
+    TRACER.reset()
+    TRACER.profile = profile if profile is True else set(profile)
+    TRACER.enabled = True
+    return TRACER
+
+
+def disable():
+    TRACER.enabled = False
@@ -1,9 +1,9 @@
-
 import numpy as np
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
 def calculate_metrics(true_values, predictions):
     """Calculate performance metrics."""
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
     mae = mean_absolute_error(true_values, predictions)
     rmse = np.sqrt(mean_squared_error(true_values, predictions))
     r2 = r2_score(true_values, predictions)
@@ -13,30 +13,100 @@ def calculate_metrics(true_values, predictions):
         'R2': r2
     }
 
+HIGHER_IS_BETTER = {'R2'}
+
+def _align_true(true_values, predictions):
+    """Insert model axes so ``true_values`` broadcasts against ``predictions``.
+
+    A (series, horizon) array of actuals becomes (series, 1, horizon) against
+    (series, models, horizon) predictions.
+    """
+    missing = predictions.ndim - true_values.ndim
+    if missing > 0:
+        true_values = true_values.reshape(true_values.shape[:-1] + (1,) * missing
+                                          + true_values.shape[-1:])
+    return true_values
+
+def naive_scale(train, seasonality=1):
+    """Mean absolute seasonal-naive in-sample error along the last axis (MASE denominator)."""
+    train = np.asarray(train, dtype=float)
+    diffs = np.abs(train[..., seasonality:] - train[..., :-seasonality])
+    with np.errstate(invalid='ignore'):
+        return np.nanmean(diffs, axis=-1)
+
+def calculate_metrics_batch(true_values, predictions, train=None, seasonality=1):
+    """Calculate metrics for stacked forecasts in a single vectorised pass.
+
+    ``predictions`` has the horizon on its last axis, e.g. (series, models,
+    horizon); ``true_values`` is broadcastable to it, e.g. (series, horizon).
+    NaNs in either array are masked out pairwise. MASE needs the in-sample
+    ``train`` values, shaped (series, time), and is NaN otherwise. Returns a
+    dict of arrays shaped like ``predictions`` without the horizon axis.
+    """
+    predictions = np.asarray(predictions, dtype=float)
+    true_values = _align_true(np.asarray(true_values, dtype=float), predictions)
+    true_values, predictions = np.broadcast_arrays(true_values, predictions)
+
+    valid = ~(np.isnan(true_values) | np.isnan(predictions))
+    n = valid.sum(axis=-1)
+    errors = np.where(valid, predictions - true_values, 0.0)
+    abs_errors = np.abs(errors)
+    actual = np.where(valid, true_values, 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mae = abs_errors.sum(axis=-1) / n
+        rmse = np.sqrt((errors ** 2).sum(axis=-1) / n)
+
+        mean_actual = actual.sum(axis=-1, keepdims=True) / n[..., None]
+        total = np.where(valid, (true_values - mean_actual) ** 2, 0.0).sum(axis=-1)
+        r2 = np.where(total > 0, 1 - (errors ** 2).sum(axis=-1) / total, np.nan)
+
+        nonzero = valid & (true_values != 0)
+        mape = 100 * np.where(nonzero, abs_errors / np.abs(true_values), 0.0).sum(axis=-1) \
+            / nonzero.sum(axis=-1)
+
+        denominator = np.abs(true_values) + np.abs(predictions)
+        sym_valid = valid & (denominator > 0)
+        smape = 100 * np.where(sym_valid, 2 * abs_errors / denominator, 0.0).sum(axis=-1) \
+            / sym_valid.sum(axis=-1)
+
+        if train is None:
+            mase = np.full(mae.shape, np.nan)
+        else:
+            scale = _align_true(naive_scale(train, seasonality)[..., None], predictions[..., :1])
+            mase = mae / scale[..., 0]
+
+    return {
+        'MAE': mae,
+        'RMSE': rmse,
+        'R2': r2,
+        'MAPE': mape,
+        'sMAPE': smape,
+        'MASE': mase,
+    }
+
+def _oriented(scores, metric):
+    """Scores arranged so that lower is better, with NaN treated as worst."""
+    scores = np.asarray(scores, dtype=float)
+    if metric in HIGHER_IS_BETTER:
+        scores = -scores
+    return np.where(np.isnan(scores), np.inf, scores)
+
+def best_model_indices(scores, metric, axis=-1):
+    """Index of the best model along ``axis``; the first one wins ties."""
+    return np.argmin(_oriented(scores, metric), axis=axis)
+
+def rank_models(scores, metric, axis=-1):
+    """Rank models along ``axis`` (1 = best); ties keep their input order."""
+    order = np.argsort(_oriented(scores, metric), axis=axis, kind='stable')
+    return np.argsort(order, axis=axis, kind='stable') + 1
+
 def compare_models(metrics_list):
     """Compare multiple models based on their metrics."""
-    best_mae = float('inf')
-    best_rmse = float('inf')
-    best_r2 = -float('inf')
-    best_mae_model = None
-    best_rmse_model = None
-    best_r2_model = None
-    
-    for metrics in metrics_list:
-        if metrics['MAE'] < best_mae:
-            best_mae = metrics['MAE']
-            best_mae_model = metrics['Model']
-            
-        if metrics['RMSE'] < best_rmse:
-            best_rmse = metrics['RMSE']
-            best_rmse_model = metrics['Model']
-            
-        if metrics['R2'] > best_r2:
-            best_r2 = metrics['R2']
-            best_r2_model = metrics['Model']
-    
-    return {
-        'Best MAE': (best_mae_model, best_mae),
-        'Best RMSE': (best_rmse_model, best_rmse),
-        'Best R2': (best_r2_model, best_r2)
-    } 
\ No newline at end of file
+    models = [metrics['Model'] for metrics in metrics_list]
+    comparison = {}
+    for metric in ['MAE', 'RMSE', 'R2']:
+        scores = np.array([metrics[metric] for metrics in metrics_list], dtype=float)
+        best = best_model_indices(scores, metric)
+        comparison[f'Best {metric}'] = (models[best], float(scores[best]))
+    return comparison
@@ -0,0 +1,199 @@
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+BACKENDS = ('shm', 'memmap')
+
+# Segments attached in this (worker) process, by name, so that the many tasks
+# of one pool map reuse a mapping instead of reopening it per task
+_attached = OrderedDict()
+_MAX_ATTACHED = 8
+
+
+class SharedArray:
+    """A NumPy array in shared memory that pickles as a small handle.
+
+    ``backend='shm'`` places the data in a ``multiprocessing.shared_memory``
+    segment; ``'memmap'`` in a temporary ``.npy`` file mapped with
+    ``np.load(mmap_mode=...)``. Passing a SharedArray to a worker process
+    sends only its name, shape and dtype; the worker's ``array`` is a
+    zero-copy view of the same memory, so workers can also write results
+    into a preallocated SharedArray. The creating process owns the data and
+    releases it with ``unlink()`` (or by using the array as a context
+    manager); views must not be used afterwards.
+    """
+
+    def __init__(self, shape, dtype=np.float64, backend='shm', fill=None):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown shared memory backend: {backend}. Choose from {BACKENDS}")
+        self.shape = tuple(int(n) for n in np.atleast_1d(shape))
+        self.dtype = np.dtype(dtype)
+        self.backend = backend
+        self._owner = True
+        nbytes = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+        if backend == 'shm':
+            self._segment = shared_memory.SharedMemory(create=True, size=nbytes)
+            self.name = self._segment.name
+            self.array = np.ndarray(self.shape, self.dtype, buffer=self._segment.buf)
+        else:
+            self.name = os.path.join(tempfile.gettempdir(), f"sef_{uuid.uuid4().hex}.npy")
+            self._segment = None
+            self.array = np.lib.format.open_memmap(self.name, mode='w+', dtype=self.dtype,
+                                                   shape=self.shape)
+        if fill is not None:
+            self.array.fill(fill)
+
+    @classmethod
+    def from_array(cls, values, backend=None):
+        """Copy ``values`` into a new SharedArray (the one copy it ever needs).
+
+        ``backend=None`` uses shared memory and falls back to a memory-mapped
+        file where shared memory is unavailable or too small.
+        """
+        values = np.asarray(values)
+        if backend is None:
+            try:
+                shared = cls(values.shape, values.dtype, backend='shm')
+            except OSError:
+                shared = cls(values.shape, values.dtype, backend='memmap')
+        else:
+            shared = cls(values.shape, values.dtype, backend=backend)
+        shared.array[...] = values
+        return shared
+
+    def __getstate__(self):
+        return {'name': self.name, 'shape': self.shape, 'dtype': self.dtype.str,
+                'backend': self.backend}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.dtype = np.dtype(self.dtype)
+        self._owner = False
+        self._segment = None
+        self.array = _attach(self.name, self.shape, self.dtype, self.backend)
+
+    def unlink(self):
+        """Release the data (owner only; a no-op in processes that attached to it)."""
+        if not self._owner:
+            return
+        self._owner = False
+        self.array = None
+        if self.backend == 'shm':
+            self._segment.close()
+            self._segment.unlink()
+        else:
+            try:
+                os.remove(self.name)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.unlink()
+        return False
+
+
+def _attach(name, shape, dtype, backend):
+    """Zero-copy view of an existing SharedArray's data in this process."""
+    key = (name, backend)
+    if key not in _attached:
+        if backend == 'shm':
+            _attached[key] = np.asarray(_SegmentView(name, shape, dtype))
+        else:
+            _attached[key] = np.load(name, mmap_mode='r+')
+        # Every view keeps its mapping alive through its base (the segment
+        # view or np.memmap's mmap), so evicting only forgets the entry
+        while len(_attached) > _MAX_ATTACHED:
+            _attached.popitem(last=False)
+    _attached.move_to_end(key)
+    return _attached[key]
+
+
+class _SegmentView:
+    """Array interface over an attached shared memory segment.
+
+    Arrays made from it keep it (and with it the segment) as their base, so
+    the segment is only closed, and unmapped, once no view of it is left.
+    """
+
+    def __init__(self, name, shape, dtype):
+        self.segment = shared_memory.SharedMemory(name=name)
+        self.__array_interface__ = dict(
+            np.ndarray(shape, dtype, buffer=self.segment.buf).__array_interface__)
+
+
+class SharedPanel:
+    """Values and index of a series or wide panel, shared with worker processes.
+
+    The (time x series) float64 values and, for a DatetimeIndex, its int64
+    timestamps live in ``SharedArray`` buffers; column names and the index
+    frequency travel with the (small) pickled handle. ``series(j)`` rebuilds
+    column ``j`` as a pandas Series backed by the shared buffer without
+    copying it.
+    """
+
+    def __init__(self, data, backend=None):
+        if not self.supports(data):
+            raise ValueError("SharedPanel needs numeric data with a DatetimeIndex or RangeIndex")
+        values = np.asarray(data, dtype=np.float64)
+        self.values = SharedArray.from_array(values.reshape(len(values), -1), backend=backend)
+        index = getattr(data, 'index', None)
+        self.columns = None
+        if isinstance(data, pd.DataFrame):
+            self.columns = list(data.columns)
+        elif isinstance(data, pd.Series):
+            self.columns = [data.name]
+        self.timestamps = None
+        self.range = (index.start, index.step) if isinstance(index, pd.RangeIndex) else (0, 1)
+        if isinstance(index, pd.DatetimeIndex):
+            # asi8 holds UTC instants in the index's own unit
+            self.timestamps = SharedArray.from_array(index.asi8, backend=self.values.backend)
+            self.unit = index.unit
+            self.freq = index.freqstr
+            self.tz = index.tz
+
+    @staticmethod
+    def supports(data):
+        """Whether ``data`` can be shared: numeric values with a DatetimeIndex, RangeIndex or none."""
+        index = getattr(data, 'index', None)
+        if index is not None and not isinstance(index, (pd.DatetimeIndex, pd.RangeIndex)):
+            return False
+        return np.asarray(data).dtype.kind in 'biuf'
+
+    def __len__(self):
+        return self.values.shape[1]
+
+    def index(self):
+        if self.timestamps is None:
+            start, step = self.range
+            return pd.RangeIndex(start, start + step * self.values.shape[0], step)
+        index = pd.DatetimeIndex(self.timestamps.array.view(f'M8[{self.unit}]'))
+        if self.tz is not None:
+            index = index.tz_localize('UTC').tz_convert(self.tz)
+        if self.freq is not None:
+            index = pd.DatetimeIndex(index, freq=self.freq)
+        return index
+
+    def series(self, j=0):
+        """Column ``j`` as a Series viewing the shared values."""
+        name = self.columns[j] if self.columns is not None else None
+        return pd.Series(self.values.array[:, j], index=self.index(), name=name, copy=False)
+
+    def unlink(self):
+        self.values.unlink()
+        if self.timestamps is not None:
+            self.timestamps.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.unlink()
+        return False
@@ -1,8 +1,13 @@
+import threading
 
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.figure import Figure
 from statsmodels.graphics.tsaplots import plot_acf, plot_pacf
 
+_figures = threading.local()
+
+
 def setup_plotting_style():
     """Set up enhanced visualization styles."""
     plt.style.use('seaborn-v0_8-whitegrid')
@@ -18,43 +23,126 @@ def setup_plotting_style():
     plt.rcParams['axes.spines.top'] = False
     plt.rcParams['axes.spines.right'] = False
 
-def plot_predictions(train, test, preds, model_name, color, uncertainty=None):
-    """Plot time series predictions."""
-    plt.figure(figsize=(12, 6))
-    plt.plot(train.index, train.values, label='Training Data', color='gray')
-    plt.plot(test.index, test.values, label='True Values', color='black')
-    plt.plot(test.index, preds, label=model_name, color=color)
-    
+
+def reusable_figure(figsize):
+    """This thread's cleared, resized scratch Figure for headless rendering.
+
+    The Figure is not registered with pyplot, so it is never shown, never
+    needs ``plt.close`` and is drawn with the Agg renderer whatever the
+    interactive backend; reusing it avoids allocating a figure per plot.
+    """
+    fig = getattr(_figures, 'figure', None)
+    if fig is None:
+        fig = _figures.figure = Figure()
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig
+
+
+def render(draw, figsize, *args, path=None, **kwargs):
+    """Draw a plot with ``draw(fig, *args, **kwargs)``, then save it to ``path`` or show it.
+
+    With ``path`` the plot is rendered headlessly into a reused Figure and
+    written out (the format follows the file extension); otherwise it is
+    shown with pyplot and closed once the window is dismissed.
+    """
+    if path is not None:
+        fig = reusable_figure(figsize)
+        draw(fig, *args, **kwargs)
+        fig.savefig(path)
+        fig.clear()
+        return
+    fig = plt.figure(figsize=figsize)
+    try:
+        draw(fig, *args, **kwargs)
+        plt.show()
+    finally:
+        plt.close(fig)
+
+
+def draw_predictions(fig, train, test, preds, model_name, color, uncertainty=None):
+    ax = fig.subplots()
+    ax.plot(train.index, train.values, label='Training Data', color='gray')
+    ax.plot(test.index, test.values, label='True Values', color='black')
+    if preds is not None:
+        ax.plot(test.index, preds, label=model_name, color=color)
+
     if uncertainty is not None:
         lower, upper = uncertainty
-        plt.fill_between(test.index, lower, upper, alpha=0.3, color=color, label='90% CI')
-    
-    plt.title(f'{model_name} Predictions')
-    plt.legend()
-    plt.grid(True)
-    plt.show()
-
-def plot_acf_pacf(series, lags=20):
-    """Plot ACF and PACF for ARIMA parameter selection."""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+        ax.fill_between(test.index, lower, upper, alpha=0.3, color=color, label='90% CI')
+
+    ax.set_title(f'{model_name} Predictions')
+    ax.legend()
+    ax.grid(True)
+
+
+def draw_acf_pacf(fig, series, lags=20):
+    ax1, ax2 = fig.subplots(2, 1)
     plot_acf(series, lags=lags, ax=ax1)
     plot_pacf(series, lags=lags, ax=ax2)
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
 
-def plot_metrics_comparison(metrics_df):
-    """Plot comparison of model metrics."""
-    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+
+def draw_metrics_comparison(fig, metrics_df):
+    axes = fig.subplots(1, 3)
     metrics_df.set_index('Model').plot(kind='bar', subplots=True, ax=axes, rot=45)
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+
 
-def plot_quarterly_growth(quarterly_growth):
+def draw_quarterly_growth(fig, quarterly_growth):
+    ax = fig.subplots()
+    quarterly_growth.plot(kind='bar', ax=ax)
+    ax.set_title('Quarterly Growth Rates')
+    ax.set_xlabel('Quarter')
+    ax.set_ylabel('Growth Rate (%)')
+    ax.grid(True)
+
+
+def draw_predictions_comparison(fig, train, test, predictions, colors=None):
+    ax = fig.subplots()
+    ax.plot(train.index, train.values, label='Training Data', color='gray')
+    ax.plot(test.index, test.values, label='True Values', color='black')
+    for name, preds in predictions.items():
+        ax.plot(test.index, preds, label=name, color=(colors or {}).get(name))
+    ax.set_title('Time Series Predictions Comparison')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Value')
+    ax.legend()
+    ax.grid(True)
+
+
+# name -> (draw function, figure size), as used by ``render`` and ``PlotReport``
+PLOTS = {
+    'predictions': (draw_predictions, (12, 6)),
+    'acf_pacf': (draw_acf_pacf, (12, 8)),
+    'metrics_comparison': (draw_metrics_comparison, (18, 6)),
+    'quarterly_growth': (draw_quarterly_growth, (12, 4)),
+    'predictions_comparison': (draw_predictions_comparison, (15, 8)),
+}
+
+
+def plot_predictions(train, test, preds, model_name, color, uncertainty=None, path=None):
+    """Plot time series predictions."""
+    render(draw_predictions, PLOTS['predictions'][1], train, test, preds, model_name, color,
+           uncertainty=uncertainty, path=path)
+
+
+def plot_acf_pacf(series, lags=20, path=None):
+    """Plot ACF and PACF for ARIMA parameter selection."""
+    render(draw_acf_pacf, PLOTS['acf_pacf'][1], series, lags=lags, path=path)
+
+
+def plot_metrics_comparison(metrics_df, path=None):
+    """Plot comparison of model metrics."""
+    render(draw_metrics_comparison, PLOTS['metrics_comparison'][1], metrics_df, path=path)
+
+
+def plot_quarterly_growth(quarterly_growth, path=None):
     """Plot quarterly growth rates."""
-    plt.figure(figsize=(12, 4))
-    quarterly_growth.plot(kind='bar')
-    plt.title('Quarterly Growth Rates')
-    plt.xlabel('Quarter')
-    plt.ylabel('Growth Rate (%)')
-    plt.grid(True)
-    plt.show() 
\ No newline at end of file
+    render(draw_quarterly_growth, PLOTS['quarterly_growth'][1], quarterly_growth, path=path)
+
+
+def plot_predictions_comparison(train, test, predictions, colors=None, path=None):
+    """Plot the forecasts of several models (``{name: preds}``) against the test data."""
+    render(draw_predictions_comparison, PLOTS['predictions_comparison'][1], train, test,
+           predictions, colors=colors, path=path)
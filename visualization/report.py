@@ -0,0 +1,105 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from matplotlib.backends.backend_pdf import PdfPages
+
+from .plotter import PLOTS, reusable_figure
+
+
+class PlotReport:
+    """Render plots headlessly in background threads, into files or one multi-page PDF.
+
+    ``output`` ending in ``.pdf`` collects every plot as a page of a single
+    report, in submission order (one writer thread); any other ``output`` is
+    a directory receiving one ``<name>.<fmt>`` file per plot, rendered by
+    ``workers`` threads. Each thread draws into one reused Figure off
+    pyplot, so nothing is shown and no figures accumulate. At most
+    ``max_pending`` plots are queued; ``submit`` blocks beyond that, so a
+    producer that outpaces rendering cannot hold on to unbounded data.
+
+    Use as a context manager, or call ``close()`` to wait for the queued
+    plots and finish the report. Data passed to ``submit`` must not be
+    modified until the plot has been rendered.
+    """
+
+    def __init__(self, output, workers=1, fmt='png', dpi=100, max_pending=32):
+        self.output = output
+        self.fmt = fmt
+        self.dpi = dpi
+        self._pdf = None
+        if output.lower().endswith('.pdf'):
+            self._pdf = PdfPages(output)
+            workers = 1
+        else:
+            os.makedirs(output, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='plot')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._futures = []
+        self._count = 0
+
+    def submit(self, kind, *args, name=None, **kwargs):
+        """Queue a plot from ``PLOTS`` (e.g. ``'predictions'``) with the plotting function's arguments.
+
+        ``name`` is the file name (without extension) in directory mode; it
+        defaults to a running number and the plot kind. Returns a Future.
+        """
+        if kind not in PLOTS:
+            raise ValueError(f"Unknown plot: {kind}. Choose from {sorted(PLOTS)}")
+        self._count += 1
+        name = name or f"{self._count:04d}_{kind}"
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(self._render, kind, name, args, kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures = [f for f in self._futures if not f.done() or f.exception()]
+        self._futures.append(future)
+        return future
+
+    def _render(self, kind, name, args, kwargs):
+        draw, figsize = PLOTS[kind]
+        fig = reusable_figure(figsize)
+        try:
+            draw(fig, *args, **kwargs)
+            if self._pdf is not None:
+                self._pdf.savefig(fig, dpi=self.dpi)
+                return self.output
+            path = os.path.join(self.output, f"{name}.{self.fmt}")
+            fig.savefig(path, dpi=self.dpi)
+            return path
+        finally:
+            fig.clear()
+
+    def close(self):
+        """Wait for every queued plot and finish the report.
+
+        The report is finished with the plots that did render; the first
+        plot error is then raised (and any further ones printed).
+        """
+        self._pool.shutdown(wait=True)
+        errors = [future.exception() for future in self._futures if future.exception() is not None]
+        self._futures = []
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        for error in errors[1:]:
+            print(f"Error rendering plot: {error}")
+        if errors:
+            raise errors[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+            return False
+        # Do not mask the error that ended the block with a plot error
+        try:
+            self.close()
+        except Exception as e:
+            print(f"Error rendering plot: {e}")
+        return False